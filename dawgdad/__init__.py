@@ -39,3 +39,7 @@ from .rgx import *
 from .automation import *
 from .taguchi import *
 from .process_capability import *
+from .monte_carlo import *
+from .monitor import *
+from .change_point import *
+from .power import *
@@ -0,0 +1,361 @@
+"""
+Change-point detection of shifts in the average or the variation of a process
+
+- PELT and binary segmentation with segment costs from prefix sums
+- Detection in many series in parallel
+- Control limits of the stages between change points
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dawgdad.control_charts import X
+import warnings
+import heapq
+
+import pandas as pd
+import numpy as np
+
+
+# PELT on a series longer than this with few change points takes minutes
+_PELT_WARNING_SIZE = 50_000
+
+
+def _prefix_sums(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Prefix sums of the centred values and of their squares.
+
+    Centring keeps the differences of the sums of squares accurate for long
+    series with a large average.
+    """
+    centred = values - values.mean()
+    s1 = np.concatenate(([0.0], np.cumsum(centred)))
+    s2 = np.concatenate(([0.0], np.cumsum(centred * centred)))
+    return (s1, s2)
+
+
+def _cost(
+    s1: np.ndarray,
+    s2: np.ndarray,
+    start: np.ndarray | int,
+    end: np.ndarray | int,
+    model: str,
+    scale: float
+) -> np.ndarray:
+    """
+    Cost of the segments [start, end), twice the negative normal
+    log-likelihood up to a constant.
+    """
+    n = end - start
+    sums = s1[end] - s1[start]
+    sse = np.maximum(s2[end] - s2[start] - sums * sums / n, 0)
+    if model == "mean":
+        return sse / scale
+    return n * np.log(np.maximum(sse / n, scale * 1e-12))
+
+
+def _scale(values: np.ndarray) -> float:
+    """
+    Variance estimate that is robust to shifts, from successive differences.
+    """
+    differences = np.diff(values)
+    scale = (np.median(np.abs(differences)) / 0.6745) ** 2 / 2
+    if not scale > 0:
+        scale = differences.var() / 2
+    return scale if scale > 0 else 1.0
+
+
+def _pelt(
+    s1: np.ndarray,
+    s2: np.ndarray,
+    model: str,
+    scale: float,
+    penalty: float,
+    min_size: int
+) -> list[int]:
+    """
+    Pruned exact linear time (PELT) search of the optimal segmentation.
+    """
+    n = len(s1) - 1
+    best = np.full(n + 1, np.inf)
+    best[0] = -penalty
+    last = np.zeros(n + 1, dtype=np.int64)
+    candidates = np.empty(0, dtype=np.int64)
+    for end in range(min_size, n + 1):
+        new = end - min_size
+        if new == 0 or new >= min_size:
+            candidates = np.append(candidates, new)
+        costs = best[candidates] + _cost(
+            s1, s2, candidates, end, model, scale
+        )
+        k = np.argmin(costs)
+        best[end] = costs[k] + penalty
+        last[end] = candidates[k]
+        candidates = candidates[costs <= best[end]]
+    points = []
+    end = n
+    while end > 0:
+        end = last[end]
+        if end > 0:
+            points.append(int(end))
+    return points[::-1]
+
+
+def _binary_segmentation(
+    s1: np.ndarray,
+    s2: np.ndarray,
+    model: str,
+    scale: float,
+    penalty: float,
+    min_size: int,
+    max_change_points: int | None
+) -> list[int]:
+    """
+    Binary segmentation, splitting the segment with the largest gain first.
+    """
+    def best_split(start: int, end: int) -> tuple[float, int] | None:
+        splits = np.arange(start + min_size, end - min_size + 1)
+        if splits.size == 0:
+            return None
+        gains = (
+            _cost(s1, s2, start, end, model, scale)
+            - _cost(s1, s2, start, splits, model, scale)
+            - _cost(s1, s2, splits, end, model, scale)
+        )
+        k = np.argmax(gains)
+        return (gains[k], int(splits[k]))
+
+    n = len(s1) - 1
+    heap = []
+    split = best_split(0, n)
+    if split is not None:
+        heap.append((-split[0], split[1], 0, n))
+    points = []
+    while heap and (
+        max_change_points is None or len(points) < max_change_points
+    ):
+        gain, point, start, end = heapq.heappop(heap)
+        if -gain <= penalty:
+            break
+        points.append(point)
+        for segment in ((start, point), (point, end)):
+            split = best_split(*segment)
+            if split is not None:
+                heapq.heappush(heap, (-split[0], split[1], *segment))
+    return sorted(points)
+
+
+def change_points(
+    *,
+    series: pd.Series | np.ndarray,
+    model: str = "mean",
+    method: str = "binseg",
+    penalty: str | float = "bic",
+    min_size: int | None = None,
+    max_change_points: int | None = None
+) -> list[int]:
+    """
+    Find the positions at which the average or the variation shifts.
+
+    The cost of a segment is calculated in constant time from prefix sums
+    of the values and their squares. Binary segmentation splits the segment
+    with the largest gain first, evaluating every split of a segment at
+    once, and runs in O(n log n). PELT finds the segmentation of least
+    penalized cost. Its pruning makes it close to linear when the number of
+    change points grows with the length of the series, but a long series
+    with few change points takes O(n^2) time; use binary segmentation for
+    those. PELT warns for series longer than 50,000 values.
+
+    Parameters
+    ----------
+    series : pd.Series | np.ndarray
+        The values in time order, without missing values.
+    model : str = "mean"
+        "mean" for shifts of the average with constant variation, or
+        "meanvar" for shifts of the average, the variation, or both.
+    method : str = "binseg"
+        "binseg" or "pelt".
+    penalty : str | float = "bic"
+        The penalty of each change point. "bic" is (k + 1) log(n), where
+        k is the number of parameters of a segment. For "mean", the costs
+        are scaled by a variance estimated from successive differences.
+    min_size : int | None = None
+        The minimum number of values in a segment. None is 2 for "mean"
+        and 5 for "meanvar", which avoids spurious short segments of nearly
+        equal values.
+    max_change_points : int | None = None
+        The maximum number of change points found by binary segmentation.
+
+    Returns
+    -------
+    list[int]
+        The positions (0-based) of the first value of each new segment.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import numpy as np
+    >>> rng = np.random.default_rng(42)
+    >>> values = np.concatenate([
+    ...     rng.normal(loc=10, scale=1, size=500),
+    ...     rng.normal(loc=12, scale=1, size=500),
+    ... ])
+    >>> dd.change_points(series=values)
+    [500]
+    """
+    if model not in ("mean", "meanvar"):
+        raise ValueError('model must be "mean" or "meanvar".')
+    if min_size is None:
+        min_size = 2 if model == "mean" else 5
+    if min_size < (1 if model == "mean" else 2):
+        raise ValueError("min_size is too small for the model.")
+    values = np.asarray(series, dtype="float64")
+    n = values.size
+    if n < 2 * min_size:
+        return []
+    if penalty == "bic":
+        penalty = (3 if model == "meanvar" else 2) * np.log(n)
+    scale = _scale(values)
+    s1, s2 = _prefix_sums(values)
+    match method:
+        case "pelt":
+            if n > _PELT_WARNING_SIZE:
+                warnings.warn(
+                    f"PELT of {n} values can take O(n^2) time when there "
+                    "are few change points. Consider method=\"binseg\".",
+                    RuntimeWarning,
+                    stacklevel=2
+                )
+            return _pelt(s1, s2, model, scale, penalty, min_size)
+        case "binseg":
+            return _binary_segmentation(
+                s1, s2, model, scale, penalty, min_size, max_change_points
+            )
+        case _:
+            raise ValueError('method must be "pelt" or "binseg".')
+
+
+def _change_points_column(task: tuple[np.ndarray, dict]) -> list[int]:
+    """
+    change_points() of one column, for a process pool.
+    """
+    values, kwargs = task
+    return change_points(series=values, **kwargs)
+
+
+def change_points_many(
+    *,
+    df: pd.DataFrame,
+    max_workers: int | None = None,
+    **kwargs
+) -> dict[str, list[int]]:
+    """
+    Find the change points of each column of a DataFrame.
+
+    The default method, binary segmentation, runs in O(n log n) time per
+    column. method="pelt" can take O(n^2) time per column for long series
+    with few change points; prefer binary segmentation for long columns.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        One series per column. Missing values are dropped.
+    max_workers : int | None = None
+        The number of processes used. None runs in this process.
+    **kwargs
+        The keyword arguments of change_points().
+
+    Returns
+    -------
+    dict[str, list[int]]
+        The change point positions of each column, counted in the values of
+        the column without missing values.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> rng = np.random.default_rng(42)
+    >>> df = pd.DataFrame({
+    ...     "a": np.r_[rng.normal(0, 1, 300), rng.normal(3, 1, 300)],
+    ...     "b": rng.normal(0, 1, 600),
+    ... })
+    >>> dd.change_points_many(df=df)
+    {'a': [300], 'b': []}
+    """
+    tasks = [
+        (df[column].dropna().to_numpy(dtype="float64"), kwargs)
+        for column in df.columns
+    ]
+    if max_workers and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_change_points_column, tasks))
+    else:
+        results = [_change_points_column(task) for task in tasks]
+    return dict(zip(df.columns, results))
+
+
+def stage_limits(
+    *,
+    series: pd.Series,
+    change_points: list[int],
+    subgroup_size: int = 2
+) -> pd.DataFrame:
+    """
+    Individuals control limits of each stage between change points.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The individual values.
+    change_points : list[int]
+        The positions of the first value of each new stage, as returned by
+        change_points().
+    subgroup_size : int = 2
+        The moving range subgroup size of the X chart of each stage.
+
+    Returns
+    -------
+    pd.DataFrame
+        The values with the index of series and columns stage, y, mean,
+        sigma, ucl, and lcl.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> rng = np.random.default_rng(42)
+    >>> series = pd.Series(np.r_[
+    ...     rng.normal(10, 1, 100), rng.normal(13, 1, 100)
+    ... ])
+    >>> limits = dd.stage_limits(
+    ...     series=series,
+    ...     change_points=dd.change_points(series=series)
+    ... )
+    """
+    bounds = [0, *change_points, len(series)]
+    stages = []
+    for stage, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+        chart = X(
+            data=series.iloc[start:end].to_frame(),
+            subgroup_size=subgroup_size
+        )
+        stages.append(pd.DataFrame(
+            data={
+                "stage": stage,
+                "y": chart.y,
+                "mean": chart.mean,
+                "sigma": chart.sigma,
+                "ucl": chart.ucl,
+                "lcl": chart.lcl,
+            },
+            index=chart.y.index
+        ))
+    return pd.concat(stages)
+
+
+__all__ = (
+    "change_points_many",
+    "change_points",
+    "stage_limits",
+)
@@ -2,16 +2,22 @@
 Shewhart control charts
 
 Create X, mR, Xbar, R control charts
+Create DNOM, Z, ZmR short-run control charts
+Create Hotelling T² multivariate control charts
 Invoke Shewhart rules 1, 2, 3, 4
+Simulate the average run length of sets of rules
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import Iterable, TypeVar
 from collections import defaultdict
 from abc import ABC, abstractmethod
 from itertools import tee
 from math import sqrt
 
+from scipy.linalg import cholesky, solve_triangular
 from cached_property import cached_property
+from scipy.stats import beta, f
 import matplotlib.pyplot as plt
 import matplotlib.axes as axes
 import pandas as pd
@@ -998,6 +1004,569 @@ class R(ControlChart):
         return self.mean * self._d3 / self._d2
 
 
+def _short_run(
+    data: pd.DataFrame,
+    part_col: str,
+    target: pd.Series | None,
+) -> tuple[pd.Series, pd.Series]:
+    """
+    The part numbers and the deviations from the part targets of each row.
+
+    The targets default to the part averages, calculated for all parts in
+    one grouped pass. target is a Series indexed by part.
+    """
+    parts = data[part_col]
+    values = data[[c for c in data.columns if c != part_col][0]]
+    if target is None:
+        row_target = values.groupby(parts, sort=False).transform("mean")
+    else:
+        row_target = parts.map(target)
+    return (parts, (values - row_target).rename(values.name))
+
+
+class DNOM(X):
+    """
+    Deviation from nominal individual values control chart (DNOM)
+
+    Short-run chart of many part numbers that share one process sigma. Each
+    value is replaced by its deviation from the target of its part, and the
+    deviations of all parts are plotted on one X chart.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The part number column and one column of individual values.
+    part_col : str = "Part"
+        The name of the part number column.
+    target : pd.Series | None = None
+        The target (nominal) of each part, indexed by part. The default is
+        the average of each part.
+    subgroup_size : int = 2
+        The moving range subgroup size.
+
+    Example
+    -------
+    >>> import dawgdad.control_charts as cc
+    >>> import pandas as pd
+    >>> data = pd.DataFrame({
+    ...     "Part": ["A", "A", "A", "B", "B", "B", "A", "A"],
+    ...     "X": [10.1, 9.8, 10.2, 20.3, 19.9, 20.1, 10.0, 9.9],
+    ... })
+    >>> dnom = cc.DNOM(
+    ...     data=data,
+    ...     target=pd.Series({"A": 10, "B": 20})
+    ... )
+    >>> above, below = cc.points_one(dnom)
+    """
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        part_col: str = "Part",
+        target: pd.Series | None = None,
+        subgroup_size: int = 2
+    ):
+        _, deviation = _short_run(
+            data=data, part_col=part_col, target=target
+        )
+        super().__init__(deviation.to_frame(), subgroup_size)
+
+
+class Z(ControlChart):
+    """
+    Standardized individual values control chart (Z)
+
+    Short-run chart of many part numbers with different targets and
+    sigmas. Each value is standardized, Z = (X - target) / sigma, with the
+    target and sigma of its part. The control limits are fixed at -3 and +3.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The part number column and one column of individual values.
+    part_col : str = "Part"
+        The name of the part number column.
+    target : pd.Series | None = None
+        The target of each part, indexed by part. The default is the average
+        of each part.
+    sigma : pd.Series | None = None
+        The sigma of each part, indexed by part. The default is the average
+        moving range within each part divided by d2. Parts with one value
+        then have missing Z values.
+
+    Example
+    -------
+    >>> import dawgdad.control_charts as cc
+    >>> import pandas as pd
+    >>> data = pd.DataFrame({
+    ...     "Part": ["A", "A", "A", "B", "B", "B", "A", "A"],
+    ...     "X": [10.1, 9.8, 10.2, 20.3, 19.9, 20.1, 10.0, 9.9],
+    ... })
+    >>> z = cc.Z(data=data)
+    >>> above, below = cc.points_one(z)
+    """
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        part_col: str = "Part",
+        target: pd.Series | None = None,
+        sigma: pd.Series | None = None
+    ):
+        parts, deviation = _short_run(
+            data=data, part_col=part_col, target=target
+        )
+        if sigma is None:
+            moving_range = deviation.groupby(parts, sort=False).diff().abs()
+            row_sigma = (
+                moving_range.groupby(parts, sort=False).transform("mean")
+                / CONSTANTS['d2'].loc[2]
+            )
+        else:
+            row_sigma = parts.map(sigma)
+        super().__init__((deviation / row_sigma).to_frame())
+
+    @cached_property
+    def sigma(self) -> float:
+        """
+        Sigma(Z)
+        """
+        return 1.0
+
+    @cached_property
+    def ucl(self) -> float:
+        """
+        Upper control limit
+        """
+        return 3.0
+
+    @cached_property
+    def lcl(self) -> float:
+        """
+        Lower control limit
+        """
+        return -3.0
+
+    @cached_property
+    def mean(self) -> float:
+        """
+        Central line
+        """
+        return 0.0
+
+    @cached_property
+    def y(self) -> pd.Series:
+        return self._df[self._df.columns[0]]
+
+    def ax(self, fig: plt.Figure = None) -> axes.Axes:
+        """
+        Plots standardized values (y axis) versus the index of the dataframe
+        (x axis)
+
+        Parameters
+        ----------
+        fig: plt.Figure = None
+            A matplotlib figure.
+
+        Returns
+        -------
+        axes: Axes
+            A matplotlib Axes.
+        """
+        if fig is None:
+            fig = plt.figure()
+        ax = fig.add_subplot(111)
+        _despine(ax)
+        ax.plot(self.y.index, self.y,
+                marker='o', markersize=3, color=colour1)
+        ax.axhline(
+            y=self.mean,
+            color=colour3
+        )
+        ax.axhline(
+            y=self.ucl,
+            color=colour1
+        )
+        ax.axhline(
+            y=self.lcl,
+            color=colour1
+        )
+        return ax
+
+
+class ZmR(ControlChart):
+    """
+    Moving range of standardized values control chart (ZmR)
+
+    The companion of the Z chart. The moving ranges of consecutive Z values
+    have the theoretical limits of a moving range chart of unit sigma.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The part number column and one column of individual values.
+    part_col : str = "Part"
+        The name of the part number column.
+    target : pd.Series | None = None
+        The target of each part, indexed by part.
+    sigma : pd.Series | None = None
+        The sigma of each part, indexed by part.
+
+    Example
+    -------
+    >>> import dawgdad.control_charts as cc
+    >>> import pandas as pd
+    >>> data = pd.DataFrame({
+    ...     "Part": ["A", "A", "A", "B", "B", "B", "A", "A"],
+    ...     "X": [10.1, 9.8, 10.2, 20.3, 19.9, 20.1, 10.0, 9.9],
+    ... })
+    >>> zmr = cc.ZmR(data=data)
+    >>> above, below = cc.points_one(zmr)
+    """
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        part_col: str = "Part",
+        target: pd.Series | None = None,
+        sigma: pd.Series | None = None
+    ):
+        self._z = Z(data=data, part_col=part_col, target=target, sigma=sigma)
+        super().__init__(self._z._df)
+
+    @cached_property
+    def sigma(self) -> float:
+        """
+        Sigma(ZmR) = d3
+        """
+        return CONSTANTS['d3'].loc[2]
+
+    @cached_property
+    def ucl(self) -> float:
+        """
+        Upper control limit
+        """
+        return self.mean + 3 * self.sigma
+
+    @cached_property
+    def lcl(self) -> float:
+        """
+        Lower control limit
+        """
+        return max(self.mean - 3 * self.sigma, 0)
+
+    @cached_property
+    def mean(self) -> float:
+        """
+        Central line = d2
+        """
+        return CONSTANTS['d2'].loc[2]
+
+    @cached_property
+    def y(self) -> pd.Series:
+        return self._z.y.diff().abs()
+
+    def ax(self, fig: plt.Figure = None) -> axes.Axes:
+        """
+        Plots moving ranges of standardized values (y axis) versus the index
+        of the dataframe (x axis)
+
+        Parameters
+        ----------
+        fig: plt.Figure = None
+            A matplotlib figure.
+
+        Returns
+        -------
+        axes: Axes
+            A matplotlib Axes.
+        """
+        if fig is None:
+            fig = plt.figure()
+        ax = fig.add_subplot(111)
+        _despine(ax)
+        ax.plot(self.y.index, self.y,
+                marker='o', markersize=3, color=colour2)
+        ax.axhline(
+            y=self.mean,
+            color=colour3
+        )
+        ax.axhline(
+            y=self.ucl,
+            color=colour1
+        )
+        ax.axhline(
+            y=self.lcl,
+            color=colour1
+        )
+        return ax
+
+
+def _moments(
+    values: np.ndarray
+) -> tuple[int, np.ndarray, np.ndarray]:
+    """
+    Count, mean vector, and matrix of centred sums of cross products.
+    """
+    n = values.shape[0]
+    mean = values.mean(axis=0)
+    centred = values - mean
+    return (n, mean, centred.T @ centred)
+
+
+def _merge_moments(
+    a: tuple[int, np.ndarray, np.ndarray],
+    b: tuple[int, np.ndarray, np.ndarray]
+) -> tuple[int, np.ndarray, np.ndarray]:
+    """
+    Combine the moments of two sets of observations (Chan et al.).
+    """
+    n_a, mean_a, m2_a = a
+    n_b, mean_b, m2_b = b
+    if n_a == 0:
+        return b
+    if n_b == 0:
+        return a
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / n
+    m2 = m2_a + m2_b + np.outer(delta, delta) * n_a * n_b / n
+    return (n, mean, m2)
+
+
+class HotellingT2(ControlChart):
+    """
+    Hotelling T² control chart of individual multivariate observations
+
+    Each row of data is one observation of several correlated
+    characteristics. The mean vector and covariance matrix of the baseline
+    are accumulated in chunks that are merged with the Chan et al. update,
+    and T² of all observations is calculated with one triangular solve
+    through the Cholesky factor of the covariance matrix.
+
+    The limits of the baseline observations (Phase I) use the beta
+    distribution. Once observations are appended without updating the
+    baseline (Phase II), ucl is a Series with the beta limit for the
+    baseline observations and the F limit for the new observations.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The baseline observations, one column per characteristic.
+    alpha : float = 0.0027
+        The false alarm probability of the upper control limit.
+    chunk_size : int = 100_000
+        The number of rows accumulated at once.
+
+    Example
+    -------
+    >>> import dawgdad.control_charts as cc
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> rng = np.random.default_rng(42)
+    >>> data = pd.DataFrame(
+    ...     data=rng.multivariate_normal(
+    ...         mean=[25, 0.01, 40],
+    ...         cov=[[1, 0.5, 0], [0.5, 1, 0], [0, 0, 1]],
+    ...         size=100
+    ...     ),
+    ...     columns=["diameter", "roundness", "depth"]
+    ... )
+    >>> t2 = cc.HotellingT2(data=data.iloc[:50])
+    >>> above, below = cc.points_one(t2)
+    >>> t2 = t2.append(data.iloc[50:])
+    >>> above, below = cc.points_one(t2)
+    """
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        alpha: float = 0.0027,
+        chunk_size: int = 100_000
+    ):
+        super().__init__(data)
+        self.alpha = alpha
+        self.chunk_size = chunk_size
+        self._baseline = (0, np.zeros(data.shape[1]), np.zeros(
+            (data.shape[1], data.shape[1])
+        ))
+        self._accumulate(data)
+        self._phase_two = np.zeros(data.shape[0], dtype=bool)
+
+    def _accumulate(self, data: pd.DataFrame) -> None:
+        values = data.to_numpy(dtype="float64")
+        for start in range(0, values.shape[0], self.chunk_size):
+            self._baseline = _merge_moments(
+                self._baseline,
+                _moments(values[start:start + self.chunk_size])
+            )
+
+    def _invalidate(self) -> None:
+        for name in (
+            "_cholesky", "y", "ucl", "lcl", "mean", "sigma", "sigmas"
+        ):
+            self.__dict__.pop(name, None)
+
+    @property
+    def n(self) -> int:
+        """
+        The number of baseline observations.
+        """
+        return self._baseline[0]
+
+    @property
+    def p(self) -> int:
+        """
+        The number of characteristics.
+        """
+        return self._df.shape[1]
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """
+        The sample covariance matrix of the baseline.
+        """
+        return self._baseline[2] / (self.n - 1)
+
+    @property
+    def centre(self) -> np.ndarray:
+        """
+        The mean vector of the baseline.
+        """
+        return self._baseline[1]
+
+    @cached_property
+    def _cholesky(self) -> np.ndarray:
+        return cholesky(self.covariance, lower=True)
+
+    def _t2(self, data: pd.DataFrame) -> pd.Series:
+        centred = data.to_numpy(dtype="float64") - self.centre
+        z = solve_triangular(self._cholesky, centred.T, lower=True)
+        return pd.Series(
+            data=np.einsum("ij,ij->j", z, z), index=data.index, name="T2"
+        )
+
+    def append(
+        self,
+        data: pd.DataFrame,
+        update_baseline: bool = False
+    ) -> "HotellingT2":
+        """
+        Add observations to the chart.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The new observations, with the same columns as the baseline.
+        update_baseline : bool = False
+            If True, the new observations are merged into the baseline and
+            every T² is recalculated. If False, the baseline is unchanged,
+            only the T² of the new observations are calculated, and the
+            limits become the Phase II limits.
+
+        Returns
+        -------
+        HotellingT2
+            The chart, for chaining.
+        """
+        data = data[self._df.columns]
+        if update_baseline:
+            self._accumulate(data)
+            self._df = pd.concat([self._df, data])
+            self._invalidate()
+        else:
+            y = pd.concat([self.y, self._t2(data)])
+            self._df = pd.concat([self._df, data])
+            self._invalidate()
+            self.__dict__["y"] = y
+        self._phase_two = np.concatenate(
+            (self._phase_two, np.full(data.shape[0], not update_baseline))
+        )
+        return self
+
+    @cached_property
+    def ucl(self) -> float | pd.Series:
+        """
+        Upper control limit
+
+        A float while all observations are baseline observations, else a
+        Series with the index of y: the Phase I limit for the baseline
+        observations and the Phase II limit for the new observations.
+        """
+        m, p = self.n, self.p
+        phase_one = (m - 1) ** 2 / m * beta.ppf(
+            1 - self.alpha, p / 2, (m - p - 1) / 2
+        )
+        if not self._phase_two.any():
+            return phase_one
+        phase_two = (
+            p * (m + 1) * (m - 1) / (m * (m - p))
+            * f.ppf(1 - self.alpha, p, m - p)
+        )
+        return pd.Series(
+            data=np.where(self._phase_two, phase_two, phase_one),
+            index=self.y.index,
+            name="ucl"
+        )
+
+    @cached_property
+    def lcl(self) -> float:
+        """
+        Lower control limit
+        """
+        return 0.0
+
+    @cached_property
+    def mean(self) -> float:
+        """
+        Central line, the expected value of T² of a baseline observation
+        """
+        return self.p * (self.n - 1) / self.n
+
+    @cached_property
+    def sigma(self) -> float:
+        """
+        Standard deviation of T² of a baseline observation
+        """
+        m, p = self.n, self.p
+        return (m - 1) ** 2 / m * sqrt(
+            beta.var(p / 2, (m - p - 1) / 2)
+        )
+
+    @cached_property
+    def y(self) -> pd.Series:
+        return self._t2(self._df)
+
+    def ax(self, fig: plt.Figure = None) -> axes.Axes:
+        """
+        Plots T² (y axis) versus the index of the dataframe (x axis)
+
+        Parameters
+        ----------
+        fig: plt.Figure = None
+            A matplotlib figure.
+
+        Returns
+        -------
+        axes: Axes
+            A matplotlib Axes.
+        """
+        if fig is None:
+            fig = plt.figure()
+        ax = fig.add_subplot(111)
+        _despine(ax)
+        ax.plot(self.y.index, self.y,
+                marker='o', markersize=3, color=colour1)
+        if isinstance(self.ucl, pd.Series):
+            ax.plot(self.ucl.index, self.ucl, color=colour1)
+        else:
+            ax.axhline(
+                y=self.ucl,
+                color=colour1
+            )
+        ax.axhline(
+            y=self.lcl,
+            color=colour1
+        )
+        return ax
+
+
 def draw_rule(
     cc: ControlChart,
     ax: axes.Axes,
@@ -1256,8 +1825,204 @@ def points_four(cc: ControlChart) -> tuple[pd.Series, pd.Series]:
     return (series_above, series_below)
 
 
+def _window_count(flags: np.ndarray, window: int) -> np.ndarray:
+    """
+    Number of True values in the window ending at each column of each row.
+    """
+    counts = np.cumsum(flags, axis=1, dtype=np.int32)
+    counts[:, window:] = counts[:, window:] - counts[:, :-window]
+    return counts
+
+
+def _rule_signals(z: np.ndarray, rule: int) -> np.ndarray:
+    """
+    Points of each row of standardized values at which a rule signals.
+
+    The rules are those of points_one, points_two, points_three, and
+    points_four, for a chart with a central line of 0 and a sigma of 1.
+    """
+    match rule:
+        case 1:
+            return np.abs(z) > 3
+        case 2:
+            return (
+                (_window_count(z > 2, 3) >= 2)
+                | (_window_count(z < -2, 3) >= 2)
+            )
+        case 3:
+            return (
+                (_window_count(z > 1, 5) >= 4)
+                | (_window_count(z < -1, 5) >= 4)
+            )
+        case 4:
+            return (
+                (_window_count(z > 0, 8) == 8)
+                | (_window_count(z < 0, 8) == 8)
+            )
+        case _:
+            raise ValueError("rules must be 1, 2, 3, or 4.")
+
+
+def _simulate_run_lengths(
+    task: tuple[
+        np.random.SeedSequence, int, float, tuple[tuple[int, ...], ...],
+        int, int
+    ]
+) -> np.ndarray:
+    """
+    Run lengths of n_series simulated series for each rule set.
+
+    The series are drawn in blocks of block_size points. Series that have
+    signalled for every rule set are dropped, and the last seven values of
+    the others are carried over so that the windowed rules span blocks.
+    Run lengths longer than max_length are NaN.
+    """
+    seed, n_series, shift, rule_sets, block_size, max_length = task
+    rng = np.random.default_rng(seed=seed)
+    rules = sorted(set().union(*rule_sets))
+    carry = 7
+    run_lengths = np.zeros((n_series, len(rule_sets)))
+    active = np.arange(n_series)
+    tail = np.full((n_series, carry), np.nan)
+    start = 0
+    while active.size and start < max_length:
+        z = np.concatenate(
+            [
+                tail,
+                rng.standard_normal(size=(active.size, block_size)) + shift
+            ],
+            axis=1
+        )
+        signals = {
+            rule: _rule_signals(z, rule)[:, carry:] for rule in rules
+        }
+        for k, rule_set in enumerate(rule_sets):
+            signal = np.logical_or.reduce(
+                [signals[rule] for rule in rule_set]
+            )
+            hit = signal.any(axis=1) & (run_lengths[active, k] == 0)
+            run_lengths[active[hit], k] = (
+                start + signal[hit].argmax(axis=1) + 1
+            )
+        pending = (run_lengths[active] == 0).any(axis=1)
+        active = active[pending]
+        tail = z[pending, -carry:]
+        start += block_size
+    run_lengths[run_lengths == 0] = np.nan
+    return run_lengths
+
+
+def average_run_length(
+    *,
+    rule_sets: tuple[tuple[int, ...], ...] = ((1,), (1, 2), (1, 2, 3),
+                                               (1, 2, 3, 4)),
+    shifts: tuple[float, ...] = (0, 0.5, 1, 1.5, 2, 3),
+    n_series: int = 10_000,
+    block_size: int = 256,
+    max_length: int = 1_000_000,
+    chunk_series: int = 10_000,
+    random_state: int | None = None,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """
+    Simulate the average run length of sets of Shewhart rules.
+
+    Normal individual values with a central line of 0 and a sigma of 1,
+    shifted by shift sigmas, are drawn in 2-D batches. The rules of
+    points_one, points_two, points_three, and points_four are evaluated for
+    all series at once with windowed counts. Each series runs until every
+    rule set has signalled, so the rule sets are compared on the same
+    series. The ARL at a shift of 0 is the in-control ARL0; the others are
+    ARL1.
+
+    Parameters
+    ----------
+    rule_sets : tuple[tuple[int, ...], ...] = ((1,), (1, 2), (1, 2, 3),
+                                                (1, 2, 3, 4))
+        The sets of rules to evaluate. A set signals when any of its rules
+        signals.
+    shifts : tuple[float, ...] = (0, 0.5, 1, 1.5, 2, 3)
+        The shifts of the process average in sigma units.
+    n_series : int = 10_000
+        The number of simulated series for each shift.
+    block_size : int = 256
+        The number of points drawn at once for each series.
+    max_length : int = 1_000_000
+        The longest run simulated. Longer runs are censored.
+    chunk_series : int = 10_000
+        The number of series in each task. Each task has an independent
+        random stream, so the results do not depend on max_workers.
+    random_state : int | None = None
+        The random number seed.
+    max_workers : int | None = None
+        The number of processes used to run the tasks. None runs them in
+        this process.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per (rule set, shift) with columns arl, sdrl (standard
+        deviation of the run length), median, n_series, and censored.
+
+    Example
+    -------
+    >>> import dawgdad.control_charts as cc
+    >>> arl = cc.average_run_length(
+    ...     rule_sets=((1,), (1, 2, 3, 4)),
+    ...     shifts=(0, 1),
+    ...     n_series=2_000,
+    ...     random_state=42
+    ... )
+    """
+    rule_sets = tuple(tuple(rule_set) for rule_set in rule_sets)
+    for rule_set in rule_sets:
+        if not set(rule_set) <= {1, 2, 3, 4}:
+            raise ValueError("rules must be 1, 2, 3, or 4.")
+    sizes = [
+        min(chunk_series, n_series - start)
+        for start in range(0, n_series, chunk_series)
+    ]
+    seeds = np.random.SeedSequence(entropy=random_state).spawn(
+        len(shifts) * len(sizes)
+    )
+    tasks = [
+        (seeds[i * len(sizes) + j], size, shift, rule_sets, block_size,
+         max_length)
+        for i, shift in enumerate(shifts)
+        for j, size in enumerate(sizes)
+    ]
+    if max_workers and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_simulate_run_lengths, tasks))
+    else:
+        results = [_simulate_run_lengths(task) for task in tasks]
+    run_lengths = [
+        np.concatenate(results[i * len(sizes):(i + 1) * len(sizes)])
+        for i in range(len(shifts))
+    ]
+    rows = {}
+    for k, rule_set in enumerate(rule_sets):
+        for shift, shift_lengths in zip(shifts, run_lengths):
+            lengths = shift_lengths[:, k]
+            rows[("+".join(map(str, rule_set)), shift)] = {
+                "arl": np.nanmean(lengths),
+                "sdrl": np.nanstd(lengths, ddof=1),
+                "median": np.nanmedian(lengths),
+                "n_series": n_series,
+                "censored": int(np.isnan(lengths).sum()),
+            }
+    table = pd.DataFrame.from_dict(rows, orient="index")
+    table.index = pd.MultiIndex.from_tuples(
+        table.index, names=["rule_set", "shift"]
+    )
+    return table
+
+
 __all__ = (
+    'average_run_length',
     'ControlChart',
+    'HotellingT2',
+    'DNOM',
     'points_three',
     'points_four',
     'points_two',
@@ -1266,6 +2031,8 @@ __all__ = (
     'draw_rule',
     'Xbar',
     'mR',
+    'ZmR',
     'R',
     'X',
+    'Z',
 )
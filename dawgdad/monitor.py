@@ -0,0 +1,449 @@
+"""
+Asynchronous monitoring of measurement files with control charts
+
+- Tail CSV files in a directory, reading only the bytes appended since the
+  last poll
+- Incremental individuals chart of each characteristic, with limits from a
+  baseline and Shewhart rules 1, 2, 3, 4
+- Violation events written to a JSONL file, passed to a callback, or sent
+  to a local socket, and kept for a retry if the sink fails
+"""
+
+from dawgdad.control_charts import CONSTANTS, _rule_signals
+from typing import Any, Callable
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+import logging
+import inspect
+import asyncio
+import json
+import csv
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+# the sigma beyond which a point counts toward rules 2 and 3
+_ZONES = {2: 2, 3: 1}
+
+
+class IndividualsMonitor:
+    """
+    Incremental individuals control chart of one characteristic.
+
+    The first baseline_size values give the average and the sigma (average
+    moving range / d2), unless they are given. Each later value is
+    standardized and checked against rules 1, 2, 3, and 4 with the last
+    eight standardized values, so memory does not grow with the stream.
+
+    Parameters
+    ----------
+    baseline_size : int = 25
+        The number of values used to calculate the limits.
+    mean : float | None = None
+        The central line. Give both mean and sigma to skip the baseline.
+    sigma : float | None = None
+        The sigma of the individual values.
+    rules : tuple[int, ...] = (1, 2, 3, 4)
+        The rules to check.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> chart = dd.IndividualsMonitor(mean=10, sigma=1)
+    >>> chart.update(value=14.2)
+    [{'rule': '1', 'side': 'above', 'value': 14.2, 'count': 1}]
+    """
+    def __init__(
+        self,
+        baseline_size: int = 25,
+        mean: float | None = None,
+        sigma: float | None = None,
+        rules: tuple[int, ...] = (1, 2, 3, 4),
+    ):
+        if baseline_size < 2:
+            raise ValueError("baseline_size must be >= 2.")
+        if (mean is None) != (sigma is None):
+            raise ValueError("Give both mean and sigma, or neither.")
+        self.baseline_size = baseline_size
+        self.mean = mean
+        self.sigma = sigma
+        self.rules = rules
+        self.count = 0
+        self._baseline: list[float] = []
+        self._window: deque[float] = deque([np.nan] * 8, maxlen=8)
+
+    @property
+    def ucl(self) -> float | None:
+        """
+        Upper control limit
+        """
+        return None if self.sigma is None else self.mean + 3 * self.sigma
+
+    @property
+    def lcl(self) -> float | None:
+        """
+        Lower control limit
+        """
+        return None if self.sigma is None else self.mean - 3 * self.sigma
+
+    def update(self, value: float) -> list[dict[str, Any]]:
+        """
+        Add one value and return the rules it violates.
+
+        Parameters
+        ----------
+        value : float
+            The new individual value.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            One dictionary per violated rule, with keys rule, side, value,
+            and count (the position of the value in the stream).
+        """
+        self.count += 1
+        if self.sigma is None:
+            self._baseline.append(value)
+            if len(self._baseline) == self.baseline_size:
+                baseline = np.array(self._baseline)
+                self.mean = float(baseline.mean())
+                self.sigma = float(
+                    np.abs(np.diff(baseline)).mean() / CONSTANTS["d2"].loc[2]
+                )
+                self._baseline = []
+            return []
+        self._window.append((value - self.mean) / self.sigma)
+        z = np.array(self._window)[np.newaxis, :]
+        events = []
+        for side, window in (
+            ("above", np.fmax(z, 0)), ("below", np.fmin(z, 0))
+        ):
+            for rule in self.rules:
+                # rules 2 and 3 signal at a point beyond their zone, not at
+                # later points that stay inside an earlier run
+                beyond = abs(window[0, -1]) > _ZONES.get(rule, 0)
+                if beyond and _rule_signals(window, rule)[0, -1]:
+                    events.append({
+                        "rule": str(rule),
+                        "side": side,
+                        "value": value,
+                        "count": self.count,
+                    })
+        return events
+
+
+class JSONLSink:
+    """
+    Append events to a JSON lines file.
+
+    Parameters
+    ----------
+    path : str | Path
+        The path of the file.
+    """
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    async def emit(self, event: dict[str, Any]) -> None:
+        line = json.dumps(event) + "\n"
+        await asyncio.to_thread(self._write, line)
+
+    def _write(self, line: str) -> None:
+        with self.path.open(mode="a", encoding="utf-8") as file:
+            file.write(line)
+
+
+class CallbackSink:
+    """
+    Pass events to a function or a coroutine function.
+
+    Parameters
+    ----------
+    callback : Callable[[dict[str, Any]], Any]
+        Called with each event.
+    """
+    def __init__(self, callback: Callable[[dict[str, Any]], Any]):
+        self.callback = callback
+
+    async def emit(self, event: dict[str, Any]) -> None:
+        result = self.callback(event)
+        if inspect.isawaitable(result):
+            await result
+
+
+class SocketSink:
+    """
+    Send events as JSON lines to a local Unix socket or TCP port.
+
+    The connection is opened on the first event and reopened after an
+    error.
+
+    Parameters
+    ----------
+    path : str | Path | None = None
+        The path of a Unix domain socket.
+    host : str = "127.0.0.1"
+        The host of a TCP socket, used when path is None.
+    port : int | None = None
+        The port of a TCP socket, used when path is None.
+    """
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+    ):
+        if path is None and port is None:
+            raise ValueError("Give the path or the port of the socket.")
+        self.path = path
+        self.host = host
+        self.port = port
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def emit(self, event: dict[str, Any]) -> None:
+        if self._writer is None:
+            if self.path is not None:
+                _, self._writer = await asyncio.open_unix_connection(
+                    path=str(self.path)
+                )
+            else:
+                _, self._writer = await asyncio.open_connection(
+                    host=self.host, port=self.port
+                )
+        try:
+            self._writer.write((json.dumps(event) + "\n").encode())
+            await self._writer.drain()
+        except (ConnectionError, OSError):
+            self._writer = None
+            raise
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+
+class _FileState:
+    """
+    Read position, header, unfinished last line, and undelivered events of
+    one file.
+    """
+    __slots__ = ("offset", "header", "partial", "pending")
+
+    def __init__(self):
+        self.offset = 0
+        self.header: list[str] | None = None
+        self.partial = b""
+        self.pending: deque[dict[str, Any]] = deque()
+
+
+class Monitor:
+    """
+    Watch a directory of CSV measurement files and chart them as they grow.
+
+    Each poll lists the files matching pattern and reads, from each file
+    that grew, only the bytes after the last read. An unfinished last line
+    is kept until the rest of it arrives. The first line of each file is its
+    header. Each numeric column is a characteristic with its own
+    IndividualsMonitor, and every rule violation is sent to the sink as an
+    event.
+
+    Files are read concurrently, at most max_open_files at a time and at
+    most max_bytes per file per poll, so memory is bounded by the number of
+    charts and not by the length of the streams.
+
+    An event is removed from its file's queue only after the sink accepts
+    it. If the sink fails, the undelivered events are sent again at the
+    next poll, before the file is read further, so no event is lost or
+    charted twice. run() logs sink errors and keeps polling.
+
+    Parameters
+    ----------
+    directory : str | Path
+        The directory to watch.
+    sink : JSONLSink | CallbackSink | SocketSink | Callable
+        Where the events go. A plain callable is wrapped in CallbackSink.
+    pattern : str = "*.csv"
+        The glob pattern of the files to watch.
+    columns : list[str] | None = None
+        The characteristics to chart. None charts every column with numeric
+        values.
+    per_file : bool = False
+        If True, each file has its own charts. If False, a characteristic
+        has one chart for all files.
+    baseline_size : int = 25
+        The number of values used to calculate the limits of each chart.
+    rules : tuple[int, ...] = (1, 2, 3, 4)
+        The rules to check.
+    poll_interval : float = 1.0
+        The number of seconds between polls.
+    max_open_files : int = 64
+        The maximum number of files read at once.
+    max_bytes : int = 1_048_576
+        The maximum number of bytes read from one file in one poll.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import asyncio
+    >>> monitor = dd.Monitor(
+    ...     directory="measurements",
+    ...     sink=dd.JSONLSink(path="violations.jsonl")
+    ... )
+    >>> asyncio.run(monitor.run()) # doctest: +SKIP
+    """
+    def __init__(
+        self,
+        directory: str | Path,
+        sink: Any,
+        pattern: str = "*.csv",
+        columns: list[str] | None = None,
+        per_file: bool = False,
+        baseline_size: int = 25,
+        rules: tuple[int, ...] = (1, 2, 3, 4),
+        poll_interval: float = 1.0,
+        max_open_files: int = 64,
+        max_bytes: int = 1_048_576,
+    ):
+        self.directory = Path(directory)
+        self.sink = sink if hasattr(sink, "emit") else CallbackSink(sink)
+        self.pattern = pattern
+        self.columns = columns
+        self.per_file = per_file
+        self.baseline_size = baseline_size
+        self.rules = rules
+        self.poll_interval = poll_interval
+        self.max_open_files = max_open_files
+        self.max_bytes = max_bytes
+        self.charts: dict[str, IndividualsMonitor] = {}
+        self._files: dict[Path, _FileState] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def _read(self, path: Path, offset: int) -> bytes:
+        with path.open(mode="rb") as file:
+            file.seek(offset)
+            return file.read(self.max_bytes)
+
+    def _chart(self, key: str) -> IndividualsMonitor:
+        chart = self.charts.get(key)
+        if chart is None:
+            chart = self.charts[key] = IndividualsMonitor(
+                baseline_size=self.baseline_size, rules=self.rules
+            )
+        return chart
+
+    async def _deliver(self, state: _FileState) -> int:
+        delivered = 0
+        while state.pending:
+            await self.sink.emit(state.pending[0])
+            state.pending.popleft()
+            delivered += 1
+        return delivered
+
+    async def _poll_file(self, path: Path) -> int:
+        state = self._files.setdefault(path, _FileState())
+        # the events of an earlier failure of the sink go first
+        delivered = await self._deliver(state)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            del self._files[path]
+            return delivered
+        if size < state.offset:
+            # the file was truncated or replaced, start again
+            state = self._files[path] = _FileState()
+        if size == state.offset:
+            return delivered
+        async with self._semaphore:
+            data = await asyncio.to_thread(self._read, path, state.offset)
+        state.offset += len(data)
+        *lines, state.partial = (state.partial + data).split(b"\n")
+        rows = csv.reader(line.decode().rstrip("\r") for line in lines)
+        for row in rows:
+            if not row:
+                continue
+            if state.header is None:
+                state.header = row
+                continue
+            for column, text in zip(state.header, row):
+                if self.columns is not None and column not in self.columns:
+                    continue
+                try:
+                    value = float(text)
+                except ValueError:
+                    continue
+                key = f"{path.name}:{column}" if self.per_file else column
+                chart = self._chart(key)
+                for violation in chart.update(value=value):
+                    state.pending.append({
+                        "time": datetime.now().isoformat(),
+                        "file": str(path),
+                        "characteristic": key,
+                        "mean": chart.mean,
+                        "ucl": chart.ucl,
+                        "lcl": chart.lcl,
+                        **violation,
+                    })
+        return delivered + await self._deliver(state)
+
+    async def poll(self) -> int:
+        """
+        Read the new bytes of every file once.
+
+        Every file is polled even if the sink fails for one of them; the
+        first error is raised afterwards. The undelivered events of a file
+        that is gone are still sent before it is forgotten.
+
+        Returns
+        -------
+        int
+            The number of events emitted.
+        """
+        # the semaphore belongs to the event loop of the running poll
+        self._semaphore = asyncio.Semaphore(self.max_open_files)
+        paths = sorted(self.directory.glob(self.pattern))
+        paths += sorted(set(self._files) - set(paths))
+        results = await asyncio.gather(
+            *(self._poll_file(path) for path in paths),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return sum(results)
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        """
+        Poll until stop is set, or forever.
+
+        Parameters
+        ----------
+        stop : asyncio.Event | None = None
+            Set this event to end the loop after the current poll.
+        """
+        while stop is None or not stop.is_set():
+            try:
+                await self.poll()
+            except Exception:
+                logger.exception("Monitor poll failed, retrying.")
+            if stop is None:
+                await asyncio.sleep(self.poll_interval)
+            else:
+                try:
+                    await asyncio.wait_for(
+                        stop.wait(), timeout=self.poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+
+__all__ = (
+    "IndividualsMonitor",
+    "CallbackSink",
+    "SocketSink",
+    "JSONLSink",
+    "Monitor",
+)
@@ -0,0 +1,220 @@
+"""
+Monte Carlo simulation of process capability
+
+- Sampling distribution of Cpk, Ppk, Pp, and the estimated ppm out of
+  specification for a given sample size
+- Summary of the sampling distribution over several sample sizes
+"""
+
+from dawgdad.process_capability import CONSTANTS
+from scipy.stats import norm
+import pandas as pd
+import numpy as np
+
+
+def _capability_statistics(
+    *,
+    x: np.ndarray,
+    lower_spec: float | int,
+    upper_spec: float | int,
+    d2: float
+) -> dict[str, np.ndarray]:
+    """
+    Capability statistics for each row of a (replicates, n) array.
+    """
+    average = x.mean(axis=1)
+    std_devn = x.std(axis=1, ddof=1)
+    sigma_mr = np.abs(np.diff(x, axis=1)).mean(axis=1) / d2
+    cpk = np.minimum(average - lower_spec, upper_spec - average) / (
+        3 * sigma_mr
+    )
+    ppk = np.minimum(average - lower_spec, upper_spec - average) / (
+        3 * std_devn
+    )
+    pp = (upper_spec - lower_spec) / (6 * std_devn)
+    ppm = 1e6 * (
+        norm.cdf((lower_spec - average) / std_devn)
+        + norm.sf((upper_spec - average) / std_devn)
+    )
+    return {
+        "average": average,
+        "std_devn": std_devn,
+        "sigma_mr": sigma_mr,
+        "cpk": cpk,
+        "ppk": ppk,
+        "pp": pp,
+        "ppm": ppm,
+    }
+
+
+def simulate_capability(
+    *,
+    average: float | int,
+    std_devn: float | int,
+    sample_size: int,
+    lower_spec: float | int,
+    upper_spec: float | int,
+    n_sims: int = 10_000,
+    random_state: int | np.random.Generator | None = None,
+    max_elements: int = 10_000_000,
+) -> pd.DataFrame:
+    """
+    Simulate the sampling distribution of capability statistics.
+
+    n_sims samples of sample_size individual values are drawn from a normal
+    process. Each sample gives one estimate of the average, the sample
+    standard deviation, the moving range sigma, Cpk (moving range sigma),
+    Ppk, Pp, and the ppm out of specification expected from the estimated
+    average and standard deviation.
+
+    Parameters
+    ----------
+    average : float | int
+        The average of the process.
+    std_devn : float | int
+        The standard deviation of the process.
+    sample_size : int
+        The number of values in each simulated sample, >= 2.
+    lower_spec : float | int
+        The lower specification value.
+    upper_spec : float | int
+        The upper specification value.
+    n_sims : int = 10_000
+        The number of simulated samples.
+    random_state : int | np.random.Generator | None = None
+        The random number seed or generator.
+    max_elements : int = 10_000_000
+        The maximum number of values drawn at once. The simulations are done
+        in chunks of rows when n_sims * sample_size is larger.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per simulated sample with columns average, std_devn,
+        sigma_mr, cpk, ppk, pp, and ppm.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> df = dd.simulate_capability(
+    ...     average=10,
+    ...     std_devn=1,
+    ...     sample_size=30,
+    ...     lower_spec=6,
+    ...     upper_spec=14,
+    ...     n_sims=10_000,
+    ...     random_state=42
+    ... )
+    >>> df["cpk"].quantile(q=[0.05, 0.5, 0.95]) # doctest: +SKIP
+    """
+    if sample_size < 2:
+        raise ValueError("sample_size must be >= 2.")
+    rng = np.random.default_rng(seed=random_state)
+    d2 = CONSTANTS.loc[2, "d2"]
+    rows_per_chunk = max(1, max_elements // sample_size)
+    chunks = []
+    for start in range(0, n_sims, rows_per_chunk):
+        rows = min(rows_per_chunk, n_sims - start)
+        x = rng.normal(loc=average, scale=std_devn, size=(rows, sample_size))
+        chunks.append(
+            _capability_statistics(
+                x=x, lower_spec=lower_spec, upper_spec=upper_spec, d2=d2
+            )
+        )
+    return pd.DataFrame(
+        data={
+            key: np.concatenate([chunk[key] for chunk in chunks])
+            for key in chunks[0]
+        }
+    )
+
+
+def capability_sample_size_table(
+    *,
+    average: float | int,
+    std_devn: float | int,
+    sample_sizes: list[int],
+    lower_spec: float | int,
+    upper_spec: float | int,
+    n_sims: int = 10_000,
+    quantiles: tuple[float, ...] = (0.05, 0.5, 0.95),
+    random_state: int | None = None,
+    max_elements: int = 10_000_000,
+) -> pd.DataFrame:
+    """
+    Summarize the sampling distribution of Cpk, Ppk, and ppm by sample size.
+
+    Parameters
+    ----------
+    average : float | int
+        The average of the process.
+    std_devn : float | int
+        The standard deviation of the process.
+    sample_sizes : list[int]
+        The sample sizes to simulate.
+    lower_spec : float | int
+        The lower specification value.
+    upper_spec : float | int
+        The upper specification value.
+    n_sims : int = 10_000
+        The number of simulated samples for each sample size.
+    quantiles : tuple[float, ...] = (0.05, 0.5, 0.95)
+        The quantiles of each statistic to report.
+    random_state : int | None = None
+        The random number seed. Each sample size gets an independent stream.
+    max_elements : int = 10_000_000
+        The maximum number of values drawn at once.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per sample size. The columns are (statistic, summary), where
+        summary is the mean or a quantile, for cpk, ppk, and ppm. The true
+        Cpk and ppm of the process are in columns true_cpk and true_ppm.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> table = dd.capability_sample_size_table(
+    ...     average=10,
+    ...     std_devn=1,
+    ...     sample_sizes=[10, 30, 100],
+    ...     lower_spec=6,
+    ...     upper_spec=14,
+    ...     random_state=42
+    ... )
+    """
+    seeds = np.random.SeedSequence(entropy=random_state).spawn(
+        len(sample_sizes)
+    )
+    rows = {}
+    for sample_size, seed in zip(sample_sizes, seeds):
+        df = simulate_capability(
+            average=average,
+            std_devn=std_devn,
+            sample_size=sample_size,
+            lower_spec=lower_spec,
+            upper_spec=upper_spec,
+            n_sims=n_sims,
+            random_state=np.random.default_rng(seed=seed),
+            max_elements=max_elements,
+        )[["cpk", "ppk", "ppm"]]
+        summary = df.quantile(q=list(quantiles))
+        summary.loc["mean"] = df.mean()
+        rows[sample_size] = summary.unstack()
+    table = pd.DataFrame.from_dict(rows, orient="index")
+    table.index.name = "sample_size"
+    table["true_cpk"] = min(average - lower_spec, upper_spec - average) / (
+        3 * std_devn
+    )
+    table["true_ppm"] = 1e6 * (
+        norm.cdf((lower_spec - average) / std_devn)
+        + norm.sf((upper_spec - average) / std_devn)
+    )
+    return table
+
+
+__all__ = (
+    "capability_sample_size_table",
+    "simulate_capability",
+)
@@ -13,8 +13,10 @@ Honest MSA reports on pandas DataFrames
 # TODO: MSA intraclass correlation coefficient with operator bias.
 # TODO: MSA intraclass correlation coefficient without operator bias.
 
+from dawgdad.taguchi import _merge_group_moments
 from dawgdad.control_charts import R
 import matplotlib.pyplot as plt
+from scipy.stats import beta, t
 import matplotlib.axes as axes
 import pandas as pd
 import numpy as np
@@ -247,11 +249,23 @@ class MSA:
         """
         raise NotImplementedError()
 
-    def variance_components(self):
+    def variance_components(
+        self,
+        operator_col: str = "Operator",
+        part_col: str = "Part"
+    ) -> pd.DataFrame:
         """
-        TODO
+        Variance components by the ANOVA method.
+
+        Returns
+        -------
+        pd.DataFrame
+            See MSAAccumulator.variance_components.
         """
-        raise NotImplementedError()
+        return MSAAccumulator(
+            operator_col=operator_col,
+            part_col=part_col
+        ).update(self.df).variance_components()
 
     def msa_gauge_rr_results(self):
         """
@@ -329,6 +343,691 @@ class MSA:
     # TODO: Gauge R&R
 
 
+class MSAAccumulator:
+    """
+    Sufficient statistics of a crossed gauge study, updated as data arrive.
+
+    The count, mean, and sum of squared deviations of the measurements of
+    each (Part, Operator) cell are kept and combined with the formulas of
+    Chan et al., which stay accurate when the spread is small relative to
+    the mean. update() adds new measurements in time proportional to the
+    new rows, merge() combines accumulators collected separately, e.g. at
+    different stations, and the ANOVA table and variance components are
+    calculated on demand from the cell statistics.
+
+    Parameters
+    ----------
+    operator_col : str = "Operator"
+        The name of the operator column.
+    part_col : str = "Part"
+        The name of the part column.
+    trial_cols : list[str] | None = None
+        The names of the measurement (trial) columns. If None, every numeric
+        column other than the operator and part columns is a trial.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> accumulator = dd.MSAAccumulator()
+    >>> operator_1 = pd.DataFrame({
+    ...     "Operator": [1, 1, 1],
+    ...     "Part": [1, 2, 3],
+    ...     "Y1": [10.1, 12.3, 9.8],
+    ...     "Y2": [10.2, 12.1, 9.9],
+    ... })
+    >>> operator_2 = pd.DataFrame({
+    ...     "Operator": [2, 2, 2],
+    ...     "Part": [1, 2, 3],
+    ...     "Y1": [10.4, 12.5, 10.1],
+    ...     "Y2": [10.3, 12.6, 10.0],
+    ... })
+    >>> components = accumulator.update(operator_1).variance_components()
+    >>> components = accumulator.update(operator_2).variance_components()
+    """
+    def __init__(
+        self,
+        operator_col: str = "Operator",
+        part_col: str = "Part",
+        trial_cols: list[str] | None = None
+    ):
+        self.operator_col = operator_col
+        self.part_col = part_col
+        self.trial_cols = trial_cols
+        self.cells = pd.DataFrame(
+            data={"n": [], "mean": [], "m2": []},
+            index=pd.MultiIndex.from_arrays(
+                [[], []], names=[part_col, operator_col]
+            )
+        )
+
+    @property
+    def n(self) -> int:
+        """
+        The number of measurements.
+        """
+        return int(self.cells["n"].sum())
+
+    def update(self, df: pd.DataFrame) -> "MSAAccumulator":
+        """
+        Add measurements.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            New rows with the Operator and Part columns and the trial
+            columns. Missing values are ignored.
+
+        Returns
+        -------
+        MSAAccumulator
+            This accumulator, updated.
+        """
+        keys = [self.part_col, self.operator_col]
+        if self.trial_cols is None:
+            trials = list(
+                df.drop(columns=keys).select_dtypes(include=np.number).columns
+            )
+        else:
+            trials = list(self.trial_cols)
+        values = df[keys + trials].melt(
+            id_vars=keys, value_vars=trials
+        ).dropna(subset=["value"])
+        moments = values.groupby(by=keys, sort=False)["value"].agg(
+            ["count", "mean", "var"]
+        )
+        n = moments["count"].astype("float64")
+        new = pd.DataFrame(
+            data={
+                "n": n,
+                "mean": moments["mean"],
+                "m2": moments["var"].fillna(0) * (n - 1),
+            }
+        )
+        self.cells = _merge_group_moments(left=self.cells, right=new)
+        return self
+
+    def merge(self, other: "MSAAccumulator") -> "MSAAccumulator":
+        """
+        Combine with another accumulator.
+
+        Parameters
+        ----------
+        other : MSAAccumulator
+            Statistics collected separately, with the same column names.
+
+        Returns
+        -------
+        MSAAccumulator
+            A new accumulator with the statistics of both.
+        """
+        merged = MSAAccumulator(
+            operator_col=self.operator_col,
+            part_col=self.part_col,
+            trial_cols=self.trial_cols
+        )
+        merged.cells = _merge_group_moments(
+            left=self.cells, right=other.cells
+        )
+        return merged
+
+    def anova_table(self) -> pd.DataFrame:
+        """
+        Two-way crossed ANOVA table with interaction.
+
+        The formulas are exact for a balanced study. For a study in progress
+        with unequal numbers of trials per cell they give provisional
+        results.
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows Part, Operator, Part * Operator, Repeatability, and Total,
+            with columns DF, SS, and MS.
+        """
+        cells = self.cells[self.cells["n"] > 0]
+        n = cells["n"].sum()
+        grand_mean = (cells["n"] * cells["mean"]).sum() / n
+        # sums of squares of centred cell means avoid the cancellation of
+        # raw sums of squares when the spread is small relative to the mean
+        deviation = pd.DataFrame(
+            data={
+                "n": cells["n"],
+                "weighted": cells["n"] * (cells["mean"] - grand_mean),
+            }
+        )
+        parts = deviation.groupby(level=self.part_col).sum()
+        operators = deviation.groupby(level=self.operator_col).sum()
+        ss_part = (parts["weighted"] ** 2 / parts["n"]).sum()
+        ss_operator = (operators["weighted"] ** 2 / operators["n"]).sum()
+        ss_cells = (deviation["weighted"] ** 2 / deviation["n"]).sum()
+        ss_interaction = ss_cells - ss_part - ss_operator
+        ss_error = cells["m2"].sum()
+        ss_total = ss_cells + ss_error
+        number_parts = len(parts)
+        number_operators = len(operators)
+        df_part = number_parts - 1
+        df_operator = number_operators - 1
+        df_interaction = df_part * df_operator
+        df_error = n - len(cells)
+        table = pd.DataFrame(
+            data={
+                "DF": [
+                    df_part, df_operator, df_interaction, df_error, n - 1
+                ],
+                "SS": [
+                    ss_part, ss_operator, ss_interaction, ss_error, ss_total
+                ],
+            },
+            index=[
+                "Part", "Operator", "Part * Operator", "Repeatability",
+                "Total"
+            ]
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            table["MS"] = table["SS"] / table["DF"]
+        table.loc["Total", "MS"] = np.nan
+        table["DF"] = table["DF"].astype("int64")
+        return table
+
+    def variance_components(self) -> pd.DataFrame:
+        """
+        Gauge R&R variance components by the ANOVA method.
+
+        Negative estimates are set to zero.
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows Total Gauge R&R, Repeatability, Reproducibility, Operator,
+            Part * Operator, Part-to-Part, and Total Variation, with columns
+            variance, % contribution, std dev, and % study var.
+        """
+        table = self.anova_table()
+        cells = self.cells[self.cells["n"] > 0]
+        number_parts = cells.index.get_level_values(self.part_col).nunique()
+        number_operators = cells.index.get_level_values(
+            self.operator_col
+        ).nunique()
+        trials = cells["n"].sum() / len(cells)
+        ms = table["MS"]
+        repeatability = ms["Repeatability"]
+        interaction = max(
+            0.0, (ms["Part * Operator"] - ms["Repeatability"]) / trials
+        )
+        operator = max(
+            0.0,
+            (ms["Operator"] - ms["Part * Operator"])
+            / (number_parts * trials)
+        )
+        part = max(
+            0.0,
+            (ms["Part"] - ms["Part * Operator"])
+            / (number_operators * trials)
+        )
+        reproducibility = operator + interaction
+        gauge = repeatability + reproducibility
+        total = gauge + part
+        variance = pd.Series(
+            data={
+                "Total Gauge R&R": gauge,
+                "Repeatability": repeatability,
+                "Reproducibility": reproducibility,
+                "Operator": operator,
+                "Part * Operator": interaction,
+                "Part-to-Part": part,
+                "Total Variation": total,
+            }
+        )
+        std_dev = np.sqrt(variance)
+        return pd.DataFrame(
+            data={
+                "variance": variance,
+                "% contribution": 100 * variance / total,
+                "std dev": std_dev,
+                "% study var": 100 * std_dev / std_dev["Total Variation"],
+            }
+        )
+
+
+def _fleiss_kappa(counts: np.ndarray) -> np.ndarray:
+    """
+    Fleiss kappa over the last two axes (subjects, categories) of counts.
+
+    Subjects rated fewer than two times are ignored.
+    """
+    counts = counts.astype(np.float64)
+    n = counts.sum(axis=-1)
+    rated = n >= 2
+    safe_n = np.where(rated, n, 2)
+    agreement = ((counts ** 2).sum(axis=-1) - n) / (safe_n * (safe_n - 1))
+    p_bar = (agreement * rated).sum(axis=-1) / rated.sum(axis=-1)
+    proportions = (counts * rated[..., np.newaxis]).sum(axis=-2)
+    proportions = proportions / proportions.sum(axis=-1, keepdims=True)
+    p_expected = (proportions ** 2).sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (p_bar - p_expected) / (1 - p_expected)
+
+
+def fleiss_kappa(*, counts: np.ndarray | pd.DataFrame) -> float:
+    """
+    Fleiss kappa for agreement among several ratings of each subject.
+
+    Parameters
+    ----------
+    counts : np.ndarray | pd.DataFrame
+        The number of ratings of each subject (rows) in each category
+        (columns).
+
+    Returns
+    -------
+    float
+        The Fleiss kappa.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import numpy as np
+    >>> counts = np.array([[3, 0], [0, 3], [2, 1], [3, 0]])
+    >>> kappa = dd.fleiss_kappa(counts=counts)
+    """
+    return float(_fleiss_kappa(np.asarray(counts)))
+
+
+def _cohen_kappa(confusion: np.ndarray) -> np.ndarray:
+    """
+    Cohen kappa over the last two axes of a (..., K, K) confusion array.
+    """
+    confusion = confusion.astype(np.float64)
+    total = confusion.sum(axis=(-2, -1))
+    observed = np.trace(confusion, axis1=-2, axis2=-1) / total
+    expected = (
+        confusion.sum(axis=-1) * confusion.sum(axis=-2)
+    ).sum(axis=-1) / total ** 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (observed - expected) / (1 - expected)
+
+
+def cohen_kappa(
+    *,
+    rater1: pd.Series | np.ndarray,
+    rater2: pd.Series | np.ndarray
+) -> float:
+    """
+    Cohen kappa for agreement between two sets of ratings of the same items.
+
+    Items with a missing rating are dropped.
+
+    Parameters
+    ----------
+    rater1 : pd.Series | np.ndarray
+        The ratings of the first rater (or the appraiser).
+    rater2 : pd.Series | np.ndarray
+        The ratings of the second rater (or the standard).
+
+    Returns
+    -------
+    float
+        The Cohen kappa.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> kappa = dd.cohen_kappa(
+    ...     rater1=["pass", "fail", "pass", "pass"],
+    ...     rater2=["pass", "fail", "fail", "pass"]
+    ... )
+    """
+    codes, categories = pd.factorize(
+        pd.concat(
+            [pd.Series(rater1, dtype=object), pd.Series(rater2, dtype=object)],
+            ignore_index=True
+        )
+    )
+    size = len(categories)
+    first, second = np.split(codes, 2)
+    rated = (first >= 0) & (second >= 0)
+    first, second = first[rated], second[rated]
+    confusion = np.bincount(
+        first * size + second, minlength=size * size
+    ).reshape(size, size)
+    return float(_cohen_kappa(confusion))
+
+
+def _agreement_table(
+    *,
+    inspected: np.ndarray,
+    matched: np.ndarray,
+    alpha: float
+) -> pd.DataFrame:
+    """
+    Percent agreement with Clopper-Pearson confidence intervals.
+    """
+    inspected = np.asarray(inspected, dtype=np.int64)
+    matched = np.asarray(matched, dtype=np.int64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        lower = np.where(
+            matched > 0,
+            beta.ppf(alpha / 2, matched, inspected - matched + 1),
+            0.0
+        )
+        upper = np.where(
+            matched < inspected,
+            beta.ppf(1 - alpha / 2, matched + 1, inspected - matched),
+            1.0
+        )
+        percent = matched / inspected
+    return pd.DataFrame(
+        data={
+            "inspected": inspected,
+            "matched": matched,
+            "percent": 100 * percent,
+            "ci_lower": 100 * lower,
+            "ci_upper": 100 * upper,
+        }
+    )
+
+
+def attribute_agreement(
+    *,
+    df: pd.DataFrame,
+    part: str = "Part",
+    appraiser: str = "Operator",
+    rating: str = "Rating",
+    standard: str | None = None,
+    alpha: float = 0.05,
+) -> tuple[
+    pd.DataFrame, pd.DataFrame | None, pd.DataFrame, pd.DataFrame | None
+]:
+    """
+    Attribute agreement analysis of pass/fail or nominal ratings.
+
+    Each row of df is one rating of one part by one appraiser. Repeated
+    ratings of a part by an appraiser are trials. The counts of ratings per
+    appraiser, part, and category come from one np.bincount, so studies with
+    many appraisers and parts are summarized without loops. Rows with a
+    missing part, appraiser, rating, or standard are dropped.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The ratings in long format.
+    part : str = "Part"
+        The name of the part column.
+    appraiser : str = "Operator"
+        The name of the appraiser column.
+    rating : str = "Rating"
+        The name of the rating column.
+    standard : str | None = None
+        The name of the column with the known (reference) rating of each
+        part, if there is one.
+    alpha : float = 0.05
+        The alpha value for the exact binomial confidence intervals of the
+        percent agreement.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, pd.DataFrame | None, pd.DataFrame, pd.DataFrame | None]
+        A tuple of four tables. Each has inspected, matched, percent,
+        ci_lower, and ci_upper; all but the last also have kappa.
+
+        - within_appraiser : pd.DataFrame
+            One row per appraiser. A part matches when all the trials of the
+            appraiser agree. kappa is the Fleiss kappa among trials.
+        - appraiser_vs_standard : pd.DataFrame | None
+            One row per appraiser. A part matches when all the trials of the
+            appraiser agree with the standard. kappa is the Cohen kappa of
+            the ratings versus the standard.
+        - between_appraisers : pd.DataFrame
+            One row. A part matches when all the ratings of all appraisers
+            agree. kappa is the Fleiss kappa among all ratings.
+        - all_vs_standard : pd.DataFrame | None
+            One row. A part matches when all the ratings of all appraisers
+            agree with the standard.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({
+    ...     "Part": [1, 1, 2, 2, 1, 1, 2, 2],
+    ...     "Operator": ["A", "A", "A", "A", "B", "B", "B", "B"],
+    ...     "Rating": ["pass", "pass", "fail", "fail",
+    ...                "pass", "fail", "fail", "fail"],
+    ...     "Standard": ["pass", "pass", "fail", "fail",
+    ...                  "pass", "pass", "fail", "fail"],
+    ... })
+    >>> (
+    ...     within, versus_standard, between, all_versus_standard
+    ... ) = dd.attribute_agreement(df=df, standard="Standard")
+    """
+    columns = [rating] if standard is None else [rating, standard]
+    df = df.dropna(subset=[part, appraiser, *columns])
+    part_codes, parts = pd.factorize(df[part])
+    appraiser_codes, appraisers = pd.factorize(df[appraiser])
+    category_codes, categories = pd.factorize(
+        pd.concat([df[column] for column in columns], ignore_index=True)
+    )
+    rating_codes = category_codes[:len(df)]
+    number_parts = len(parts)
+    number_appraisers = len(appraisers)
+    number_categories = len(categories)
+    counts = np.bincount(
+        (appraiser_codes * number_parts + part_codes) * number_categories
+        + rating_codes,
+        minlength=number_appraisers * number_parts * number_categories
+    ).reshape(number_appraisers, number_parts, number_categories)
+    ratings_per_part = counts.sum(axis=-1)
+    rated = ratings_per_part > 0
+    within = _agreement_table(
+        inspected=rated.sum(axis=1),
+        matched=(
+            rated & (counts.max(axis=-1) == ratings_per_part)
+        ).sum(axis=1),
+        alpha=alpha
+    )
+    within["kappa"] = _fleiss_kappa(counts)
+    within.index = pd.Index(appraisers, name=appraiser)
+    all_counts = counts.sum(axis=0)
+    all_ratings = all_counts.sum(axis=-1)
+    all_rated = all_ratings > 0
+    between = _agreement_table(
+        inspected=[all_rated.sum()],
+        matched=[(all_rated & (all_counts.max(axis=-1) == all_ratings)).sum()],
+        alpha=alpha
+    )
+    between["kappa"] = _fleiss_kappa(all_counts)
+    if standard is None:
+        return (within, None, between, None)
+    standard_codes = category_codes[len(df):]
+    part_standard = np.full(number_parts, -1)
+    part_standard[part_codes] = standard_codes
+    correct = np.take_along_axis(
+        counts,
+        np.broadcast_to(
+            part_standard, (number_appraisers, number_parts)
+        )[..., np.newaxis],
+        axis=-1
+    )[..., 0]
+    versus_standard = _agreement_table(
+        inspected=rated.sum(axis=1),
+        matched=(rated & (correct == ratings_per_part)).sum(axis=1),
+        alpha=alpha
+    )
+    confusion = np.bincount(
+        (appraiser_codes * number_categories + rating_codes)
+        * number_categories + standard_codes,
+        minlength=number_appraisers * number_categories ** 2
+    ).reshape(number_appraisers, number_categories, number_categories)
+    versus_standard["kappa"] = _cohen_kappa(confusion)
+    versus_standard.index = pd.Index(appraisers, name=appraiser)
+    all_correct = np.take_along_axis(
+        all_counts, part_standard[:, np.newaxis], axis=-1
+    )[:, 0]
+    all_versus_standard = _agreement_table(
+        inspected=[all_rated.sum()],
+        matched=[(all_rated & (all_correct == all_ratings)).sum()],
+        alpha=alpha
+    )
+    return (within, versus_standard, between, all_versus_standard)
+
+
+def gauge_study(
+    *,
+    df: pd.DataFrame,
+    tolerance: float | int | pd.Series,
+    gauge: str = "Gauge",
+    reference: str = "Reference",
+    measurement: str = "Measurement",
+    percent_tolerance: float | int = 20,
+    sigma_multiple: float | int = 6,
+) -> pd.DataFrame:
+    """
+    Type-1 gauge study and bias and linearity study of many gauges.
+
+    Each row of df is one measurement of a reference part of known value by
+    one gauge. The bias of a measurement is the measurement minus the
+    reference value. The statistics of every gauge come from grouped sums
+    of the reference values, the biases, and the squares and cross products
+    of their deviations from the averages, so a fleet of gauges is studied
+    in a few grouped passes.
+
+    The repeatability of a gauge is the standard deviation of its
+    measurements pooled within reference parts. A gauge measured on one
+    reference part is a Type-1 study; the linearity columns then are NaN.
+
+    Cg = (percent_tolerance / 100 * tolerance) / (sigma_multiple * s)
+    Cgk = (percent_tolerance / 200 * tolerance - |bias|) /
+    (sigma_multiple / 2 * s)
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The measurements in long format.
+    tolerance : float | int | pd.Series
+        The width of the specification, USL - LSL. A Series gives the
+        tolerance of each gauge, indexed by gauge.
+    gauge : str = "Gauge"
+        The name of the gauge column.
+    reference : str = "Reference"
+        The name of the reference value column.
+    measurement : str = "Measurement"
+        The name of the measurement column.
+    percent_tolerance : float | int = 20
+        The percentage of the tolerance used in Cg and Cgk.
+    sigma_multiple : float | int = 6
+        The number of standard deviations of the gauge spread used in Cg
+        and Cgk.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per gauge with columns:
+
+        - n, n_references : the numbers of measurements and references
+        - bias, std_devn : the average bias and the repeatability
+        - bias_t, bias_p : the t test of bias = 0
+        - cg, cgk : the gauge capability indices
+        - intercept, slope, r_squared, slope_p : the regression of bias on
+          reference value, and the t test of slope = 0
+        - linearity, percent_linearity : |slope| * tolerance, and
+          100 * |slope|
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({
+    ...     "Gauge": ["G1"] * 6 + ["G2"] * 6,
+    ...     "Reference": [2, 2, 4, 4, 6, 6] * 2,
+    ...     "Measurement": [
+    ...         2.01, 2.02, 4.00, 4.03, 6.05, 6.04,
+    ...         1.98, 2.00, 4.01, 3.99, 6.00, 6.02
+    ...     ],
+    ... })
+    >>> study = dd.gauge_study(df=df, tolerance=1)
+    """
+    x = df[reference].astype("float64")
+    d = df[measurement].astype("float64") - x
+    keys = df[gauge]
+    # the sums of squares are accumulated on deviations from the averages
+    # of each gauge and of each cell (gauge, reference), which keeps them
+    # accurate when the reference values are large compared with the spread
+    x_centred = x - x.groupby(keys).transform("mean")
+    d_centred = d - d.groupby(keys).transform("mean")
+    d_within = d - d.groupby([keys, x]).transform("mean")
+    work = pd.DataFrame({
+        gauge: keys,
+        "x": x,
+        "d": d,
+        "xx": x_centred * x_centred,
+        "dd": d_centred * d_centred,
+        "xd": x_centred * d_centred,
+        "ss": d_within * d_within,
+    })
+    sums = work.groupby(gauge, sort=True).agg(
+        n=("d", "count"),
+        n_references=("x", "nunique"),
+        x=("x", "sum"),
+        d=("d", "sum"),
+        xx=("xx", "sum"),
+        dd=("dd", "sum"),
+        xd=("xd", "sum"),
+        ss=("ss", "sum"),
+    )
+    n = sums["n"].to_numpy(dtype="float64")
+    n_references = sums["n_references"].to_numpy(dtype="float64")
+    if isinstance(tolerance, pd.Series):
+        width = tolerance.reindex(sums.index).to_numpy(dtype="float64")
+    else:
+        width = np.full(n.shape, float(tolerance))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        df_within = n - n_references
+        ss_within = sums["ss"].to_numpy()
+        std_devn = np.sqrt(ss_within / df_within)
+        bias = sums["d"].to_numpy() / n
+        bias_t = bias / (std_devn / np.sqrt(n))
+        bias_p = 2 * t.sf(np.abs(bias_t), df_within)
+        cg = percent_tolerance / 100 * width / (sigma_multiple * std_devn)
+        cgk = (percent_tolerance / 200 * width - np.abs(bias)) / (
+            sigma_multiple / 2 * std_devn
+        )
+        x_mean = sums["x"].to_numpy() / n
+        sxx = sums["xx"].to_numpy()
+        sxd = sums["xd"].to_numpy()
+        sdd = sums["dd"].to_numpy()
+        slope = np.where(n_references > 1, sxd / sxx, np.nan)
+        intercept = bias - slope * x_mean
+        ss_residual = np.maximum(sdd - slope * sxd, 0)
+        r_squared = 1 - ss_residual / sdd
+        slope_t = slope / np.sqrt(ss_residual / (n - 2) / sxx)
+        slope_p = 2 * t.sf(np.abs(slope_t), n - 2)
+    return pd.DataFrame(
+        data={
+            "n": sums["n"].to_numpy(),
+            "n_references": sums["n_references"].to_numpy(),
+            "bias": bias,
+            "std_devn": std_devn,
+            "bias_t": bias_t,
+            "bias_p": bias_p,
+            "cg": cg,
+            "cgk": cgk,
+            "intercept": intercept,
+            "slope": slope,
+            "r_squared": r_squared,
+            "slope_p": slope_p,
+            "linearity": np.abs(slope) * width,
+            "percent_linearity": 100 * np.abs(slope),
+        },
+        index=sums.index
+    )
+
+
 __all__ = (
+    'attribute_agreement',
+    'MSAAccumulator',
+    'fleiss_kappa',
+    'cohen_kappa',
+    'gauge_study',
     'MSA',
 )
@@ -2,19 +2,27 @@
 Data munging
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from shutil import copytree, move, rmtree
 from tkinter import filedialog
-from typing import Pattern
+from typing import Iterable, Iterator, Pattern
+from collections import deque
 from pathlib import Path
 from tkinter import Tk
 import psutil
 import string
 import sys
 
-from dawgdad import random_data, timedelta_data, datetime_data
+from dawgdad import (
+    datetime_sequence, timedelta_sequence, random_data, timedelta_data,
+    datetime_data
+)
 from pandas.api.types import CategoricalDtype
 from beautifultable import BeautifulTable
+import pyarrow.parquet as pq
 import pyarrow.feather as ft
+import pyarrow.csv as pv
+import pyarrow as pa
 from scipy.stats import norm
 import pandas as pd
 import numpy as np
@@ -1582,6 +1590,230 @@ def create_dataframe_norm(
     return df
 
 
+def _dataframe_chunk(
+    task: tuple[int, int, np.random.SeedSequence, float]
+) -> pd.DataFrame:
+    """
+    One chunk of create_dataframe_chunks(), for a process pool.
+    """
+    start, rows, seed, fraction_nan = task
+    rng = np.random.default_rng(seed=seed)
+    origin = pd.Timestamp("2020-01-01") + pd.Timedelta(seconds=start)
+    strings = random_data(distribution="strings", size=rows, random_state=rng)
+    df = pd.DataFrame(
+        {
+            "a": random_data(
+                distribution="uniform",
+                size=rows,
+                loc=13,
+                scale=70,
+                random_state=rng
+            ),
+            "b": random_data(distribution="bool", size=rows, random_state=rng),
+            "bn": random_data(
+                distribution="boolean",
+                size=rows,
+                fraction_nan=fraction_nan,
+                random_state=rng
+            ),
+            "c": random_data(
+                distribution="category",
+                size=rows,
+                categories=["blue", "white", "red"],
+                random_state=rng
+            ),
+            "cs": random_data(
+                distribution="categories",
+                size=rows,
+                categories=["small", "medium", "large"],
+                random_state=rng
+            ),
+            "d": timedelta_sequence(
+                periods=rows,
+                start=pd.Timedelta(seconds=start),
+                freq="1s",
+                unit="s"
+            ),
+            "i": random_data(
+                distribution="randint", size=rows, random_state=rng
+            ),
+            "r": random_data(
+                distribution="strings",
+                strings=["0", "1"],
+                size=rows,
+                random_state=rng
+            ),
+            "s": strings.mask(rng.random(size=rows) < fraction_nan),
+            "t": datetime_sequence(
+                periods=rows, start=origin, freq="1s", unit="s"
+            ),
+            "u": datetime_sequence(
+                periods=rows,
+                start=origin,
+                freq="1s",
+                jitter="250ms",
+                unit="ms",
+                random_state=rng
+            ),
+            "x": random_data(distribution="norm", size=rows, random_state=rng),
+            "y": random_data(
+                distribution="randint", size=rows, random_state=rng
+            ),
+            "yn": random_data(
+                distribution="randInt",
+                size=rows,
+                fraction_nan=fraction_nan,
+                random_state=rng
+            ),
+            "z": random_data(
+                distribution="uniform", size=rows, random_state=rng
+            ),
+        }
+    )
+    df.index = pd.RangeIndex(start=start, stop=start + rows)
+    return df
+
+
+def create_dataframe_chunks(
+    *,
+    size: int,
+    chunk_size: int = 1_000_000,
+    fraction_nan: float = 0.13,
+    random_state: int | None = None,
+    max_workers: int | None = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Create a large DataFrame of mixed dtypes in chunks.
+
+    The chunks have the columns and dtypes of create_dataframe(). Each chunk
+    is drawn from its own stream spawned from one SeedSequence, so the data
+    are the same for any max_workers. With workers, at most max_workers
+    chunks are generated ahead of the one being consumed, which bounds the
+    memory used.
+
+    Parameters
+    ----------
+    size : int
+        The total number of rows.
+    chunk_size : int = 1_000_000
+        The number of rows of each chunk, except the last.
+    fraction_nan : float = 0.13
+        The probability of each cell of bn, s, and yn being missing.
+    random_state : int | None = None
+        The random number seed.
+    max_workers : int | None = None
+        The number of processes generating chunks. None generates them in
+        this process as they are consumed.
+
+    Yields
+    ------
+    pd.DataFrame
+        The chunks, indexed by the position of their rows in the whole. The
+        timedelta column d and the datetime columns t and u are in steps of
+        one second across all chunks; u has a jitter of up to 250 ms and
+        millisecond resolution. Strings in s are also missing.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> for df in dd.create_dataframe_chunks(
+    ...     size=10_000_000, random_state=42
+    ... ): # doctest: +SKIP
+    ...     print(df.shape)
+    """
+    seeds = np.random.SeedSequence(entropy=random_state)
+    starts = range(0, size, chunk_size)
+    tasks = (
+        (start, min(chunk_size, size - start), seed, fraction_nan)
+        for start, seed in zip(starts, seeds.spawn(len(starts)))
+    )
+    if not max_workers:
+        for task in tasks:
+            yield _dataframe_chunk(task)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(_dataframe_chunk, task))
+            if len(pending) > max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def save_dataframe_chunks(
+    *,
+    chunks: Iterable[pd.DataFrame],
+    file_name: str | Path,
+    index: bool = False
+) -> int:
+    """
+    Save DataFrame chunks to one file, one chunk at a time.
+
+    Each chunk is converted to an Arrow table and appended, so memory is
+    bounded by the size of a chunk. A parquet file gets one row group per
+    chunk, a feather file (Arrow IPC, lz4 compressed) one record batch per
+    chunk, and a CSV file one header. The chunks must have the same
+    columns and dtypes.
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        The DataFrames, e.g. from create_dataframe_chunks().
+    file_name : str | Path
+        The file, with suffix .parquet, .feather, or .csv.
+    index : bool = False
+        If True, save the index as a column.
+
+    Returns
+    -------
+    int
+        The number of rows saved.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> rows = dd.save_dataframe_chunks(
+    ...     chunks=dd.create_dataframe_chunks(
+    ...         size=100_000_000, random_state=42, max_workers=8
+    ...     ),
+    ...     file_name="synthetic.parquet"
+    ... ) # doctest: +SKIP
+    """
+    file_name = Path(file_name)
+    suffix = file_name.suffix.lower()
+    if suffix not in (".parquet", ".feather", ".csv"):
+        raise ValueError("file_name must end in .parquet, .feather, or .csv.")
+    writer = None
+    rows = 0
+    try:
+        for df in chunks:
+            table = pa.Table.from_pandas(df=df, preserve_index=index)
+            if writer is None:
+                schema = table.schema
+                match suffix:
+                    case ".parquet":
+                        writer = pq.ParquetWriter(
+                            where=file_name, schema=schema
+                        )
+                    case ".feather":
+                        writer = pa.ipc.new_file(
+                            sink=str(file_name),
+                            schema=schema,
+                            options=pa.ipc.IpcWriteOptions(compression="lz4")
+                        )
+                    case ".csv":
+                        writer = pv.CSVWriter(
+                            sink=str(file_name), schema=schema
+                        )
+            writer.write_table(table.cast(schema))
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
 def delete_rows(
     *,
     df: pd.DataFrame,
@@ -3187,6 +3419,8 @@ __all__ = (
     "find_int_float_columns",
     "find_timedelta_columns",
     "optimize_float_columns",
+    "create_dataframe_chunks",
+    "save_dataframe_chunks",
     "create_dataframe_norm",
     "replace_column_values",
     "feature_percent_empty",
@@ -0,0 +1,285 @@
+"""
+Power and sample size of t tests
+
+- Power of one-sample, paired, and two-sample t tests over arrays of
+  effect sizes, sample sizes, and significance levels
+- Sample size for a target power
+- Power curve tables for planning
+"""
+
+from scipy.stats import nct, t
+import pandas as pd
+import numpy as np
+
+
+_POWER_CACHE: dict[tuple[str, float, float, float, float], float] = {}
+_POWER_CACHE_SIZE = 1_000_000
+
+
+def _noncentral_t_power(
+    *,
+    effect_size: np.ndarray,
+    nobs: np.ndarray,
+    dof: np.ndarray,
+    alpha: np.ndarray,
+    alternative: str
+) -> np.ndarray:
+    """
+    Power from the noncentral t distribution, as statsmodels ttest_power.
+
+    The lower tail is the upper tail of the reflected distribution, because
+    nct.cdf returns NaN far in the tails where nct.sf does not.
+    """
+    noncentrality = effect_size * np.sqrt(nobs)
+    match alternative:
+        case "two-sided":
+            return (
+                nct.sf(t.isf(alpha / 2, dof), dof, noncentrality)
+                + nct.sf(t.isf(alpha / 2, dof), dof, -noncentrality)
+            )
+        case "greater":
+            return nct.sf(t.isf(alpha, dof), dof, noncentrality)
+        case "less":
+            return nct.sf(t.isf(alpha, dof), dof, -noncentrality)
+        case _:
+            raise ValueError(
+                'alternative must be "two-sided", "less", or "greater".'
+            )
+
+
+def _nobs_dof(
+    n: np.ndarray,
+    ratio: float | np.ndarray | None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Effective number of observations and degrees of freedom.
+    """
+    if ratio is None:
+        return (n, n - 1)
+    n2 = n * ratio
+    return (1 / (1 / n + 1 / n2), n + n2 - 2)
+
+
+def t_test_power(
+    *,
+    effect_size: float | np.ndarray,
+    n: float | np.ndarray,
+    alpha: float | np.ndarray = 0.05,
+    alternative: str = "two-sided",
+    ratio: float | np.ndarray | None = None
+) -> float | np.ndarray:
+    """
+    Power of a t test.
+
+    The arguments are broadcast together and the power of all the
+    combinations is calculated with one evaluation of the noncentral t
+    distribution. Repeated combinations are calculated once, and results
+    are memoized across calls.
+
+    Parameters
+    ----------
+    effect_size : float | np.ndarray
+        The standardized effect size, the difference of averages divided by
+        the standard deviation.
+    n : float | np.ndarray
+        The sample size, or the size of sample 1 of a two-sample test.
+    alpha : float | np.ndarray = 0.05
+        The significance level.
+    alternative : str = "two-sided"
+        "two-sided", "less", or "greater".
+    ratio : float | np.ndarray | None = None
+        None for a one-sample or paired t test. For a two-sample t test
+        with pooled variance, the size of sample 2 divided by the size of
+        sample 1.
+
+    Returns
+    -------
+    float | np.ndarray
+        The power, with the broadcast shape of the arguments.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import numpy as np
+    >>> power = dd.t_test_power(
+    ...     effect_size=np.array([0.2, 0.5, 0.8]),
+    ...     n=np.array([[10], [30], [100]]),
+    ...     ratio=1
+    ... )
+    """
+    effect_size, n, alpha, ratio_ = np.broadcast_arrays(
+        np.asarray(effect_size, dtype="float64"),
+        np.asarray(n, dtype="float64"),
+        np.asarray(alpha, dtype="float64"),
+        np.asarray(np.nan if ratio is None else ratio, dtype="float64"),
+    )
+    shape = effect_size.shape
+    nobs, dof = _nobs_dof(
+        n=n.ravel(), ratio=None if ratio is None else ratio_.ravel()
+    )
+    keys = np.column_stack((effect_size.ravel(), nobs, dof, alpha.ravel()))
+    unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+    power = np.array([
+        _POWER_CACHE.get((alternative, *key), np.nan)
+        for key in unique.tolist()
+    ])
+    missing = np.isnan(power)
+    if missing.any():
+        power[missing] = _noncentral_t_power(
+            effect_size=unique[missing, 0],
+            nobs=unique[missing, 1],
+            dof=unique[missing, 2],
+            alpha=unique[missing, 3],
+            alternative=alternative
+        )
+        if len(_POWER_CACHE) > _POWER_CACHE_SIZE:
+            _POWER_CACHE.clear()
+        _POWER_CACHE.update(
+            zip(
+                [(alternative, *key) for key in unique[missing].tolist()],
+                power[missing].tolist()
+            )
+        )
+    power = power[inverse.ravel()].reshape(shape)
+    return power if shape else float(power)
+
+
+def t_test_sample_size(
+    *,
+    effect_size: float | np.ndarray,
+    power: float | np.ndarray = 0.8,
+    alpha: float | np.ndarray = 0.05,
+    alternative: str = "two-sided",
+    ratio: float | None = None,
+    n_max: int = 1_000_000,
+    iterations: int = 60
+) -> float | np.ndarray:
+    """
+    Smallest sample size that reaches a power.
+
+    The sample sizes of all the combinations of the arguments are found by
+    one vectorized bisection on the continuous sample size, rounded up.
+
+    Parameters
+    ----------
+    effect_size : float | np.ndarray
+        The standardized effect size. It is positive for "greater" and
+        "two-sided" and negative for "less".
+    power : float | np.ndarray = 0.8
+        The target power.
+    alpha : float | np.ndarray = 0.05
+        The significance level.
+    alternative : str = "two-sided"
+        "two-sided", "less", or "greater".
+    ratio : float | None = None
+        None for a one-sample or paired t test, else the size of sample 2
+        divided by the size of sample 1.
+    n_max : int = 1_000_000
+        The largest sample size searched. Larger sample sizes are NaN.
+    iterations : int = 60
+        The number of bisection steps.
+
+    Returns
+    -------
+    float | np.ndarray
+        The sample size, or the size of sample 1 of a two-sample test.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> n = dd.t_test_sample_size(effect_size=0.5, power=0.8)
+    >>> n
+    34.0
+    """
+    effect_size, target, alpha = np.broadcast_arrays(
+        np.asarray(effect_size, dtype="float64"),
+        np.asarray(power, dtype="float64"),
+        np.asarray(alpha, dtype="float64"),
+    )
+    low = np.full(effect_size.shape, 2.0)
+    high = np.full(effect_size.shape, float(n_max))
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        nobs, dof = _nobs_dof(n=middle, ratio=ratio)
+        enough = _noncentral_t_power(
+            effect_size=effect_size,
+            nobs=nobs,
+            dof=dof,
+            alpha=alpha,
+            alternative=alternative
+        ) >= target
+        high = np.where(enough, middle, high)
+        low = np.where(enough, low, middle)
+    n = np.ceil(high - 1e-9)
+    nobs, dof = _nobs_dof(n=np.full(n.shape, float(n_max)), ratio=ratio)
+    reachable = _noncentral_t_power(
+        effect_size=effect_size,
+        nobs=nobs,
+        dof=dof,
+        alpha=alpha,
+        alternative=alternative
+    ) >= target
+    n = np.where(reachable, n, np.nan)
+    return n if n.shape else float(n)
+
+
+def power_curve_table(
+    *,
+    effect_sizes: list[float] | np.ndarray,
+    sample_sizes: list[int] | np.ndarray,
+    alpha: float = 0.05,
+    alternative: str = "two-sided",
+    ratio: float | None = None
+) -> pd.DataFrame:
+    """
+    Power of every combination of effect size and sample size.
+
+    Parameters
+    ----------
+    effect_sizes : list[float] | np.ndarray
+        The standardized effect sizes, the columns of the table.
+    sample_sizes : list[int] | np.ndarray
+        The sample sizes, the rows of the table.
+    alpha : float = 0.05
+        The significance level.
+    alternative : str = "two-sided"
+        "two-sided", "less", or "greater".
+    ratio : float | None = None
+        None for a one-sample or paired t test, else the size of sample 2
+        divided by the size of sample 1.
+
+    Returns
+    -------
+    pd.DataFrame
+        The power, with the sample sizes as the index and the effect sizes
+        as the columns.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> table = dd.power_curve_table(
+    ...     effect_sizes=[0.2, 0.5, 0.8],
+    ...     sample_sizes=[10, 20, 50, 100]
+    ... )
+    """
+    effect_sizes = np.asarray(effect_sizes)
+    sample_sizes = np.asarray(sample_sizes)
+    power = t_test_power(
+        effect_size=effect_sizes[np.newaxis, :],
+        n=sample_sizes[:, np.newaxis],
+        alpha=alpha,
+        alternative=alternative,
+        ratio=ratio
+    )
+    return pd.DataFrame(
+        data=power,
+        index=pd.Index(sample_sizes, name="n"),
+        columns=pd.Index(effect_sizes, name="effect size")
+    )
+
+
+__all__ = (
+    "t_test_sample_size",
+    "power_curve_table",
+    "t_test_power",
+)
@@ -8,9 +8,15 @@ standard (specification). A process is capable if you have:
 - Process is on target with minimum dispersion.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import hashlib
+import numbers
+import json
 import math
 
-from scipy.stats import chi2, norm
+from scipy.stats import boxcox_normmax, chi2, johnsonsu, norm
+from scipy.special import boxcox as boxcox_transform
 import pandas as pd
 import numpy as np
 
@@ -506,7 +512,443 @@ def ppk(
     return (capability, ppk_lower, ppk_upper, lower_bound, upper_bound)
 
 
+def _fingerprint(values: np.ndarray) -> str:
+    """
+    Hash the bytes of a float64 array.
+    """
+    return hashlib.blake2b(
+        np.ascontiguousarray(values, dtype=np.float64).tobytes(),
+        digest_size=16
+    ).hexdigest()
+
+
+class TransformCache:
+    """
+    Fitted normalizing transforms keyed by characteristic and data fingerprint.
+
+    An entry records the method, the number of values used for the fit, the
+    fingerprint of those values, and the fitted parameters. An entry is
+    reused when the same method is requested and the first n values of the
+    data have the same fingerprint, i.e. for the same data or for data that
+    were appended to since the fit.
+
+    Parameters
+    ----------
+    path : Path | str | None = None
+        The JSON file used to persist the cache between runs. It is read if
+        it exists.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> cache = dd.TransformCache(path="transforms.json")
+    >>> result = dd.nonnormal_capability(
+    ...     df=df,
+    ...     lower_spec=1,
+    ...     upper_spec=9,
+    ...     cache=cache
+    ... ) # doctest: +SKIP
+    >>> cache.save() # doctest: +SKIP
+    """
+    def __init__(self, path: Path | str | None = None):
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[str, dict] = {}
+        if self.path is not None and self.path.exists():
+            self._entries = json.loads(self.path.read_text())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        *,
+        key: str,
+        values: np.ndarray,
+        method: str
+    ) -> dict | None:
+        """
+        Return the cached parameters for key, or None if they do not apply.
+        """
+        entry = self._entries.get(str(key))
+        if (
+            entry is None
+            or entry["method"] != method
+            or entry["n"] > values.size
+            or _fingerprint(values[:entry["n"]]) != entry["fingerprint"]
+        ):
+            return None
+        return entry["params"]
+
+    def put(
+        self,
+        *,
+        key: str,
+        values: np.ndarray,
+        method: str,
+        params: dict
+    ) -> None:
+        """
+        Store the parameters fitted on values for key.
+        """
+        self._entries[str(key)] = {
+            "method": method,
+            "n": int(values.size),
+            "fingerprint": _fingerprint(values),
+            "params": params,
+        }
+
+    def save(self, path: Path | str | None = None) -> None:
+        """
+        Write the cache to a JSON file.
+        """
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("A path is required to save the cache.")
+        path.write_text(json.dumps(self._entries))
+
+
+def fit_normalizing_transform(
+    *,
+    values: np.ndarray | pd.Series,
+    method: str = "boxcox"
+) -> dict:
+    """
+    Fit a transform that makes the data approximately normal.
+
+    Parameters
+    ----------
+    values : np.ndarray | pd.Series
+        The data, without missing values.
+    method : str = "boxcox"
+        "boxcox" for the Box-Cox power transform (data must be > 0) or
+        "johnson" for the Johnson SU transform.
+
+    Returns
+    -------
+    dict
+        The fitted parameters, "lmbda" for Box-Cox, "a", "b", "loc", "scale"
+        for Johnson SU.
+
+    Example
+    -------
+    >>> from scipy import stats
+    >>> import dawgdad as dd
+    >>> values = stats.lognorm.rvs(s=0.5, size=100, random_state=42)
+    >>> params = dd.fit_normalizing_transform(values=values)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    match method:
+        case "boxcox":
+            if (values <= 0).any():
+                raise ValueError("Box-Cox requires data > 0.")
+            return {"lmbda": float(boxcox_normmax(values, method="mle"))}
+        case "johnson":
+            a, b, loc, scale = johnsonsu.fit(values)
+            return {
+                "a": float(a), "b": float(b),
+                "loc": float(loc), "scale": float(scale)
+            }
+        case _:
+            raise ValueError(f"Transform {method} is not implemented.")
+
+
+def apply_normalizing_transform(
+    *,
+    values: np.ndarray | pd.Series | float,
+    method: str,
+    params: dict
+) -> np.ndarray:
+    """
+    Transform values with parameters from fit_normalizing_transform.
+
+    Both transforms are increasing, so specification limits keep their
+    order once transformed.
+
+    Parameters
+    ----------
+    values : np.ndarray | pd.Series | float
+        The data or specification limits.
+    method : str
+        "boxcox" or "johnson".
+    params : dict
+        The fitted parameters.
+
+    Returns
+    -------
+    np.ndarray
+        The transformed values.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    match method:
+        case "boxcox":
+            return boxcox_transform(values, params["lmbda"])
+        case "johnson":
+            return params["a"] + params["b"] * np.arcsinh(
+                (values - params["loc"]) / params["scale"]
+            )
+        case _:
+            raise ValueError(f"Transform {method} is not implemented.")
+
+
+def _per_column(
+    *,
+    value: float | int | dict | pd.Series,
+    columns: list[str]
+) -> pd.Series:
+    """
+    Broadcast a specification value to one value per column.
+    """
+    if isinstance(value, numbers.Real):
+        return pd.Series(float(value), index=columns)
+    return pd.Series(value, dtype="float64").reindex(columns)
+
+
+def _fit_column(args: tuple[np.ndarray, str]) -> dict:
+    """
+    Process pool helper for fit_normalizing_transform.
+    """
+    values, method = args
+    return fit_normalizing_transform(values=values, method=method)
+
+
+def nonnormal_capability(
+    *,
+    df: pd.DataFrame,
+    lower_spec: float | int | dict | pd.Series,
+    upper_spec: float | int | dict | pd.Series,
+    method: str = "boxcox",
+    cache: TransformCache | None = None,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """
+    Pp and Ppk for non-normal characteristics.
+
+    Each column of df is a characteristic. With method "boxcox" or "johnson",
+    the data and the specification limits are transformed to normality and
+    Pp and Ppk are calculated on the transformed scale. With method
+    "percentile", the 0.135, 50, and 99.865 percentiles replace the average
+    and the three-sigma limits (Clements method).
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The data, one column per characteristic. Missing values are ignored.
+    lower_spec : float | int | dict | pd.Series
+        The lower specification value, a single value or one per column.
+    upper_spec : float | int | dict | pd.Series
+        The upper specification value, a single value or one per column.
+    method : str = "boxcox"
+        "boxcox", "johnson", or "percentile".
+    cache : TransformCache | None = None
+        Fitted transforms to reuse. Columns without a valid entry are fitted
+        and stored in the cache.
+    max_workers : int | None = None
+        The number of processes used to fit the transforms. None fits in
+        this process.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per characteristic with n, pp, ppk, ppk_lower, ppk_upper,
+        and cached (True if the transform came from the cache).
+
+    Example
+    -------
+    >>> from scipy import stats
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({
+    ...     "x1": stats.lognorm.rvs(s=0.5, size=100, random_state=42),
+    ...     "x2": stats.lognorm.rvs(s=0.3, size=100, random_state=13),
+    ... })
+    >>> cache = dd.TransformCache()
+    >>> result = dd.nonnormal_capability(
+    ...     df=df,
+    ...     lower_spec=0.1,
+    ...     upper_spec=6,
+    ...     method="boxcox",
+    ...     cache=cache
+    ... )
+    """
+    columns = list(df.columns)
+    lower = _per_column(value=lower_spec, columns=columns)
+    upper = _per_column(value=upper_spec, columns=columns)
+    data = {
+        column: df[column].dropna().to_numpy(dtype=np.float64)
+        for column in columns
+    }
+    if method == "percentile":
+        values = df[columns].to_numpy(dtype=np.float64)
+        p_low, median, p_high = np.nanquantile(
+            values, q=[norm.cdf(-3), 0.5, norm.cdf(3)], axis=0
+        )
+        ppk_lower = (median - lower.to_numpy()) / (median - p_low)
+        ppk_upper = (upper.to_numpy() - median) / (p_high - median)
+        return pd.DataFrame(
+            data={
+                "n": df[columns].count().to_numpy(),
+                "pp": (upper - lower).to_numpy() / (p_high - p_low),
+                "ppk": np.fmin(ppk_lower, ppk_upper),
+                "ppk_lower": ppk_lower,
+                "ppk_upper": ppk_upper,
+                "cached": False,
+            },
+            index=pd.Index(columns, name="characteristic")
+        )
+    params = {}
+    cached = {}
+    for column in columns:
+        hit = None
+        if cache is not None:
+            hit = cache.get(key=column, values=data[column], method=method)
+        cached[column] = hit is not None
+        if hit is not None:
+            params[column] = hit
+    misses = [column for column in columns if not cached[column]]
+    tasks = [(data[column], method) for column in misses]
+    if max_workers and len(misses) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            fitted = list(executor.map(_fit_column, tasks))
+    else:
+        fitted = [_fit_column(task) for task in tasks]
+    for column, fit in zip(misses, fitted):
+        params[column] = fit
+        if cache is not None:
+            cache.put(
+                key=column, values=data[column], method=method, params=fit
+            )
+    rows = {}
+    for column in columns:
+        transformed = apply_normalizing_transform(
+            values=data[column], method=method, params=params[column]
+        )
+        t_lower, t_upper = apply_normalizing_transform(
+            values=[lower[column], upper[column]],
+            method=method,
+            params=params[column]
+        )
+        average = transformed.mean()
+        std_devn = transformed.std(ddof=1)
+        ppk_lower = (average - t_lower) / (3 * std_devn)
+        ppk_upper = (t_upper - average) / (3 * std_devn)
+        rows[column] = {
+            "n": transformed.size,
+            "pp": (t_upper - t_lower) / (6 * std_devn),
+            "ppk": np.fmin(ppk_lower, ppk_upper),
+            "ppk_lower": ppk_lower,
+            "ppk_upper": ppk_upper,
+            "cached": cached[column],
+        }
+    result = pd.DataFrame.from_dict(rows, orient="index")
+    result.index.name = "characteristic"
+    return result
+
+
+def rolling_capability(
+    *,
+    series: pd.Series,
+    lower_spec: float | int,
+    upper_spec: float | int,
+    window: int | str | pd.Timedelta | None = None,
+    min_periods: int = 2,
+) -> pd.DataFrame:
+    """
+    Rolling or expanding Cp, Cpk, Pp, and Ppk of individual values.
+
+    The average, the average moving range, and the overall standard
+    deviation are updated with pandas rolling (or expanding) window kernels,
+    so the cost is linear in the length of the series whatever the window.
+    Cp and Cpk use the moving range estimate of sigma, average mR / d2.
+    Pp and Ppk use the sample standard deviation.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The individual values in time order. The index must be a
+        DatetimeIndex for a time span window.
+    lower_spec : float | int
+        The lower specification value.
+    upper_spec : float | int
+        The upper specification value.
+    window : int | str | pd.Timedelta | None = None
+        The number of values in the window (at least 2), a time span such
+        as "7D", or None for an expanding window from the first value.
+    min_periods : int = 2
+        The minimum number of values in a window to calculate the indices.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame with the index of series and columns n, average,
+        sigma_within, sigma_overall, cp, cpk, pp, and ppk.
+
+    Notes
+    -----
+    For a count window of w values the average moving range uses the w - 1
+    moving ranges inside the window. For a time span window it uses the
+    moving ranges that end inside the window.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> index = pd.date_range(start="2025-01-01", periods=525_600, freq="min")
+    >>> series = pd.Series(
+    ...     data=np.random.default_rng(42).normal(10, 1, index.size),
+    ...     index=index
+    ... )
+    >>> df = dd.rolling_capability(
+    ...     series=series,
+    ...     lower_spec=6,
+    ...     upper_spec=14,
+    ...     window="7D"
+    ... )
+    """
+    series = series.astype(dtype="float64")
+    moving_range = series.diff().abs()
+    if window is None:
+        values = series.expanding(min_periods=min_periods)
+        ranges = moving_range.expanding(min_periods=min_periods - 1)
+    elif isinstance(window, numbers.Integral):
+        if window < 2:
+            raise ValueError("A count window must have at least 2 values.")
+        window = int(window)
+        values = series.rolling(window=window, min_periods=min_periods)
+        ranges = moving_range.rolling(
+            window=window - 1, min_periods=min_periods - 1
+        )
+    else:
+        values = series.rolling(window=window, min_periods=min_periods)
+        ranges = moving_range.rolling(
+            window=window, min_periods=min_periods - 1
+        )
+    n = values.count()
+    average = values.mean()
+    sigma_overall = values.std(ddof=1)
+    sigma_within = ranges.mean() / CONSTANTS.loc[2, "d2"]
+    to_lower = average - lower_spec
+    to_upper = upper_spec - average
+    return pd.DataFrame(
+        data={
+            "n": n,
+            "average": average,
+            "sigma_within": sigma_within,
+            "sigma_overall": sigma_overall,
+            "cp": (upper_spec - lower_spec) / (6 * sigma_within),
+            "cpk": np.fmin(to_lower, to_upper) / (3 * sigma_within),
+            "pp": (upper_spec - lower_spec) / (6 * sigma_overall),
+            "ppk": np.fmin(to_lower, to_upper) / (3 * sigma_overall),
+        }
+    )
+
+
 __all__ = (
+    "apply_normalizing_transform",
+    "fit_normalizing_transform",
+    "nonnormal_capability",
+    "rolling_capability",
+    "TransformCache",
     "cp",
     "cpk",
     "cpm",
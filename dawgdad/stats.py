@@ -2,31 +2,42 @@
 Statistical analysis
 
 - Non-parametric statistical summary
+- Non-parametric statistical summary of every column of a DataFrame
 - Parametric statistical summary
+- Parametric and non-parametric statistical summaries of groups
 - Cubic spline smoothing for Y vs X, can handle missing values
+- Cubic splines of many groups on a common grid
 - Piecewise natural cubic spline helper
-- Generate random data of various distributions
+- Native natural cubic splines with cross-validated knot selection
+- Generate random data of various distributions, in chunks if needed
 - Generate datetime data
 - Generate timedelta data
+- Generate datetime and timedelta sequences at any frequency
+- One-sample, two-sample, and paired t tests of many columns
+- Normality tests of many columns
+- Linear regression of chunked data with mergeable accumulators
 """
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-import random
+from collections import deque
+from typing import Iterable, Iterator
 import math
 import sys
 
 from sklearn.linear_model import LinearRegression
-from statsmodels.stats.power import TTestIndPower
+from dawgdad.power import t_test_power
+from statsmodels.stats.multitest import multipletests
 from basis_expansions import NaturalCubicSpline
 from scipy.stats.mstats import mquantiles as mq
-from scipy.stats import norm, uniform, randint
-from statsmodels.stats.power import TTestPower
-from pandas.api.types import CategoricalDtype
+from scipy.stats import norm
 import statsmodels.stats.diagnostic as smd
-from scipy.interpolate import CubicSpline
+from scipy.interpolate import BSpline, CubicSpline, make_smoothing_spline
+from scipy.linalg import solve_triangular
 from sklearn.pipeline import Pipeline
 import statsmodels.api as sm
 import scipy.stats as stats
+import pyarrow as pa
 from numpy import arange
 import pandas as pd
 import numpy as np
@@ -217,12 +228,411 @@ def parametric_summary(
     )
 
 
+def _plotting_position_quantiles(
+    *,
+    values: np.ndarray,
+    starts: np.ndarray,
+    counts: np.ndarray,
+    probs: tuple[float, ...],
+    alphap: float,
+    betap: float
+) -> np.ndarray:
+    """
+    Quantiles of many sorted segments of a flat array.
+
+    Segment i is values[starts[i]:starts[i] + counts[i]], sorted. The
+    quantiles use the plotting positions of
+    scipy.stats.mstats.mquantiles, evaluated for all segments and
+    probabilities at once. Returns an array (segments, probs), NaN for
+    empty segments.
+    """
+    p = np.asarray(probs, dtype="float64")[np.newaxis, :]
+    n = counts[:, np.newaxis].astype("float64")
+    aleph = n * p + alphap + p * (1 - alphap - betap)
+    k = np.floor(np.clip(aleph, 1, np.maximum(n - 1, 1))).astype(np.int64)
+    gamma = np.clip(aleph - k, 0, 1)
+    last = starts[:, np.newaxis] + np.maximum(counts[:, np.newaxis] - 1, 0)
+    lower = values[np.minimum(starts[:, np.newaxis] + k - 1, last)]
+    upper = values[np.minimum(starts[:, np.newaxis] + k, last)]
+    quantiles = (1 - gamma) * lower + gamma * upper
+    quantiles[counts == 0] = np.nan
+    return quantiles
+
+
+def _nonparametric_block(
+    task: tuple[pd.DataFrame, int, int, float, float, int]
+) -> list[dict]:
+    """
+    nonparametric_summary() of each column of a block of columns.
+
+    The block is converted to a 2-D array here, so only the blocks being
+    summarized exist as arrays.
+    """
+    df, start, stop, alphap, betap, decimals = task
+    block = df.iloc[:, start:stop].to_numpy(dtype="float64", na_value=np.nan)
+    rows, columns = block.shape
+    missing = np.isnan(block)
+    counts = rows - missing.sum(axis=0)
+    ordered = np.sort(block, axis=0).ravel(order="F")
+    q25, q50, q75 = _plotting_position_quantiles(
+        values=ordered,
+        starts=np.arange(columns) * rows,
+        counts=counts,
+        probs=(0.25, 0.50, 0.75),
+        alphap=alphap,
+        betap=betap
+    ).T
+    iqr = q75 - q25
+    lof = q25 - iqr * 3
+    lif = q25 - iqr * 1.5
+    uif = q75 + iqr * 1.5
+    uof = q75 + iqr * 3
+    with np.errstate(divide="ignore", invalid="ignore"):
+        half_width = 1.57 * iqr / np.sqrt(counts)
+    inner = (block < lif) | (block > uif)
+    outer = (block < lof) | (block > uof)
+    minimum = np.where(missing, np.inf, block).min(axis=0)
+    maximum = np.where(missing, -np.inf, block).max(axis=0)
+
+    def r(x):
+        return np.round(x, decimals)
+
+    summaries = []
+    for j in range(columns):
+        summaries.append({
+            "lower outer fence": r(lof[j]),
+            "lower inner fence": r(lif[j]),
+            "lower quartile": r(q25[j]),
+            "median": r(q50[j]),
+            "confidence interval": (
+                r(q50[j] - half_width[j]), r(q50[j] + half_width[j])
+            ),
+            "upper quartile": r(q75[j]),
+            "upper inner fence": r(uif[j]),
+            "upper outer fence": r(uof[j]),
+            "interquartile range": r(iqr[j]),
+            "inner outliers": r(block[inner[:, j], j]).tolist(),
+            "outer outliers": r(block[outer[:, j], j]).tolist(),
+            "minimum value": r(minimum[j]) if counts[j] else np.nan,
+            "maximum value": r(maximum[j]) if counts[j] else np.nan,
+            "count": int(counts[j]),
+        })
+    return summaries
+
+
+def nonparametric_summaries(
+    *,
+    df: pd.DataFrame,
+    alphap: float = 1/3,
+    betap: float = 1/3,
+    decimals: int = 3,
+    columns_per_block: int = 16,
+    max_workers: int | None = None
+) -> pd.DataFrame:
+    """
+    Calculate empirical quantiles for every column of a DataFrame.
+
+    The result for each column is that of nonparametric_summary(). The
+    columns are sorted in blocks of 2-D arrays; the quartiles of all the
+    columns in a block come from one vectorized evaluation of the
+    mquantiles plotting positions, and the outliers from boolean masks.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input DataFrame of numeric columns.
+    alphap : float = 1/3
+        Plotting positions. See nonparametric_summary().
+    betap : float = 1/3
+        Plotting positions.
+    decimals : int = 3
+        The number of decimal places for rounding.
+    columns_per_block : int = 16
+        The number of columns converted to an array and sorted at once.
+        At most max_workers blocks (one without workers) are in memory at
+        the same time.
+    max_workers : int | None = None
+        The number of threads used to summarize blocks. None summarizes
+        them in this thread.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per column of df, with the columns of
+        nonparametric_summary().
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({
+    ...     "a": dd.random_data(random_state=1),
+    ...     "b": dd.random_data(random_state=2),
+    ... })
+    >>> summary = dd.nonparametric_summaries(df=df)
+    """
+    tasks = [
+        (df, start, start + columns_per_block, alphap, betap, decimals)
+        for start in range(0, df.shape[1], columns_per_block)
+    ]
+    if max_workers and len(tasks) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            blocks = list(executor.map(_nonparametric_block, tasks))
+    else:
+        blocks = [_nonparametric_block(task) for task in tasks]
+    return pd.DataFrame(
+        data=[summary for block in blocks for summary in block],
+        index=df.columns
+    )
+
+
+def _group_codes(
+    df: pd.DataFrame,
+    by: str | list[str]
+) -> tuple[np.ndarray, pd.Index]:
+    """
+    Group number of each row (-1 for missing keys) and the group keys.
+    """
+    grouped = df.groupby(by=by, sort=True, observed=True, dropna=True)
+    codes = grouped.ngroup().to_numpy()
+    codes = np.where(np.isnan(codes.astype("float64")), -1, codes)
+    return (codes.astype(np.int64), grouped.size().index)
+
+
+def parametric_summary_grouped(
+    *,
+    df: pd.DataFrame,
+    value: str,
+    by: str | list[str],
+    confidence: float = 0.95,
+    decimals: int = 3
+) -> pd.DataFrame:
+    """
+    Return parametric statistics for each group.
+
+    The statistics are those of parametric_summary(), calculated for all
+    groups with groupby aggregations. The t critical value is evaluated
+    once per unique number of degrees of freedom.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input DataFrame.
+    value : str
+        The name of the column to summarize.
+    by : str | list[str]
+        The name(s) of the grouping column(s).
+    confidence : float = 0.95
+        The confidence level of the interval of the average.
+    decimals : int = 3
+        The number of decimal places for rounding.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per group with columns n, min, max, ave, ci lower,
+        ci upper, s, and var.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({
+    ...     "machine": ["M1", "M1", "M1", "M2", "M2", "M2"],
+    ...     "shift": [1, 1, 2, 1, 1, 1],
+    ...     "y": [10.1, 10.3, 9.9, 11.2, 11.0, 11.5],
+    ... })
+    >>> summary = dd.parametric_summary_grouped(
+    ...     df=df, value="y", by=["machine", "shift"]
+    ... )
+    """
+    summary = df.groupby(by=by, sort=True, observed=True)[value].agg(
+        ["count", "min", "max", "mean", "std", "var"]
+    )
+    n = summary["count"].to_numpy()
+    degrees, inverse = np.unique(n - 1, return_inverse=True)
+    with np.errstate(invalid="ignore"):
+        critical = stats.t.ppf(
+            (1 + confidence) / 2, np.where(degrees > 0, degrees, np.nan)
+        )[inverse]
+        half_width = critical * summary["std"].to_numpy() / np.sqrt(n)
+    average = summary["mean"].to_numpy()
+    return pd.DataFrame(
+        data={
+            "n": n,
+            "min": summary["min"].to_numpy(),
+            "max": summary["max"].to_numpy(),
+            "ave": average,
+            "ci lower": average - half_width,
+            "ci upper": average + half_width,
+            "s": summary["std"].to_numpy(),
+            "var": summary["var"].to_numpy(),
+        },
+        index=summary.index
+    ).round(decimals=decimals)
+
+
+def nonparametric_summary_grouped(
+    *,
+    df: pd.DataFrame,
+    value: str,
+    by: str | list[str],
+    alphap: float = 1/3,
+    betap: float = 1/3,
+    decimals: int = 3
+) -> pd.DataFrame:
+    """
+    Calculate empirical quantiles for each group.
+
+    The statistics are those of nonparametric_summary(), with the numbers
+    of outliers instead of lists. One lexsort orders the values within
+    their groups, and the quartiles of all groups come from one vectorized
+    evaluation of the mquantiles plotting positions.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input DataFrame.
+    value : str
+        The name of the column to summarize.
+    by : str | list[str]
+        The name(s) of the grouping column(s).
+    alphap : float = 1/3
+        Plotting positions. See nonparametric_summary().
+    betap : float = 1/3
+        Plotting positions.
+    decimals : int = 3
+        The number of decimal places for rounding.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per group with columns lower outer fence, lower inner
+        fence, lower quartile, median, ci lower, ci upper, upper quartile,
+        upper inner fence, upper outer fence, interquartile range, inner
+        outliers, outer outliers, minimum value, maximum value, and count.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({
+    ...     "machine": ["M1", "M1", "M1", "M2", "M2", "M2"],
+    ...     "y": [10.1, 10.3, 9.9, 11.2, 11.0, 11.5],
+    ... })
+    >>> summary = dd.nonparametric_summary_grouped(
+    ...     df=df, value="y", by="machine"
+    ... )
+    """
+    codes, groups = _group_codes(df=df, by=by)
+    values = df[value].to_numpy(dtype="float64", na_value=np.nan)
+    keep = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[keep], values[keep]
+    order = np.lexsort((values, codes))
+    counts = np.bincount(codes, minlength=len(groups))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    # a trailing NaN keeps the indices of empty groups in bounds
+    ordered = np.append(values[order], np.nan)
+    q25, q50, q75 = _plotting_position_quantiles(
+        values=ordered,
+        starts=starts,
+        counts=counts,
+        probs=(0.25, 0.50, 0.75),
+        alphap=alphap,
+        betap=betap
+    ).T
+    iqr = q75 - q25
+    lof = q25 - iqr * 3
+    lif = q25 - iqr * 1.5
+    uif = q75 + iqr * 1.5
+    uof = q75 + iqr * 3
+    with np.errstate(divide="ignore", invalid="ignore"):
+        half_width = 1.57 * iqr / np.sqrt(counts)
+    inner = (values < lif[codes]) | (values > uif[codes])
+    outer = (values < lof[codes]) | (values > uof[codes])
+    empty = counts == 0
+    last = np.maximum(starts + counts - 1, 0)
+    return pd.DataFrame(
+        data={
+            "lower outer fence": lof,
+            "lower inner fence": lif,
+            "lower quartile": q25,
+            "median": q50,
+            "ci lower": q50 - half_width,
+            "ci upper": q50 + half_width,
+            "upper quartile": q75,
+            "upper inner fence": uif,
+            "upper outer fence": uof,
+            "interquartile range": iqr,
+            "inner outliers": np.bincount(
+                codes[inner], minlength=len(groups)
+            ),
+            "outer outliers": np.bincount(
+                codes[outer], minlength=len(groups)
+            ),
+            "minimum value": np.where(empty, np.nan, ordered[starts]),
+            "maximum value": np.where(empty, np.nan, ordered[last]),
+            "count": counts,
+        },
+        index=groups
+    ).round(decimals=decimals)
+
+
+def _fit_spline(
+    *,
+    x: np.ndarray,
+    y: np.ndarray,
+    smoothing: str | float | None,
+    bins: int | None
+) -> CubicSpline | BSpline:
+    """
+    Interpolating or smoothing cubic spline of y vs x, after removing
+    missing values and sorting.
+
+    The interpolating spline keeps the first of duplicate abscissas. The
+    smoothing spline, and a spline of binned values, use the average
+    ordinate of each abscissa or bin, weighted by the number of values.
+    """
+    valid = ~(pd.isna(x) | pd.isna(y))
+    x = x[valid]
+    y = y[valid]
+    if smoothing is None and bins is None:
+        order = np.argsort(x, kind="stable")
+        x = x[order]
+        y = y[order]
+        first = np.concatenate(([True], x[1:] != x[:-1]))
+        return CubicSpline(x=x[first], y=y[first])
+    x = x.astype("float64")
+    y = y.astype("float64")
+    if bins:
+        low, high = x.min(), x.max()
+        scale = bins / (high - low) if high > low else 0.0
+        index = np.minimum(((x - low) * scale).astype(np.int64), bins - 1)
+    else:
+        _, index = np.unique(x, return_inverse=True)
+    weights = np.bincount(index)
+    keep = weights > 0
+    x = np.bincount(index, weights=x)[keep] / weights[keep]
+    y = np.bincount(index, weights=y)[keep] / weights[keep]
+    if smoothing is None:
+        return CubicSpline(x=x, y=y)
+    return make_smoothing_spline(
+        x=x,
+        y=y,
+        w=weights[keep],
+        lam=None if smoothing == "gcv" else smoothing
+    )
+
+
 def cubic_spline(
     *,
     df: pd.DataFrame,
     abscissa: str,
-    ordinate: str
-) -> CubicSpline:
+    ordinate: str,
+    smoothing: str | float | None = None,
+    bins: int | None = None,
+    verbose: bool = True
+) -> CubicSpline | BSpline:
     """
     Estimates the spline object for the abscissa and ordinate of a dataframe.
 
@@ -231,6 +641,10 @@ def cubic_spline(
     - Removes duplicate rows
     - Sorts the dataframe by abscissa in increasing order
 
+    By default the spline interpolates the values. For many noisy values,
+    a smoothing spline (scipy make_smoothing_spline) does not overfit, and
+    binning the values first makes the fit scale to millions of values.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -239,14 +653,27 @@ def cubic_spline(
         The name of the abscissa column.
     ordinate : str
         The name of the ordinate column.
+    smoothing : str | float | None = None
+        None for an interpolating spline, "gcv" for a smoothing spline
+        with the penalty chosen by generalized cross-validation, or the
+        penalty (lam of make_smoothing_spline). The ordinates of duplicate
+        abscissas are averaged. The penalty of more than about 100,000
+        distinct abscissas is ill-conditioned; use bins.
+    bins : int | None = None
+        If given, the values are averaged in this number of bins of equal
+        width before the fit, in one pass over the values.
+    verbose : bool = True
+        If True, print the sorted values without duplicates and their
+        dtypes. If False, the values are filtered as NumPy arrays without
+        copies of the DataFrame.
 
     Returns
     -------
-    spline: CubicSpline
+    spline: CubicSpline | BSpline
         A cubic spline.
 
-    Example
-    -------
+    Examples
+    --------
 
     >>> import matplotlib.pyplot as plt
     >>> import dawgdad as dd
@@ -266,71 +693,158 @@ def cubic_spline(
     >>> spline = dd.cubic_spline(
     ...     df=df,
     ...     abscissa="abscissa",
-    ...     ordinate="ordinate"
-    ... ) # doctest: +NORMALIZE_WHITESPACE
-        abscissa  ordinate
-    10  0.020584 -0.463418
-    29  0.046450 -0.291694
-    6   0.058084  1.579213
-    32  0.065052 -0.013497
-    37  0.097672 -1.959670
-    40  0.122038  0.738467
-    21  0.139494 -0.225776
-    5   0.155995 -0.234137
-    4   0.156019 -0.234153
-    31  0.170524  1.852278
-    14  0.181825 -1.724918
-    15  0.183405 -0.562288
-    26  0.199674 -1.150994
-    13  0.212339 -1.913280
-    19  0.291229 -1.412304
-    22  0.292145  0.067528
-    16  0.304242 -1.012831
-    36  0.304614  0.208864
-    23  0.366362 -1.424748
-    0   0.374540  0.496714
-    18  0.431945 -0.908024
-    39  0.440152  0.196861
-    24  0.456070 -0.544383
-    41  0.495177  0.171368
-    27  0.514234  0.375698
-    17  0.524756  0.314247
-    28  0.592415 -0.600639
-    3   0.598658  1.523030
-    8   0.601115 -0.469474
-    30  0.607545 -0.601707
-    20  0.611853  1.465649
-    38  0.684233 -1.328186
-    9   0.708073  0.542560
-    2   0.731994  0.647689
-    25  0.785176  0.110923
-    35  0.808397 -1.220844
-    12  0.832443  0.241962
-    7   0.866176  0.767435
-    33  0.948886 -1.057711
-    1   0.950714 -0.138264
-    34  0.965632  0.822545
-    11  0.969910 -0.465730
-    abscissa    float64
-    ordinate    float64
-    dtype: object
+    ...     ordinate="ordinate",
+    ...     verbose=False
+    ... )
     >>> df["predicted"] = spline(df["abscissa"])
     >>> fig, ax = dd.plot_scatter_line_x_y1_y2(
     ...     X=df["abscissa"],
     ...     y1=df["ordinate"],
     ...     y2=df["predicted"]
     ... )
+
+    Smooth millions of noisy values.
+
+    >>> import numpy as np
+    >>> rng = np.random.default_rng(42)
+    >>> x = rng.uniform(low=0, high=10, size=5_000_000)
+    >>> df = pd.DataFrame({
+    ...     "abscissa": x,
+    ...     "ordinate": np.sin(x) + rng.normal(scale=0.5, size=x.size)
+    ... })
+    >>> spline = dd.cubic_spline(
+    ...     df=df,
+    ...     abscissa="abscissa",
+    ...     ordinate="ordinate",
+    ...     smoothing="gcv",
+    ...     bins=1_000,
+    ...     verbose=False
+    ... )
     """
-    df = df[df[[abscissa, ordinate]].notna().all(axis="columns")]
-    df = df.sort_values(by=abscissa, axis="rows", ascending=True)
-    df = df.drop_duplicates(subset=abscissa, keep="first")
-    print(df)
-    print(df.dtypes)
-    spline = CubicSpline(
-        x=df[abscissa],
-        y=df[ordinate]
+    if verbose:
+        df = df[df[[abscissa, ordinate]].notna().all(axis="columns")]
+        df = df.sort_values(by=abscissa, axis="rows", ascending=True)
+        df = df.drop_duplicates(subset=abscissa, keep="first")
+        print(df)
+        print(df.dtypes)
+    return _fit_spline(
+        x=df[abscissa].to_numpy(),
+        y=df[ordinate].to_numpy(),
+        smoothing=smoothing,
+        bins=bins
+    )
+
+
+def _cubic_spline_group(
+    task: tuple[np.ndarray, np.ndarray, np.ndarray, str | float | None,
+                int | None]
+) -> np.ndarray:
+    """
+    Spline of one group evaluated on the grid, NaN outside the abscissas of
+    the group or if the group has too few values.
+    """
+    x, y, grid, smoothing, bins = task
+    try:
+        spline = _fit_spline(x=x, y=y, smoothing=smoothing, bins=bins)
+    except ValueError:
+        return np.full(grid.shape, np.nan)
+    values = spline(grid)
+    values[(grid < np.nanmin(x)) | (grid > np.nanmax(x))] = np.nan
+    return values
+
+
+def cubic_spline_grouped(
+    *,
+    df: pd.DataFrame,
+    abscissa: str,
+    ordinate: str,
+    by: str | list[str],
+    grid: int | np.ndarray = 100,
+    smoothing: str | float | None = "gcv",
+    bins: int | None = None,
+    max_workers: int | None = None
+) -> pd.DataFrame:
+    """
+    Fit one cubic spline per group and evaluate them on a common grid.
+
+    The rows are ordered by group once and each group is fit as in
+    cubic_spline(verbose=False), in a process pool if max_workers is given.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input dataframe, with numeric abscissa and ordinate.
+    abscissa : str
+        The name of the abscissa column.
+    ordinate : str
+        The name of the ordinate column.
+    by : str | list[str]
+        The column or columns that define the groups.
+    grid : int | np.ndarray = 100
+        The abscissas at which the splines are evaluated, or the number of
+        equally spaced abscissas over the range of all groups.
+    smoothing : str | float | None = "gcv"
+        See cubic_spline().
+    bins : int | None = None
+        See cubic_spline().
+    max_workers : int | None = None
+        The number of processes used. None fits in this process.
+
+    Returns
+    -------
+    pd.DataFrame
+        The spline values with the grid as index and one column per group.
+        Values outside the abscissas of a group, or of a group with too few
+        values for the spline, are NaN.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> rng = np.random.default_rng(42)
+    >>> x = rng.uniform(low=0, high=10, size=300_000)
+    >>> df = pd.DataFrame({
+    ...     "line": rng.choice(["a", "b", "c"], size=x.size),
+    ...     "abscissa": x,
+    ...     "ordinate": np.sin(x) + rng.normal(scale=0.5, size=x.size)
+    ... })
+    >>> curves = dd.cubic_spline_grouped(
+    ...     df=df,
+    ...     abscissa="abscissa",
+    ...     ordinate="ordinate",
+    ...     by="line",
+    ...     bins=500
+    ... )
+    """
+    codes, groups = _group_codes(df=df, by=by)
+    x = df[abscissa].to_numpy(dtype="float64", na_value=np.nan)
+    y = df[ordinate].to_numpy(dtype="float64", na_value=np.nan)
+    if np.ndim(grid) == 0:
+        grid = np.linspace(np.nanmin(x), np.nanmax(x), int(grid))
+    grid = np.asarray(grid, dtype="float64")
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(groups) + 1))
+    tasks = [
+        (
+            x[order[start:end]],
+            y[order[start:end]],
+            grid,
+            smoothing,
+            bins
+        )
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+    if max_workers and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_cubic_spline_group, tasks))
+    else:
+        results = [_cubic_spline_group(task) for task in tasks]
+    return pd.DataFrame(
+        data=np.column_stack(results) if results else None,
+        index=pd.Index(grid, name=abscissa),
+        columns=groups
     )
-    return spline
 
 
 def natural_cubic_spline(
@@ -400,6 +914,332 @@ def natural_cubic_spline(
     return p
 
 
+def _cubed_positive_part(values: np.ndarray) -> np.ndarray:
+    """
+    max(values, 0) ** 3, in place.
+    """
+    np.maximum(values, 0, out=values)
+    cube = values * values
+    cube *= values
+    return cube
+
+
+def _natural_spline_basis(
+    x: np.ndarray,
+    knots: np.ndarray,
+    y: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Truncated-power basis of a natural cubic spline, with the intercept,
+    and y as the last column if it is given.
+
+    The abscissa is rescaled so that the first and last knots are 0 and 1,
+    which scales the columns but keeps the condition number of the matrix
+    small.
+    """
+    width = knots[-1] - knots[0]
+    u = (x - knots[0]) / width
+    k = (knots - knots[0]) / width
+    basis = np.empty((u.size, k.size + (y is not None)), order="F")
+    basis[:, 0] = 1
+    basis[:, 1] = u
+    last = _cubed_positive_part(u - k[-1])
+    penultimate = _cubed_positive_part(u - k[-2])
+    penultimate -= last
+    penultimate /= k[-1] - k[-2]
+    for column, knot in enumerate(k[:-2], start=2):
+        d = _cubed_positive_part(u - knot)
+        d -= last
+        d /= k[-1] - knot
+        d -= penultimate
+        basis[:, column] = d
+    if y is not None:
+        basis[:, -1] = y
+    return basis
+
+
+def _natural_spline_r(
+    *,
+    x: np.ndarray,
+    y: np.ndarray,
+    knots: np.ndarray,
+    block_size: int = 16_384
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """
+    R factor of the QR factorization of the basis, Q'y, and the residual
+    sum of squares.
+
+    The rows are factored in blocks, each block stacked under the R of the
+    blocks before it, so memory does not grow with the number of rows. The
+    ordinate is factored as the last column of the matrix, which gives Q'y
+    and the residual sum of squares without forming Q.
+    """
+    r = np.empty((0, knots.size + 1))
+    for start in range(0, x.size, block_size):
+        stop = start + block_size
+        r = np.linalg.qr(
+            np.vstack(
+                (r, _natural_spline_basis(x[start:stop], knots, y[start:stop]))
+            ),
+            mode="r"
+        )
+    columns = min(r.shape[0], knots.size)
+    rss = r[columns, -1] ** 2 if r.shape[0] > columns else 0.0
+    return (r[:columns, :-1], r[:columns, -1], rss)
+
+
+def _uniform_knots(
+    *,
+    x: np.ndarray,
+    number_knots: int
+) -> np.ndarray:
+    """
+    Knots equally spaced within the range of x, without the endpoints.
+    """
+    return _check_knots(np.linspace(x.min(), x.max(), number_knots + 2)[1:-1])
+
+
+def _check_knots(knots: np.ndarray) -> np.ndarray:
+    """
+    The knots, if there are at least two and they are strictly increasing.
+
+    Equal knots divide the basis by zero; they come from duplicate knots or
+    from an X with zero range.
+    """
+    if knots.size < 2:
+        raise ValueError("A natural spline needs at least two knots.")
+    if not (np.diff(knots) > 0).all():
+        raise ValueError(
+            "The knots must be distinct and X must have a nonzero range."
+        )
+    return knots
+
+
+def _finite_pairs(
+    *,
+    X: pd.Series | np.ndarray,
+    y: pd.Series | np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Float arrays of the pairs of X and y without a missing value.
+    """
+    x = np.asarray(X, dtype="float64").ravel()
+    y = np.asarray(y, dtype="float64").ravel()
+    finite = np.isfinite(x) & np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    return (x, y)
+
+
+class NaturalSpline:
+    """
+    Natural cubic spline fitted by least squares.
+
+    Parameters
+    ----------
+    knots : np.ndarray
+        The knots, in increasing order.
+    coefficients : np.ndarray
+        The coefficients of the truncated-power basis.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import numpy as np
+    >>> rng = np.random.default_rng(42)
+    >>> X = rng.uniform(0, 10, 1_000)
+    >>> y = np.sin(X) + rng.normal(0, 0.1, 1_000)
+    >>> spline = dd.natural_spline(X=X, y=y, number_knots=10)
+    >>> predictions = spline.predict(X=np.linspace(0, 10, 100))
+    """
+    def __init__(self, knots: np.ndarray, coefficients: np.ndarray):
+        self.knots = np.asarray(knots, dtype="float64")
+        self.coefficients = np.asarray(coefficients, dtype="float64")
+
+    def predict(
+        self,
+        X: pd.Series | np.ndarray,
+        block_size: int = 1_048_576
+    ) -> np.ndarray:
+        """
+        Evaluate the spline.
+
+        The basis is evaluated and multiplied by the coefficients in blocks
+        of rows, so the basis matrix of a large X is never built.
+
+        Parameters
+        ----------
+        X : pd.Series | np.ndarray
+            The abscissa.
+        block_size : int = 1_048_576
+            The number of rows evaluated at once.
+
+        Returns
+        -------
+        np.ndarray
+            The predictions.
+        """
+        x = np.asarray(X, dtype="float64").ravel()
+        predictions = np.empty(x.size)
+        for start in range(0, x.size, block_size):
+            stop = start + block_size
+            predictions[start:stop] = _natural_spline_basis(
+                x[start:stop], self.knots
+            ) @ self.coefficients
+        return predictions
+
+
+def natural_spline(
+    *,
+    X: pd.Series | np.ndarray,
+    y: pd.Series | np.ndarray,
+    number_knots: int = 10,
+    list_knots: list[float] | None = None
+) -> NaturalSpline:
+    """
+    Natural cubic spline by least squares on the truncated-power basis.
+
+    The basis is the same as that of natural_cubic_spline, built as a NumPy
+    matrix and solved by QR, without basis_expansions or scikit-learn. The
+    fit is linear in the number of rows, and X need not be sorted.
+
+    Parameters
+    ----------
+    X : pd.Series | np.ndarray
+        The abscissa.
+    y : pd.Series | np.ndarray
+        The ordinate. Pairs with a missing value are dropped.
+    number_knots : int = 10
+        The number of knots, equally spaced within the range of X. The
+        endpoints are not knots.
+    list_knots : list[float] | None = None
+        The knots. If given, number_knots is ignored.
+
+    Returns
+    -------
+    NaturalSpline
+        The fitted spline.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import numpy as np
+    >>> rng = np.random.default_rng(42)
+    >>> X = rng.uniform(0, 10, 1_000)
+    >>> y = np.sin(X) + rng.normal(0, 0.1, 1_000)
+    >>> spline = dd.natural_spline(X=X, y=y, number_knots=10)
+    >>> predictions = spline.predict(X=X)
+    """
+    x, y = _finite_pairs(X=X, y=y)
+    if list_knots is not None:
+        knots = _check_knots(np.sort(np.asarray(list_knots, dtype="float64")))
+    else:
+        knots = _uniform_knots(x=x, number_knots=number_knots)
+    r, qty, _ = _natural_spline_r(x=x, y=y, knots=knots)
+    coefficients = np.linalg.lstsq(r, qty, rcond=None)[0]
+    return NaturalSpline(knots=knots, coefficients=coefficients)
+
+
+def natural_spline_cv(
+    *,
+    X: pd.Series | np.ndarray,
+    y: pd.Series | np.ndarray,
+    knot_counts: list[int] | range = range(2, 21),
+    folds: int = 5,
+    random_state: int | np.random.Generator | None = None
+) -> tuple[NaturalSpline, pd.DataFrame]:
+    """
+    Natural cubic spline with the number of knots chosen by cross-validation.
+
+    For each number of knots, each fold is QR factored once. The fit
+    without a fold is the least squares solution of the stacked R factors
+    of the other folds, a small problem that does not touch the data again,
+    and the final fit on all the data stacks the R factors of every fold.
+    The error of a held-out fold comes from its own R factor and residual
+    sum of squares, so the data are read once per number of knots. The
+    factorizations are not shared between numbers of knots, because the
+    bases of equally spaced knots do not nest: each number of knots moves
+    every knot.
+
+    Parameters
+    ----------
+    X : pd.Series | np.ndarray
+        The abscissa.
+    y : pd.Series | np.ndarray
+        The ordinate. Pairs with a missing value are dropped.
+    knot_counts : list[int] | range = range(2, 21)
+        The numbers of knots compared. The knots are equally spaced within
+        the range of X.
+    folds : int = 5
+        The number of folds.
+    random_state : int | np.random.Generator | None = None
+        The seed or generator of the assignment of rows to folds.
+
+    Returns
+    -------
+    tuple[NaturalSpline, pd.DataFrame]
+        The spline with the least cross-validated mean squared error, fitted
+        on all the data, and a table of the mean squared error and its
+        standard error for each number of knots.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import numpy as np
+    >>> rng = np.random.default_rng(42)
+    >>> X = rng.uniform(0, 10, 10_000)
+    >>> y = np.sin(X) + rng.normal(0, 0.1, 10_000)
+    >>> spline, table = dd.natural_spline_cv(X=X, y=y, random_state=42)
+    """
+    x, y = _finite_pairs(X=X, y=y)
+    if folds < 2 or folds > x.size:
+        raise ValueError("folds must be >= 2 and <= the number of pairs.")
+    rng = np.random.default_rng(random_state)
+    order = rng.permutation(x.size)
+    bounds = np.linspace(0, x.size, folds + 1).astype(np.int64)
+    parts = [
+        (x[order[start:stop]], y[order[start:stop]])
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+    rows = []
+    splines = {}
+    for number_knots in knot_counts:
+        knots = _uniform_knots(x=x, number_knots=number_knots)
+        factors = [
+            _natural_spline_r(x=part_x, y=part_y, knots=knots)
+            for part_x, part_y in parts
+        ]
+        errors = np.empty(folds)
+        for fold, (r, qty, rss) in enumerate(factors):
+            coefficients = np.linalg.lstsq(
+                np.vstack([f[0] for i, f in enumerate(factors) if i != fold]),
+                np.concatenate(
+                    [f[1] for i, f in enumerate(factors) if i != fold]
+                ),
+                rcond=None
+            )[0]
+            # |y - Bb|^2 = |Rb - Q'y|^2 + the residual sum of squares
+            residuals = r @ coefficients - qty
+            errors[fold] = (residuals @ residuals + rss) / parts[fold][0].size
+        coefficients = np.linalg.lstsq(
+            np.vstack([f[0] for f in factors]),
+            np.concatenate([f[1] for f in factors]),
+            rcond=None
+        )[0]
+        splines[number_knots] = NaturalSpline(
+            knots=knots, coefficients=coefficients
+        )
+        rows.append((
+            number_knots,
+            errors.mean(),
+            errors.std(ddof=1) / np.sqrt(folds)
+        ))
+    table = pd.DataFrame(
+        data=rows, columns=["knots", "mse", "standard error"]
+    ).set_index("knots")
+    return (splines[table["mse"].idxmin()], table)
+
+
 def random_data(
     *,
     distribution: str = "norm",
@@ -410,17 +1250,22 @@ def random_data(
     high: int = 70,
     strings: list[str] = ["female", "male"],
     categories: list[str] = ["small", "medium", "large"],
-    random_state: int = None,
+    random_state: int | np.random.Generator | np.random.SeedSequence = None,
     fraction_nan: float = 0.13,
     name: str = None
 ) -> pd.Series:
     """
     Create a series of random items from a distribution.
 
+    The items are drawn with a NumPy Generator (PCG64) in whole arrays.
+    Strings and categories are drawn as integer codes into the list of
+    strings or categories, and missing values of the nullable types are a
+    mask drawn from the same stream.
+
     Parameters
     ----------
     distribution : str = "norm"
-        A scipy.stats distribution, the standard normal by default.
+        The distribution, the standard normal by default. See Notes.
     size : int = 42
         The number of rows to create.
     loc : float = 0
@@ -435,10 +1280,12 @@ def random_data(
         The list of strings for the distribution of strings.
     categories : list[str] = ["small", "medium", "large"],
         The list of strings for the distribution of categories.
-    random_state : int = None
-        The random number seed.
+    random_state : int | np.random.Generator | np.random.SeedSequence = None
+        The random number seed, or a generator or seed sequence, e.g. one
+        of the streams spawned for parallel workers.
     fraction_nan : float = 0.13
-        The fraction of cells to be made np.nan.
+        The probability of each cell of "randInt" and "boolean" being
+        missing.
     name : str = None
         The name of the Series.
 
@@ -627,205 +1474,161 @@ def random_data(
         - "randInt"    Int64 (nullable)
         - "category"   category
         - "categories" category of type CategoricalDtype(ordered=True)
+
+    "uniform" is uniform on [loc, loc + scale), as scipy.stats.uniform.
     """
-    distribution_list_continuous = ["norm", "uniform"]
-    distribution_list_discrete = ["randint", "randInt"]
-    distribution_list_strings = ["strings"]
-    distribution_list_bool = ["bool", "boolean"]
-    distribution_list_categories = ["category", "categories"]
+    rng = np.random.default_rng(seed=random_state)
     match distribution:
-        case distribution if distribution in distribution_list_continuous:
-            series = pd.Series(eval(distribution).rvs(
-                size=size,
-                loc=loc,
-                scale=scale,
-                random_state=random_state
+        case "norm":
+            series = pd.Series(
+                rng.normal(loc=loc, scale=scale, size=size), name=name
+            )
+        case "uniform":
+            series = pd.Series(
+                rng.uniform(low=loc, high=loc + scale, size=size), name=name
+            )
+        case "randint":
+            series = pd.Series(
+                rng.integers(low=low, high=high, size=size, dtype=np.int64),
+                name=name
+            )
+        case "randInt":
+            values = rng.integers(
+                low=low, high=high, size=size, dtype=np.int64
+            )
+            series = pd.Series(
+                pd.arrays.IntegerArray(
+                    values=values, mask=rng.random(size=size) < fraction_nan
                 ),
                 name=name
             )
-    # introduced before Python 3.10
-    # if distribution in distribution_list_continuous:
-    #     series = pd.Series(eval(distribution).rvs(
-    #         size=size,
-    #         loc=loc,
-    #         scale=scale,
-    #         random_state=random_state
-    #         ),
-    #         name=name
-    #     )
-        case distribution if distribution in distribution_list_discrete:
-            if distribution == "randInt":
-                series = pd.Series(eval(distribution.lower()).rvs(
-                    low=low,
-                    high=high,
-                    size=size,
-                    random_state=random_state
-                    ),
-                    name=name
-                )
-                series[series.sample(frac=fraction_nan).index] = np.nan
-                series = series.astype(dtype="Int64")
-            elif distribution == "randint":
-                series = pd.Series(eval(distribution).rvs(
-                    low=low,
-                    high=high,
-                    size=size,
-                    random_state=random_state
-                    ),
-                    name=name
-                ).astype(dtype="int64")
-    # elif distribution in distribution_list_discrete:
-    #     if distribution == "randInt":
-    #         series = pd.Series(eval(distribution.lower()).rvs(
-    #             low=low,
-    #             high=high,
-    #             size=size,
-    #             random_state=random_state
-    #             ),
-    #             name=name
-    #         )
-    #         series[series.sample(frac=fraction_nan).index] = np.nan
-    #         series = series.astype(dtype="Int64")
-    #     elif distribution == "randint":
-    #         series = pd.Series(eval(distribution).rvs(
-    #             low=low,
-    #             high=high,
-    #             size=size,
-    #             random_state=random_state
-    #             ),
-    #             name=name
-    #         ).astype(dtype="int64")
-        case distribution if distribution in distribution_list_bool:
-            if distribution == "boolean":
-                series = pd.Series(eval("randint").rvs(
-                    low=0,
-                    high=2,
-                    size=size,
-                    random_state=random_state
-                    ),
-                    name=name
-                )
-                series[series.sample(frac=fraction_nan).index] = np.nan
-                series = series.astype(dtype="boolean")
-            elif distribution == "bool":
-                series = pd.Series(eval("randint").rvs(
-                    low=0,
-                    high=2,
-                    size=size,
-                    random_state=random_state
-                    ),
-                    name=name
-                ).astype(dtype="bool")
-    # elif distribution in distribution_list_bool:
-    #     if distribution == "boolean":
-    #         series = pd.Series(eval("randint").rvs(
-    #             low=0,
-    #             high=2,
-    #             size=size,
-    #             random_state=random_state
-    #             ),
-    #             name=name
-    #         )
-    #         series[series.sample(frac=fraction_nan).index] = np.nan
-    #         series = series.astype(dtype="boolean")
-    #     elif distribution == "bool":
-    #         series = pd.Series(eval("randint").rvs(
-    #             low=0,
-    #             high=2,
-    #             size=size,
-    #             random_state=random_state
-    #             ),
-    #             name=name
-    #         ).astype(dtype="bool")
-        case distribution if distribution in distribution_list_strings:
-            random.seed(a=random_state)
+        case "bool":
+            series = pd.Series(
+                rng.integers(low=0, high=2, size=size, dtype=np.bool_),
+                name=name
+            )
+        case "boolean":
+            values = rng.integers(low=0, high=2, size=size, dtype=np.bool_)
             series = pd.Series(
-                random.choices(
-                    population=strings,
-                    k=size
+                pd.arrays.BooleanArray(
+                    values=values, mask=rng.random(size=size) < fraction_nan
+                ),
+                name=name
+            )
+        case "strings":
+            codes = rng.integers(low=0, high=len(strings), size=size)
+            series = pd.Series(
+                np.asarray(strings, dtype=object)[codes], name=name
+            )
+        case "category" | "categories":
+            ordered = distribution == "categories"
+            # unordered categories are sorted, as astype("category") does
+            population = categories if ordered else sorted(categories)
+            codes = rng.integers(
+                low=0,
+                high=len(population),
+                size=size,
+                dtype=np.int8 if len(population) < 128 else np.int32
+            )
+            series = pd.Series(
+                pd.Categorical.from_codes(
+                    codes=codes, categories=population, ordered=ordered
                 ),
                 name=name
             )
-    # elif distribution in distribution_list_strings:
-    #     random.seed(a=random_state)
-    #     series = pd.Series(
-    #         random.choices(
-    #             population=strings,
-    #             k=size
-    #         ),
-    #         name=name
-    #     )
-        case distribution if distribution in distribution_list_categories:
-            if distribution == "categories":
-                random.seed(a=random_state)
-                series = pd.Series(
-                    random.choices(
-                        population=categories,
-                        k=size
-                    ),
-                    name=name
-                ).astype(
-                    CategoricalDtype(
-                        categories=categories,
-                        ordered=True
-                    )
-                )
-            elif distribution == "category":
-                random.seed(a=random_state)
-                series = pd.Series(
-                    random.choices(
-                        population=categories,
-                        k=size
-                    ),
-                    name=name
-                ).astype(dtype="category")
-    # elif distribution in distribution_list_categories:
-    #     if distribution == "categories":
-    #         random.seed(a=random_state)
-    #         series = pd.Series(
-    #             random.choices(
-    #                 population=categories,
-    #                 k=size
-    #             ),
-    #             name=name
-    #         ).astype(
-    #             CategoricalDtype(
-    #                 categories=categories,
-    #                 ordered=True
-    #             )
-    #         )
-    #     elif distribution == "category":
-    #         random.seed(a=random_state)
-    #         series = pd.Series(
-    #             random.choices(
-    #                 population=categories,
-    #                 k=size
-    #             ),
-    #             name=name
-    #         ).astype(dtype="category")
         case "timedelta":
             series = timedelta_data(time_delta_days=size-1).rename(name)
-    # elif distribution == "timedelta":
-    #     series = timedelta_data(time_delta_days=size-1).rename(name)
         case "datetime":
             series = datetime_data(time_delta_days=size-1).rename(name)
-    # elif distribution == "datetime":
-    #     series = datetime_data(time_delta_days=size-1).rename(name)
         case _:
             return print(
                 f"Distribution instance {distribution} is not implemented "
                 "in dawgdad."
                 )
             sys.exit()
-    # else:
-    #     return print(
-    #         f"Distribution instance {distribution} is not implemented "
-    #         "in dawgdad."
-    #         )
-    #     sys.exit()
     return series
 
 
+def _random_data_chunk(
+    task: tuple[int, int, np.random.SeedSequence, dict]
+) -> pd.Series:
+    """
+    random_data() of one chunk, indexed by its position in the whole.
+    """
+    start, size, seed, kwargs = task
+    series = random_data(size=size, random_state=seed, **kwargs)
+    series.index = pd.RangeIndex(start=start, stop=start + size)
+    return series
+
+
+def random_data_chunks(
+    *,
+    size: int,
+    chunk_size: int = 1_000_000,
+    random_state: int | np.random.SeedSequence | None = None,
+    max_workers: int | None = None,
+    **kwargs
+) -> Iterator[pd.Series]:
+    """
+    Create random items in chunks, for data larger than memory.
+
+    Each chunk is drawn from its own stream spawned from one SeedSequence,
+    so the chunks are independent and the same for any max_workers. With
+    workers, at most max_workers chunks are generated ahead of the one
+    being consumed.
+
+    Parameters
+    ----------
+    size : int
+        The total number of items.
+    chunk_size : int = 1_000_000
+        The number of items of each chunk, except the last.
+    random_state : int | np.random.SeedSequence | None = None
+        The random number seed.
+    max_workers : int | None = None
+        The number of threads generating chunks. None generates them in
+        this thread as they are consumed.
+    **kwargs
+        The keyword arguments of random_data(), other than size and
+        random_state.
+
+    Yields
+    ------
+    pd.Series
+        The chunks, indexed by the position of their items in the whole.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> for chunk in dd.random_data_chunks(
+    ...     size=100_000_000,
+    ...     chunk_size=10_000_000,
+    ...     distribution="categories",
+    ...     random_state=42
+    ... ): # doctest: +SKIP
+    ...     chunk.to_frame().to_parquet(f"chunk_{chunk.index[0]}.parquet")
+    """
+    if not isinstance(random_state, np.random.SeedSequence):
+        random_state = np.random.SeedSequence(entropy=random_state)
+    starts = range(0, size, chunk_size)
+    tasks = (
+        (start, min(chunk_size, size - start), seed, kwargs)
+        for start, seed in zip(starts, random_state.spawn(len(starts)))
+    )
+    if not max_workers:
+        for task in tasks:
+            yield _random_data_chunk(task)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(_random_data_chunk, task))
+            if len(pending) > max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 def datetime_data(
     *,
     start_year: str = None,
@@ -970,6 +1773,249 @@ def timedelta_data(
     return series
 
 
+def _timedelta_ticks(
+    *,
+    value: str | timedelta | pd.Timedelta | None,
+    unit: str,
+    name: str
+) -> int:
+    """
+    Number of ticks of unit in a timedelta, 0 for None.
+    """
+    if value is None:
+        return 0
+    exact = pd.Timedelta(value).to_timedelta64()
+    ticks = np.timedelta64(exact, unit)
+    if ticks != exact:
+        raise ValueError(f"{name} must be a whole number of {unit}.")
+    return int(ticks.view(np.int64))
+
+
+def _datetime_ticks(
+    *,
+    value: str | datetime | pd.Timestamp,
+    unit: str,
+    name: str
+) -> int:
+    """
+    Number of ticks of unit from the epoch to a datetime.
+    """
+    exact = pd.Timestamp(value).to_datetime64()
+    ticks = np.datetime64(exact, unit)
+    if ticks != exact:
+        raise ValueError(f"{name} must be a whole number of {unit}.")
+    return int(ticks.view(np.int64))
+
+
+def _time_ticks(
+    *,
+    periods: int,
+    start: int,
+    step: int,
+    jitter: int,
+    fraction_gaps: float,
+    random_state: int | np.random.Generator | None,
+    block_size: int = 1_048_576
+) -> np.ndarray:
+    """
+    Integer ticks start, start + step, ... in one int64 array, with skipped
+    periods and jitter applied in place.
+    """
+    if step <= 0:
+        raise ValueError("freq must be at least one tick of unit.")
+    if not 0 <= fraction_gaps < 1:
+        raise ValueError("fraction_gaps must be >= 0 and < 1.")
+    rng = np.random.default_rng(seed=random_state)
+    if fraction_gaps:
+        # periods to the next kept timestamp, then their cumulative sum
+        ticks = rng.geometric(p=1 - fraction_gaps, size=periods)
+        if periods:
+            ticks[0] = 0
+        np.cumsum(ticks, out=ticks)
+    else:
+        ticks = np.arange(periods, dtype=np.int64)
+    ticks *= step
+    ticks += start
+    if jitter:
+        for begin in range(0, periods, block_size):
+            end = min(begin + block_size, periods)
+            ticks[begin:end] += rng.integers(
+                low=-jitter, high=jitter + 1, size=end - begin
+            )
+    return ticks
+
+
+def _ticks_output(
+    *,
+    ticks: np.ndarray,
+    kind: str,
+    unit: str,
+    output: str,
+    name: str | None
+) -> pd.Series | pa.Array:
+    """
+    Wrap integer ticks as a datetime or timedelta Series or Arrow array,
+    without copying.
+    """
+    match output:
+        case "pandas":
+            return pd.Series(
+                ticks.view(f"{kind}64[{unit}]"), name=name, copy=False
+            )
+        case "arrow":
+            arrow_type = (
+                pa.timestamp(unit) if kind == "datetime" else pa.duration(unit)
+            )
+            return pa.Array.from_buffers(
+                arrow_type, len(ticks), [None, pa.py_buffer(ticks)]
+            )
+        case _:
+            raise ValueError('output must be "pandas" or "arrow".')
+
+
+def datetime_sequence(
+    *,
+    periods: int,
+    start: str | datetime | pd.Timestamp = "2020-01-01",
+    freq: str | timedelta | pd.Timedelta = "1h",
+    jitter: str | timedelta | pd.Timedelta | None = None,
+    fraction_gaps: float = 0.0,
+    unit: str = "ns",
+    random_state: int | np.random.Generator | None = None,
+    output: str = "pandas",
+    name: str | None = None
+) -> pd.Series | pa.Array:
+    """
+    Create a sequence of datetimes at any fixed frequency.
+
+    The datetimes are calculated as integer ticks of unit in one int64
+    array in O(n) time, which the Series or Arrow array then uses without a
+    copy. Jitter is added in blocks, so memory is one array plus a block.
+
+    Parameters
+    ----------
+    periods : int
+        The number of datetimes.
+    start : str | datetime | pd.Timestamp = "2020-01-01"
+        The first datetime, without a time zone.
+    freq : str | timedelta | pd.Timedelta = "1h"
+        The interval between datetimes, e.g. "10ms", "1s", "15min", "1D".
+    jitter : str | timedelta | pd.Timedelta | None = None
+        If given, each datetime is moved by a uniform random amount in
+        [-jitter, jitter]. A jitter larger than half of freq can change
+        the order of the datetimes.
+    fraction_gaps : float = 0.0
+        The probability of each period being skipped. The number of
+        datetimes is still periods; the sequence spans more time.
+    unit : str = "ns"
+        The resolution, "s", "ms", "us", or "ns". A coarser unit spans
+        more years.
+    random_state : int | np.random.Generator | None = None
+        The random number seed of the jitter and gaps.
+    output : str = "pandas"
+        "pandas" for a pd.Series of datetime64, or "arrow" for a
+        pyarrow TimestampArray.
+    name : str | None = None
+        The name of the Series.
+
+    Returns
+    -------
+    pd.Series | pa.Array
+        The datetimes.
+
+    Examples
+    --------
+
+    >>> import dawgdad as dd
+    >>> X = dd.datetime_sequence(periods=1_000, freq="250ms")
+
+    >>> # a billion timestamps with jitter and gaps, as an Arrow array
+    >>> X = dd.datetime_sequence(
+    ...     periods=1_000_000_000,
+    ...     freq="1s",
+    ...     jitter="100ms",
+    ...     fraction_gaps=0.01,
+    ...     unit="ms",
+    ...     random_state=42,
+    ...     output="arrow"
+    ... ) # doctest: +SKIP
+    """
+    ticks = _time_ticks(
+        periods=periods,
+        start=_datetime_ticks(value=start, unit=unit, name="start"),
+        step=_timedelta_ticks(value=freq, unit=unit, name="freq"),
+        jitter=_timedelta_ticks(value=jitter, unit=unit, name="jitter"),
+        fraction_gaps=fraction_gaps,
+        random_state=random_state
+    )
+    return _ticks_output(
+        ticks=ticks, kind="datetime", unit=unit, output=output, name=name
+    )
+
+
+def timedelta_sequence(
+    *,
+    periods: int,
+    start: str | timedelta | pd.Timedelta = "0s",
+    freq: str | timedelta | pd.Timedelta = "1h",
+    jitter: str | timedelta | pd.Timedelta | None = None,
+    fraction_gaps: float = 0.0,
+    unit: str = "ns",
+    random_state: int | np.random.Generator | None = None,
+    output: str = "pandas",
+    name: str | None = None
+) -> pd.Series | pa.Array:
+    """
+    Create a sequence of timedeltas at any fixed frequency.
+
+    The parameters are those of datetime_sequence(), with start a timedelta.
+
+    Parameters
+    ----------
+    periods : int
+        The number of timedeltas.
+    start : str | timedelta | pd.Timedelta = "0s"
+        The first timedelta.
+    freq : str | timedelta | pd.Timedelta = "1h"
+        The interval between timedeltas, e.g. "10ms", "1s", "15min", "1D".
+    jitter : str | timedelta | pd.Timedelta | None = None
+        If given, each timedelta is moved by a uniform random amount in
+        [-jitter, jitter].
+    fraction_gaps : float = 0.0
+        The probability of each period being skipped.
+    unit : str = "ns"
+        The resolution, "s", "ms", "us", or "ns".
+    random_state : int | np.random.Generator | None = None
+        The random number seed of the jitter and gaps.
+    output : str = "pandas"
+        "pandas" for a pd.Series of timedelta64, or "arrow" for a
+        pyarrow DurationArray.
+    name : str | None = None
+        The name of the Series.
+
+    Returns
+    -------
+    pd.Series | pa.Array
+        The timedeltas.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> X = dd.timedelta_sequence(periods=1_000, freq="15min", jitter="1min")
+    """
+    ticks = _time_ticks(
+        periods=periods,
+        start=_timedelta_ticks(value=start, unit=unit, name="start"),
+        step=_timedelta_ticks(value=freq, unit=unit, name="freq"),
+        jitter=_timedelta_ticks(value=jitter, unit=unit, name="jitter"),
+        fraction_gaps=fraction_gaps,
+        random_state=random_state
+    )
+    return _ticks_output(
+        ticks=ticks, kind="timedelta", unit=unit, output=output, name=name
+    )
+
+
 def one_sample_t(
     *,
     series: pd.Series,
@@ -1230,13 +2276,13 @@ def one_sample_t(
             popmean=hypothesized_value,
             alternative=alternative_hypothesis
         )
-        power = TTestPower().power(
+        power = t_test_power(
             effect_size=math.fabs(
                 (hypothesized_value - series.mean()) / series.std()
             ),
-            nobs=series.count(),
+            n=series.count(),
             alpha=significance_level,
-            alternative='two-sided'
+            alternative="two-sided"
         )
         t_value_alpha_by_two = (
             -1 * stats.t.isf(
@@ -1301,13 +2347,13 @@ def one_sample_t(
             popmean=hypothesized_value,
             alternative=alternative_hypothesis
         )
-        power = TTestPower().power(
+        power = t_test_power(
             effect_size=math.fabs(
                 (hypothesized_value - series.mean()) / series.std()
             ),
-            nobs=series.count(),
+            n=series.count(),
             alpha=significance_level,
-            alternative='smaller'
+            alternative="less"
         )
         t_value_alpha = (
             stats.t.isf(
@@ -1364,13 +2410,13 @@ def one_sample_t(
             popmean=hypothesized_value,
             alternative=alternative_hypothesis
         )
-        power = TTestPower().power(
+        power = t_test_power(
             effect_size=math.fabs(
                 (hypothesized_value - series.mean()) / series.std()
             ),
-            nobs=series.count(),
+            n=series.count(),
             alpha=significance_level,
-            alternative='larger'
+            alternative="greater"
         )
         t_value_alpha = (
             -1 * stats.t.isf(
@@ -1556,7 +2602,7 @@ def two_sample_t(
                 "There is sufficient evidence to show that the sample "\
                 "averages are different."
         case "less":
-            alternative_hypothesis_for_power = "smaller"
+            alternative_hypothesis_for_power = "less"
             message_ho =\
                 "Ho: average of sample one == average of sample two\n"\
                 "Ha: average of sample one < average of sample two\n"\
@@ -1574,7 +2620,7 @@ def two_sample_t(
                 "the average of sample 1 is less than the "\
                 "average of sample 2."
         case "greater":
-            alternative_hypothesis_for_power = "larger"
+            alternative_hypothesis_for_power = "greater"
             message_ho =\
                 "Ho: average of sample one == average of sample two\n"\
                 "Ha: average of sample one > average of sample two\n"\
@@ -1681,11 +2727,11 @@ def two_sample_t(
             equal_var=False,
             alternative=alternative_hypothesis
         )
-        power = TTestIndPower().power(
+        power = t_test_power(
             effect_size=effect_size,
-            nobs1=n_one,
+            n=n_one,
             alpha=significance_level,
-            ratio=(n_two / n_one),
+            ratio=n_two / n_one,
             alternative=alternative_hypothesis_for_power
         )
         print("t test results")
@@ -1714,11 +2760,11 @@ def two_sample_t(
             equal_var=True,
             alternative=alternative_hypothesis
         )
-        power = TTestIndPower().power(
+        power = t_test_power(
             effect_size=effect_size,
-            nobs1=n_one,
+            n=n_one,
             alpha=significance_level,
-            ratio=(n_two / n_one),
+            ratio=n_two / n_one,
             alternative=alternative_hypothesis_for_power
         )
         print("t test results")
@@ -1831,11 +2877,11 @@ def two_sample_t(
             equal_var=False,
             alternative=alternative_hypothesis
         )
-        power = TTestIndPower().power(
+        power = t_test_power(
             effect_size=effect_size,
-            nobs1=n_one,
+            n=n_one,
             alpha=significance_level,
-            ratio=(n_two / n_one),
+            ratio=n_two / n_one,
             alternative=alternative_hypothesis_for_power
         )
         print("t test results")
@@ -1872,11 +2918,11 @@ def two_sample_t(
             equal_var=True,
             alternative=alternative_hypothesis
         )
-        power = TTestIndPower().power(
+        power = t_test_power(
             effect_size=effect_size,
-            nobs1=n_one,
+            n=n_one,
             alpha=significance_level,
-            ratio=(n_two / n_one),
+            ratio=n_two / n_one,
             alternative=alternative_hypothesis_for_power
         )
         print("t test results")
@@ -2166,17 +3212,17 @@ def paired_t(
             t_critical_two_tail * series_differences_standard_deviation /
             math.sqrt(series_differences.count())
         )
-        power = TTestPower().power(
+        power = t_test_power(
             effect_size=math.fabs(
                 (series_differences_average - hypothesized_value) /
                 series_differences_standard_deviation
             ),
-            nobs=series_differences.count(),
+            n=series_differences.count(),
             alpha=significance_level,
             alternative=alternative_hypothesis_for_power
         )
     elif alternative_hypothesis == "less":
-        alternative_hypothesis_for_power = "smaller"
+        alternative_hypothesis_for_power = "less"
         message_ho =\
             "Ho: The population average of the differences = "\
             f"{hypothesized_value}\n"\
@@ -2216,17 +3262,17 @@ def paired_t(
             t_critical_one_tail * series_differences_standard_deviation /
             math.sqrt(series_differences.count())
         )
-        power = TTestPower().power(
+        power = t_test_power(
             effect_size=math.fabs(
                 (series_differences_average - hypothesized_value) /
                 series_differences_standard_deviation
             ),
-            nobs=series_differences.count(),
+            n=series_differences.count(),
             alpha=significance_level,
             alternative=alternative_hypothesis_for_power
         )
     elif alternative_hypothesis == "greater":
-        alternative_hypothesis_for_power = "larger"
+        alternative_hypothesis_for_power = "greater"
         message_ho =\
             "Ho: The population average of the differences = "\
             f"{hypothesized_value}\n"\
@@ -2261,12 +3307,12 @@ def paired_t(
             t_critical_one_tail * series_differences_standard_deviation /
             math.sqrt(series_differences.count())
         )
-        power = TTestPower().power(
+        power = t_test_power(
             effect_size=math.fabs(
                 (series_differences_average - hypothesized_value) /
                 series_differences_standard_deviation
             ),
-            nobs=series_differences.count(),
+            n=series_differences.count(),
             alpha=significance_level,
             alternative=alternative_hypothesis_for_power
         )
@@ -2497,6 +3543,492 @@ def paired_t(
     )
 
 
+def _t_test_table(
+    *,
+    estimate: np.ndarray,
+    standard_error: np.ndarray,
+    degrees_of_freedom: np.ndarray,
+    hypothesized_value: np.ndarray | float,
+    alternative_hypothesis: str,
+    significance_level: float,
+    p_adjust: str | None
+) -> dict[str, np.ndarray]:
+    """
+    t statistics, p values, confidence intervals, and adjusted p values.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_statistic = (estimate - hypothesized_value) / standard_error
+    match alternative_hypothesis:
+        case "two-sided":
+            p_value = 2 * stats.t.sf(np.abs(t_statistic), degrees_of_freedom)
+            critical = stats.t.ppf(
+                1 - significance_level / 2, degrees_of_freedom
+            )
+            lower = estimate - critical * standard_error
+            upper = estimate + critical * standard_error
+        case "less":
+            p_value = stats.t.cdf(t_statistic, degrees_of_freedom)
+            critical = stats.t.ppf(1 - significance_level, degrees_of_freedom)
+            lower = np.full_like(estimate, -np.inf)
+            upper = estimate + critical * standard_error
+        case "greater":
+            p_value = stats.t.sf(t_statistic, degrees_of_freedom)
+            critical = stats.t.ppf(1 - significance_level, degrees_of_freedom)
+            lower = estimate - critical * standard_error
+            upper = np.full_like(estimate, np.inf)
+        case _:
+            raise ValueError(
+                'alternative_hypothesis must be "two-sided", "less", or '
+                '"greater".'
+            )
+    table = {
+        "t": t_statistic,
+        "dof": degrees_of_freedom,
+        "p value": p_value,
+        "ci lower": lower,
+        "ci upper": upper,
+    }
+    if p_adjust is not None:
+        adjusted = np.full_like(p_value, np.nan)
+        valid = ~np.isnan(p_value)
+        if valid.any():
+            adjusted[valid] = multipletests(
+                pvals=p_value[valid],
+                alpha=significance_level,
+                method=p_adjust
+            )[1]
+        table["p adjusted"] = adjusted
+        table["reject"] = adjusted < significance_level
+    else:
+        table["reject"] = p_value < significance_level
+    return table
+
+
+def _normality_p_values(df: pd.DataFrame) -> np.ndarray:
+    """
+    Shapiro-Wilk p value of each column, NaN with fewer than three values.
+    """
+    p_values = []
+    for column in df.columns:
+        values = df[column].dropna()
+        p_values.append(
+            stats.shapiro(x=values).pvalue if len(values) >= 3 else np.nan
+        )
+    return np.array(p_values)
+
+
+def _anderson_darling_normal(ordered: np.ndarray) -> tuple[float, float]:
+    """
+    Anderson-Darling statistic and p value for normality from sorted values,
+    with the mean and standard deviation estimated, as
+    statsmodels.stats.diagnostic.normal_ad.
+    """
+    n = ordered.size
+    z = (ordered - ordered.mean()) / ordered.std(ddof=1)
+    i = np.arange(1, n + 1)
+    statistic = -n - np.sum(
+        (2 * i - 1) / n * (norm.logcdf(z) + norm.logsf(z[::-1]))
+    )
+    a = statistic * (1 + 0.75 / n + 2.25 / n ** 2)
+    if a < 0.2:
+        p_value = 1 - np.exp(-13.436 + 101.14 * a - 223.73 * a ** 2)
+    elif a < 0.34:
+        p_value = 1 - np.exp(-8.318 + 42.796 * a - 59.938 * a ** 2)
+    elif a < 0.6:
+        p_value = np.exp(0.9177 - 4.279 * a - 1.38 * a ** 2)
+    elif a <= 13:
+        p_value = np.exp(1.2937 - 5.709 * a + 0.0186 * a ** 2)
+    else:
+        p_value = 0.0
+    return (float(statistic), float(p_value))
+
+
+def _normality_column(
+    task: tuple[np.ndarray, tuple[str, ...], int, np.random.SeedSequence]
+) -> dict[str, float]:
+    """
+    Normality tests of one column, for a process pool.
+    """
+    values, tests, shapiro_max_size, seed = task
+    ordered = np.sort(values[~np.isnan(values)])
+    n = ordered.size
+    result = {"n": n}
+    for test in tests:
+        match test:
+            case "shapiro":
+                sample = ordered
+                if n > shapiro_max_size:
+                    # a random subsample of a sorted array is sorted
+                    rng = np.random.default_rng(seed=seed)
+                    sample = ordered[np.sort(rng.choice(
+                        n, size=shapiro_max_size, replace=False
+                    ))]
+                statistic, p_value = (
+                    stats.shapiro(x=sample) if n >= 3 else (np.nan, np.nan)
+                )
+                result["shapiro n"] = sample.size
+                result["shapiro statistic"] = statistic
+                result["shapiro p value"] = p_value
+            case "anderson":
+                statistic, p_value = (
+                    _anderson_darling_normal(ordered) if n >= 3
+                    else (np.nan, np.nan)
+                )
+                result["anderson statistic"] = statistic
+                result["anderson p value"] = p_value
+            case "kolmogorov-smirnov":
+                statistic, p_value = (
+                    smd.kstest_normal(
+                        x=ordered, dist="norm", pvalmethod="approx"
+                    ) if n >= 4 else (np.nan, np.nan)
+                )
+                result["kolmogorov-smirnov statistic"] = statistic
+                result["kolmogorov-smirnov p value"] = p_value
+    return result
+
+
+def normality_tests(
+    *,
+    df: pd.DataFrame,
+    tests: tuple[str, ...] = ("shapiro", "anderson", "kolmogorov-smirnov"),
+    significance_level: float = 0.05,
+    shapiro_max_size: int = 5000,
+    random_state: int | None = None,
+    max_workers: int | None = None
+) -> pd.DataFrame:
+    """
+    Normality tests of every column of a DataFrame, without printing.
+
+    Each column is sorted once and the sorted values are shared by the
+    tests. The Anderson-Darling statistic is calculated directly from them.
+    Shapiro-Wilk p values are inaccurate above 5000 values, so a larger
+    column is tested with a random subsample of shapiro_max_size values.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        One feature per column. Missing values are ignored.
+    tests : tuple[str, ...] = ("shapiro", "anderson", "kolmogorov-smirnov")
+        The tests to run: "shapiro" (Shapiro-Wilk), "anderson"
+        (Anderson-Darling, p value as statsmodels normal_ad), and
+        "kolmogorov-smirnov" (Lilliefors, as statsmodels kstest_normal).
+    significance_level : float = 0.05
+        The significance level for rejecting normality.
+    shapiro_max_size : int = 5000
+        The largest number of values used by the Shapiro-Wilk test.
+    random_state : int | None = None
+        The random number seed of the subsamples. Each column gets an
+        independent stream, so the results do not depend on max_workers.
+    max_workers : int | None = None
+        The number of processes used. None runs in this process.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per column with n, the statistic and p value of each test,
+        shapiro n (the number of values tested), and normal (True if no
+        test rejects normality). Tests need at least three values (four
+        for Kolmogorov-Smirnov) and are NaN otherwise; normal is False
+        when no test could be run.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({
+    ...     "a": dd.random_data(random_state=1),
+    ...     "b": dd.random_data(distribution="uniform", random_state=2),
+    ... })
+    >>> result = dd.normality_tests(df=df)
+    """
+    for test in tests:
+        if test not in ("shapiro", "anderson", "kolmogorov-smirnov"):
+            raise ValueError(
+                'tests must be "shapiro", "anderson", or '
+                '"kolmogorov-smirnov".'
+            )
+    seeds = np.random.SeedSequence(entropy=random_state).spawn(df.shape[1])
+    tasks = [
+        (
+            df[column].to_numpy(dtype="float64", na_value=np.nan),
+            tuple(tests),
+            shapiro_max_size,
+            seed
+        )
+        for column, seed in zip(df.columns, seeds)
+    ]
+    if max_workers and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_normality_column, tasks))
+    else:
+        results = [_normality_column(task) for task in tasks]
+    table = pd.DataFrame(data=results, index=df.columns)
+    p_values = table.filter(like="p value")
+    table["normal"] = (
+        p_values.notna().any(axis=1)
+        & ~(p_values < significance_level).any(axis=1)
+    )
+    return table
+
+
+def one_sample_t_many(
+    *,
+    df: pd.DataFrame,
+    hypothesized_value: int | float | pd.Series = 0,
+    alternative_hypothesis: str = "two-sided",
+    significance_level: float = 0.05,
+    p_adjust: str | None = "fdr_bh",
+    check_assumptions: bool = False
+) -> pd.DataFrame:
+    """
+    One-sample t test of every column of a DataFrame, without printing.
+
+    The statistics of all the columns are calculated with vectorized
+    formulas. The p values are adjusted for the number of tests, by
+    default for the false discovery rate (Benjamini-Hochberg).
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        One sample per column. Missing values are ignored.
+    hypothesized_value : int | float | pd.Series = 0
+        The hypothesized value, or one per column as a Series indexed by
+        column.
+    alternative_hypothesis : str = "two-sided"
+        "two-sided", "less", or "greater".
+    significance_level : float = 0.05
+        The significance level for rejecting the null hypothesis, and the
+        confidence level (1 - significance_level) of the intervals.
+    p_adjust : str | None = "fdr_bh"
+        The method of statsmodels.stats.multitest.multipletests, or None
+        for no adjustment.
+    check_assumptions : bool = False
+        If True, add the Shapiro-Wilk p value of each column.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per column with n, average, s, t, dof, p value, ci lower,
+        ci upper, p adjusted (unless p_adjust is None), reject, power (at
+        the observed effect size), and normality p value (if
+        check_assumptions).
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({
+    ...     "a": dd.random_data(random_state=1),
+    ...     "b": dd.random_data(random_state=2),
+    ... })
+    >>> result = dd.one_sample_t_many(df=df, hypothesized_value=0)
+    """
+    n = df.count().to_numpy(dtype="float64")
+    average = df.mean().to_numpy()
+    s = df.std().to_numpy()
+    if isinstance(hypothesized_value, pd.Series):
+        hypothesized_value = hypothesized_value.reindex(df.columns).to_numpy()
+    table = {
+        "n": n.astype(np.int64),
+        "average": average,
+        "s": s,
+    } | _t_test_table(
+        estimate=average,
+        standard_error=s / np.sqrt(n),
+        degrees_of_freedom=n - 1,
+        hypothesized_value=hypothesized_value,
+        alternative_hypothesis=alternative_hypothesis,
+        significance_level=significance_level,
+        p_adjust=p_adjust
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table["power"] = t_test_power(
+            effect_size=(average - hypothesized_value) / s,
+            n=n,
+            alpha=significance_level,
+            alternative=alternative_hypothesis
+        )
+    if check_assumptions:
+        table["normality p value"] = _normality_p_values(df)
+    return pd.DataFrame(data=table, index=df.columns)
+
+
+def two_sample_t_many(
+    *,
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    alternative_hypothesis: str = "two-sided",
+    significance_level: float = 0.05,
+    equal_var: bool = False,
+    p_adjust: str | None = "fdr_bh",
+    check_assumptions: bool = False
+) -> pd.DataFrame:
+    """
+    Two-sample t test of every column of two DataFrames, without printing.
+
+    Column c of df1 is compared with column c of df2, e.g. each process
+    metric before and after an engineering change. The samples may have
+    different numbers of rows.
+
+    Parameters
+    ----------
+    df1 : pd.DataFrame
+        The first samples, one per column.
+    df2 : pd.DataFrame
+        The second samples, with the same columns.
+    alternative_hypothesis : str = "two-sided"
+        "two-sided", "less" (average 1 < average 2), or "greater".
+    significance_level : float = 0.05
+        The significance level for rejecting the null hypothesis, and the
+        confidence level (1 - significance_level) of the intervals.
+    equal_var : bool = False
+        If True, use the pooled variance. If False, use Welch's test.
+    p_adjust : str | None = "fdr_bh"
+        The method of statsmodels.stats.multitest.multipletests, or None
+        for no adjustment.
+    check_assumptions : bool = False
+        If True, add the Shapiro-Wilk p values of each sample and the
+        Levene p value of equal variances.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per column with n1, n2, average1, average2, s1, s2,
+        difference, t, dof, p value, ci lower, ci upper (of the
+        difference), p adjusted (unless p_adjust is None), reject, power
+        (at the observed effect size, with the pooled standard deviation),
+        and the assumption p values (if check_assumptions).
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> before = pd.DataFrame({
+    ...     "a": dd.random_data(random_state=1),
+    ...     "b": dd.random_data(random_state=2),
+    ... })
+    >>> after = before + 0.5
+    >>> result = dd.two_sample_t_many(df1=before, df2=after)
+    """
+    columns = df1.columns
+    df2 = df2[columns]
+    n1 = df1.count().to_numpy(dtype="float64")
+    n2 = df2.count().to_numpy(dtype="float64")
+    average1 = df1.mean().to_numpy()
+    average2 = df2.mean().to_numpy()
+    var1 = df1.var().to_numpy()
+    var2 = df2.var().to_numpy()
+    if equal_var:
+        degrees_of_freedom = n1 + n2 - 2
+        pooled = ((n1 - 1) * var1 + (n2 - 1) * var2) / degrees_of_freedom
+        standard_error = np.sqrt(pooled * (1 / n1 + 1 / n2))
+    else:
+        a1 = var1 / n1
+        a2 = var2 / n2
+        standard_error = np.sqrt(a1 + a2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            degrees_of_freedom = (a1 + a2) ** 2 / (
+                a1 ** 2 / (n1 - 1) + a2 ** 2 / (n2 - 1)
+            )
+    table = {
+        "n1": n1.astype(np.int64),
+        "n2": n2.astype(np.int64),
+        "average1": average1,
+        "average2": average2,
+        "s1": np.sqrt(var1),
+        "s2": np.sqrt(var2),
+        "difference": average1 - average2,
+    } | _t_test_table(
+        estimate=average1 - average2,
+        standard_error=standard_error,
+        degrees_of_freedom=degrees_of_freedom,
+        hypothesized_value=0,
+        alternative_hypothesis=alternative_hypothesis,
+        significance_level=significance_level,
+        p_adjust=p_adjust
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table["power"] = t_test_power(
+            effect_size=(average1 - average2) / np.sqrt(
+                ((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2)
+            ),
+            n=n1,
+            alpha=significance_level,
+            alternative=alternative_hypothesis,
+            ratio=n2 / n1
+        )
+    if check_assumptions:
+        table["normality p value 1"] = _normality_p_values(df1)
+        table["normality p value 2"] = _normality_p_values(df2)
+        table["levene p value"] = np.array([
+            stats.levene(df1[column].dropna(), df2[column].dropna()).pvalue
+            for column in columns
+        ])
+    return pd.DataFrame(data=table, index=columns)
+
+
+def paired_t_many(
+    *,
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    alternative_hypothesis: str = "two-sided",
+    significance_level: float = 0.05,
+    p_adjust: str | None = "fdr_bh",
+    check_assumptions: bool = False
+) -> pd.DataFrame:
+    """
+    Paired t test of every column of two DataFrames, without printing.
+
+    Row i of column c of df1 is paired with row i of column c of df2. Pairs
+    with a missing value are ignored.
+
+    Parameters
+    ----------
+    df1 : pd.DataFrame
+        The first measurements, one column per metric.
+    df2 : pd.DataFrame
+        The second measurements, with the same index and columns.
+    alternative_hypothesis : str = "two-sided"
+        "two-sided", "less" (average difference 1 - 2 < 0), or "greater".
+    significance_level : float = 0.05
+        The significance level for rejecting the null hypothesis, and the
+        confidence level (1 - significance_level) of the intervals.
+    p_adjust : str | None = "fdr_bh"
+        The method of statsmodels.stats.multitest.multipletests, or None
+        for no adjustment.
+    check_assumptions : bool = False
+        If True, add the Shapiro-Wilk p value of the differences.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per column with n, average difference, s, t, dof, p value,
+        ci lower, ci upper, p adjusted (unless p_adjust is None), reject,
+        power, and normality p value (if check_assumptions).
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> before = pd.DataFrame({
+    ...     "a": dd.random_data(random_state=1),
+    ...     "b": dd.random_data(random_state=2),
+    ... })
+    >>> after = before + dd.random_data(random_state=3).to_numpy()[:, None]
+    >>> result = dd.paired_t_many(df1=before, df2=after)
+    """
+    differences = df1 - df2[df1.columns]
+    result = one_sample_t_many(
+        df=differences,
+        hypothesized_value=0,
+        alternative_hypothesis=alternative_hypothesis,
+        significance_level=significance_level,
+        p_adjust=p_adjust,
+        check_assumptions=check_assumptions
+    )
+    return result.rename(columns={"average": "average difference"})
+
+
 def linear_regression(
     *,
     X: pd.Series,
@@ -2510,6 +4042,11 @@ def linear_regression(
     Linear regression of one X series and one Y series. The variables
     are integers or floats. The X and y values must be sorted by X.
 
+    The 95 % confidence and prediction intervals are calculated from the
+    leverage of each row, the squared norm of the row times the inverse of
+    the R factor of X. Time and memory grow linearly with the number of
+    rows.
+
     Parameters
     ----------
     X : pd.Series
@@ -2578,19 +4115,23 @@ def linear_regression(
         cov_type="nonrobust"
     )
 
+    # leverages x (X'X)^-1 x' of every row from the R factor of the fitted
+    # rows, in O(n p) without the n x n hat matrix; rows with a missing X
+    # were dropped from the fit and get a missing leverage, not an error
+    r = np.linalg.qr(fitted_model.model.exog, mode="r")
+    leverage = np.square(
+        solve_triangular(
+            r, np.asarray(X, dtype="float64").T, trans="T", check_finite=False
+        )
+    ).sum(axis=0)
+    t_crit = stats.t.ppf(0.975, fitted_model.df_resid)
     predictions = fitted_model.predict(X)
-    # Confidence intervals
-    # Note: statsmodels 0.14.2 doesn't directly provide confidence intervals, so we calculate them manually
-    pred_std_err = np.sqrt(fitted_model.scale * np.diag(X.dot(np.linalg.inv(X.T.dot(X)).dot(X.T))))
-    t_values = np.abs(fitted_model.tvalues)
-    df_resid = fitted_model.df_resid  # Degrees of freedom for residuals
-    conf_level = 0.95
-    t_crit = np.abs(fitted_model.t_test(np.eye(len(fitted_model.params))).tvalue[1])  # Critical t-value
+    # confidence intervals of the average
+    pred_std_err = np.sqrt(fitted_model.scale * leverage)
     confidence_interval_lower = predictions - t_crit * pred_std_err
     confidence_interval_upper = predictions + t_crit * pred_std_err
-    # Prediction intervals (approximate)
-    # Note: This is an approximation. For more accurate intervals, consider using bootstrapping or other methods.
-    pred_std_err_pred = np.sqrt(fitted_model.scale * (1 + np.diag(X.dot(np.linalg.inv(X.T.dot(X)).dot(X.T)))))
+    # prediction intervals of a new observation
+    pred_std_err_pred = np.sqrt(fitted_model.scale * (1 + leverage))
     prediction_interval_lower = predictions - t_crit * pred_std_err_pred
     prediction_interval_upper = predictions + t_crit * pred_std_err_pred
 
@@ -2609,16 +4150,439 @@ def linear_regression(
     )
 
 
+class StreamingOLS:
+    """
+    Ordinary least squares accumulated chunk by chunk.
+
+    Each chunk is QR factored with y as the last column, and its R factor
+    is stacked under the R factor of the chunks before it and factored
+    again. The state is a (p + 1) x (p + 1) triangle, the number of rows,
+    and the average and sum of squared deviations of y, so memory does not
+    grow with the data. The R factor is numerically stable where X'X would
+    square the condition number. Accumulators of separate chunks, files, or
+    workers are combined with merge().
+
+    Parameters
+    ----------
+    add_constant : bool = True
+        If True, an intercept named "const" is added to the columns of X.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> rng = np.random.default_rng(42)
+    >>> model = dd.StreamingOLS()
+    >>> for _ in range(10):
+    ...     X = pd.DataFrame({"x": rng.uniform(0, 10, 100_000)})
+    ...     y = 3 + 2 * X["x"] + rng.normal(0, 1, 100_000)
+    ...     model = model.update(X=X, y=y)
+    >>> model.params.round(1).tolist()
+    [3.0, 2.0]
+    """
+    def __init__(self, add_constant: bool = True):
+        self.add_constant = add_constant
+        self.names: list[str] | None = None
+        self.nobs = 0
+        self._r: np.ndarray | None = None
+        self._y_mean = 0.0
+        self._y_m2 = 0.0
+
+    def _design(self, X: pd.DataFrame | pd.Series | np.ndarray) -> np.ndarray:
+        """
+        The float matrix of X, with the intercept first.
+        """
+        if isinstance(X, pd.Series):
+            X = X.to_frame()
+        if isinstance(X, pd.DataFrame) and self.names is not None:
+            # the columns of later chunks are matched by name, not position
+            columns = self.names[1:] if self.add_constant else self.names
+            X = X.rename(columns=str)
+            if set(columns) - set(X.columns):
+                raise ValueError(
+                    "X must have the same columns in every chunk."
+                )
+            X = X[columns]
+        x = np.asarray(X, dtype="float64")
+        if x.ndim == 1:
+            x = x[:, np.newaxis]
+        if self.names is None:
+            columns = (
+                [str(column) for column in X.columns]
+                if isinstance(X, pd.DataFrame)
+                else [f"x{i + 1}" for i in range(x.shape[1])]
+            )
+            self.names = ["const", *columns] if self.add_constant else columns
+        if self.add_constant:
+            x = np.column_stack((np.ones(x.shape[0]), x))
+        if x.shape[1] != len(self.names):
+            raise ValueError("X must have the same columns in every chunk.")
+        return x
+
+    def update(
+        self,
+        X: pd.DataFrame | pd.Series | np.ndarray,
+        y: pd.Series | np.ndarray,
+        block_size: int = 65_536
+    ) -> "StreamingOLS":
+        """
+        Add a chunk of rows.
+
+        Rows with a missing value are dropped.
+
+        Parameters
+        ----------
+        X : pd.DataFrame | pd.Series | np.ndarray
+            The independent variables.
+        y : pd.Series | np.ndarray
+            The dependent variable.
+        block_size : int = 65_536
+            The number of rows factored at once.
+
+        Returns
+        -------
+        StreamingOLS
+            This accumulator.
+        """
+        x = self._design(X)
+        y = np.asarray(y, dtype="float64").ravel()
+        finite = np.isfinite(x).all(axis=1) & np.isfinite(y)
+        if not finite.all():
+            x, y = x[finite], y[finite]
+        if y.size == 0:
+            return self
+        r = self._r if self._r is not None else np.empty((0, x.shape[1] + 1))
+        for start in range(0, y.size, block_size):
+            stop = start + block_size
+            block = np.column_stack((x[start:stop], y[start:stop]))
+            r = np.linalg.qr(np.vstack((r, block)), mode="r")
+        self._r = r
+        mean = y.mean()
+        self._combine(nobs=y.size, mean=mean, m2=np.square(y - mean).sum())
+        return self
+
+    def _combine(self, *, nobs: int, mean: float, m2: float) -> None:
+        """
+        Combine the average and sum of squared deviations of y.
+        """
+        total = self.nobs + nobs
+        delta = mean - self._y_mean
+        self._y_mean += delta * nobs / total
+        self._y_m2 += m2 + delta * delta * self.nobs * nobs / total
+        self.nobs = total
+
+    def merge(self, other: "StreamingOLS") -> "StreamingOLS":
+        """
+        Add the rows of another accumulator.
+
+        Parameters
+        ----------
+        other : StreamingOLS
+            An accumulator with the same columns.
+
+        Returns
+        -------
+        StreamingOLS
+            This accumulator.
+        """
+        if other._r is None:
+            return self
+        if other.add_constant != self.add_constant or (
+            self.names is not None and other.names != self.names
+        ):
+            raise ValueError("The accumulators have different columns.")
+        if self._r is None:
+            self.names = list(other.names)
+            self._r = other._r.copy()
+        else:
+            self._r = np.linalg.qr(np.vstack((self._r, other._r)), mode="r")
+        self._combine(nobs=other.nobs, mean=other._y_mean, m2=other._y_m2)
+        return self
+
+    def _check_rows(self) -> None:
+        """
+        Raise a ValueError if there are fewer rows than coefficients.
+        """
+        if self._r is None or self._r.shape[0] < len(self.names):
+            raise ValueError("There are fewer rows than coefficients.")
+
+    @property
+    def df_resid(self) -> int:
+        """
+        Residual degrees of freedom
+        """
+        self._check_rows()
+        return self.nobs - len(self.names)
+
+    def _check_df_resid(self) -> int:
+        """
+        The residual degrees of freedom, with a ValueError if there are none.
+        """
+        df_resid = self.df_resid
+        if df_resid == 0:
+            raise ValueError(
+                "There must be more rows than coefficients to estimate the "
+                "residual variance."
+            )
+        return df_resid
+
+    def _triangle(self) -> np.ndarray:
+        """
+        The R factor of X.
+        """
+        self._check_rows()
+        p = len(self.names)
+        return self._r[:p, :p]
+
+    @property
+    def params(self) -> pd.Series:
+        """
+        Coefficients
+        """
+        triangle = self._triangle()
+        p = len(self.names)
+        return pd.Series(
+            data=solve_triangular(triangle, self._r[:p, p]),
+            index=self.names
+        )
+
+    @property
+    def ssr(self) -> float:
+        """
+        Residual sum of squares
+        """
+        self._check_rows()
+        p = len(self.names)
+        return float(self._r[p, p] ** 2) if self._r.shape[0] > p else 0.0
+
+    @property
+    def scale(self) -> float:
+        """
+        Residual variance
+        """
+        return self.ssr / self._check_df_resid()
+
+    def cov_params(self) -> pd.DataFrame:
+        """
+        Covariance matrix of the coefficients, scale (X'X)^-1.
+
+        Returns
+        -------
+        pd.DataFrame
+            The covariances, with the names of the coefficients as index and
+            columns.
+        """
+        inverse = solve_triangular(self._triangle(), np.eye(len(self.names)))
+        return pd.DataFrame(
+            data=self.scale * inverse @ inverse.T,
+            index=self.names,
+            columns=self.names
+        )
+
+    @property
+    def bse(self) -> pd.Series:
+        """
+        Standard errors of the coefficients
+        """
+        return pd.Series(
+            data=np.sqrt(np.diag(self.cov_params())), index=self.names
+        )
+
+    @property
+    def rsquared(self) -> float:
+        """
+        Coefficient of determination, uncentred without an intercept
+        """
+        total = self._y_m2
+        if not self.add_constant:
+            total += self.nobs * self._y_mean ** 2
+        return 1 - self.ssr / total
+
+    @property
+    def rsquared_adj(self) -> float:
+        """
+        Adjusted coefficient of determination
+        """
+        return 1 - (
+            (self.nobs - self.add_constant) / self._check_df_resid()
+            * (1 - self.rsquared)
+        )
+
+    def summary(self, alpha: float = 0.05) -> pd.DataFrame:
+        """
+        Table of the coefficients.
+
+        Parameters
+        ----------
+        alpha : float = 0.05
+            The significance level of the confidence intervals.
+
+        Returns
+        -------
+        pd.DataFrame
+            The coefficient, standard error, t value, p value, and lower and
+            upper confidence limits of each coefficient.
+        """
+        params = self.params
+        bse = self.bse
+        tvalues = params / bse
+        t_crit = stats.t.ppf(1 - alpha / 2, self.df_resid)
+        return pd.DataFrame(
+            data={
+                "coef": params,
+                "std err": bse,
+                "t": tvalues,
+                "p": 2 * stats.t.sf(np.abs(tvalues), self.df_resid),
+                "lower": params - t_crit * bse,
+                "upper": params + t_crit * bse,
+            }
+        )
+
+    def predict(
+        self,
+        X: pd.DataFrame | pd.Series | np.ndarray,
+        alpha: float = 0.05
+    ) -> pd.DataFrame:
+        """
+        Predictions with confidence and prediction intervals.
+
+        The leverage of each row is calculated from the R factor, so time and
+        memory grow linearly with the number of rows of X.
+
+        Parameters
+        ----------
+        X : pd.DataFrame | pd.Series | np.ndarray
+            The independent variables, with the columns used to fit.
+        alpha : float = 0.05
+            The significance level of the intervals.
+
+        Returns
+        -------
+        pd.DataFrame
+            The columns mean, mean_ci_lower, mean_ci_upper, obs_ci_lower,
+            and obs_ci_upper, with the index of X if it has one.
+        """
+        # an empty accumulator raises before X can set the column names
+        self._check_rows()
+        x = self._design(X)
+        mean = x @ self.params.to_numpy()
+        leverage = np.square(
+            solve_triangular(
+                self._triangle(), x.T, trans="T", check_finite=False
+            )
+        ).sum(axis=0)
+        t_crit = stats.t.ppf(1 - alpha / 2, self.df_resid)
+        mean_se = np.sqrt(self.scale * leverage)
+        obs_se = np.sqrt(self.scale * (1 + leverage))
+        return pd.DataFrame(
+            data={
+                "mean": mean,
+                "mean_ci_lower": mean - t_crit * mean_se,
+                "mean_ci_upper": mean + t_crit * mean_se,
+                "obs_ci_lower": mean - t_crit * obs_se,
+                "obs_ci_upper": mean + t_crit * obs_se,
+            },
+            index=getattr(X, "index", None)
+        )
+
+
+def _streaming_ols_chunk(
+    task: tuple[pd.DataFrame, list[str], str, bool]
+) -> StreamingOLS:
+    """
+    StreamingOLS of one chunk, for a thread pool.
+    """
+    df, X, y, add_constant = task
+    return StreamingOLS(add_constant=add_constant).update(X=df[X], y=df[y])
+
+
+def linear_regression_chunks(
+    *,
+    chunks: Iterable[pd.DataFrame],
+    X: list[str],
+    y: str,
+    add_constant: bool = True,
+    max_workers: int | None = None
+) -> StreamingOLS:
+    """
+    Linear regression of data too large for memory, one chunk at a time.
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        The DataFrames, e.g. from pd.read_csv(chunksize=...),
+        create_dataframe_chunks(), or the batches of a parquet file.
+    X : list[str]
+        The columns of the independent variables.
+    y : str
+        The column of the dependent variable.
+    add_constant : bool = True
+        If True, an intercept is fitted.
+    max_workers : int | None = None
+        The number of threads factoring chunks. None factors them in this
+        thread. At most max_workers chunks are read ahead.
+
+    Returns
+    -------
+    StreamingOLS
+        The fitted accumulator, which can be updated or merged further.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> model = dd.linear_regression_chunks(
+    ...     chunks=pd.read_csv("historian.csv", chunksize=1_000_000),
+    ...     X=["temperature", "pressure"],
+    ...     y="thickness",
+    ...     max_workers=4
+    ... ) # doctest: +SKIP
+    >>> model.summary() # doctest: +SKIP
+    """
+    model = StreamingOLS(add_constant=add_constant)
+    tasks = ((df, X, y, add_constant) for df in chunks)
+    if not max_workers:
+        for task in tasks:
+            model.merge(_streaming_ols_chunk(task))
+        return model
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(_streaming_ols_chunk, task))
+            if len(pending) > max_workers:
+                model.merge(pending.popleft().result())
+        while pending:
+            model.merge(pending.popleft().result())
+    return model
+
+
 __all__ = (
+    "nonparametric_summaries",
+    "nonparametric_summary_grouped",
     "nonparametric_summary",
+    "parametric_summary_grouped",
     "natural_cubic_spline",
+    "natural_spline_cv",
+    "natural_spline",
+    "NaturalSpline",
+    "normality_tests",
     "parametric_summary",
+    "linear_regression_chunks",
     "linear_regression",
+    "StreamingOLS",
+    "one_sample_t_many",
+    "two_sample_t_many",
+    "timedelta_sequence",
+    "datetime_sequence",
     "timedelta_data",
     "datetime_data",
+    "cubic_spline_grouped",
     "cubic_spline",
     "two_sample_t",
     "one_sample_t",
+    "random_data_chunks",
     "random_data",
+    "paired_t_many",
     "paired_t",
 )
@@ -2,6 +2,11 @@
 Taguchi Methods
 """
 
+from typing import Iterable
+
+import pandas as pd
+import numpy as np
+
 
 def taguchi_loss_function(
     *,
@@ -81,6 +86,442 @@ def taguchi_loss_function(
     return acu
 
 
+_L12 = np.array([
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+    [1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2],
+    [1, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2],
+    [1, 2, 1, 2, 2, 1, 2, 2, 1, 1, 2],
+    [1, 2, 2, 1, 2, 2, 1, 2, 1, 2, 1],
+    [1, 2, 2, 2, 1, 2, 2, 1, 2, 1, 1],
+    [2, 1, 2, 2, 1, 1, 2, 2, 1, 2, 1],
+    [2, 1, 2, 1, 2, 2, 2, 1, 1, 1, 2],
+    [2, 1, 1, 2, 2, 2, 1, 2, 2, 1, 1],
+    [2, 2, 2, 1, 1, 1, 1, 2, 2, 1, 2],
+    [2, 2, 1, 2, 1, 2, 1, 1, 1, 2, 2],
+    [2, 2, 1, 1, 2, 1, 2, 1, 2, 2, 1],
+])
+_L18 = np.array([
+    [1, 1, 1, 1, 1, 1, 1, 1],
+    [1, 1, 2, 2, 2, 2, 2, 2],
+    [1, 1, 3, 3, 3, 3, 3, 3],
+    [1, 2, 1, 1, 2, 2, 3, 3],
+    [1, 2, 2, 2, 3, 3, 1, 1],
+    [1, 2, 3, 3, 1, 1, 2, 2],
+    [1, 3, 1, 2, 1, 3, 2, 3],
+    [1, 3, 2, 3, 2, 1, 3, 1],
+    [1, 3, 3, 1, 3, 2, 1, 2],
+    [2, 1, 1, 3, 3, 2, 2, 1],
+    [2, 1, 2, 1, 1, 3, 3, 2],
+    [2, 1, 3, 2, 2, 1, 1, 3],
+    [2, 2, 1, 2, 3, 1, 3, 2],
+    [2, 2, 2, 3, 1, 2, 1, 3],
+    [2, 2, 3, 1, 2, 3, 2, 1],
+    [2, 3, 1, 3, 2, 3, 1, 2],
+    [2, 3, 2, 1, 3, 1, 2, 3],
+    [2, 3, 3, 2, 1, 2, 3, 1],
+])
+# Coefficients of the base factors (A, B) and (A, B, C) for the columns of the
+# three-level arrays, in the standard Taguchi column order.
+_L9_COEFFICIENTS = np.array([[1, 0], [0, 1], [1, 1], [2, 1]])
+_L27_COEFFICIENTS = np.array([
+    [1, 0, 0], [0, 1, 0], [1, 1, 0], [2, 1, 0], [0, 0, 1], [1, 0, 1],
+    [2, 0, 1], [0, 1, 1], [1, 1, 1], [2, 1, 1], [0, 2, 1], [1, 2, 1],
+    [2, 2, 1],
+])
+
+
+def _two_level_array(number_factors: int) -> np.ndarray:
+    """
+    Two-level array with 2 ** number_factors runs in standard Taguchi order.
+
+    Column j is the parity of the bits of j and of the bit-reversed run
+    number, so columns 1, 2, 4, ... are the base factors and the others are
+    their interactions.
+    """
+    runs = 2 ** number_factors
+    run = np.arange(runs)
+    reversed_run = np.zeros_like(run)
+    for bit in range(number_factors):
+        reversed_run |= ((run >> bit) & 1) << (number_factors - 1 - bit)
+    column = np.arange(1, runs)
+    bits = reversed_run[:, np.newaxis] & column[np.newaxis, :]
+    parity = np.zeros_like(bits)
+    for bit in range(number_factors):
+        parity ^= (bits >> bit) & 1
+    return parity + 1
+
+
+def _three_level_array(coefficients: np.ndarray) -> np.ndarray:
+    """
+    Three-level array from the coefficients of its columns over GF(3).
+    """
+    number_factors = coefficients.shape[1]
+    run = np.arange(3 ** number_factors)
+    base = np.stack(
+        [
+            (run // 3 ** (number_factors - 1 - factor)) % 3
+            for factor in range(number_factors)
+        ],
+        axis=1
+    )
+    return (base @ coefficients.T) % 3 + 1
+
+
+def orthogonal_array(*, name: str) -> pd.DataFrame:
+    """
+    Standard Taguchi orthogonal array.
+
+    Parameters
+    ----------
+    name : str
+        One of "L4", "L8", "L9", "L12", "L16", "L18", "L27".
+
+    Returns
+    -------
+    pd.DataFrame
+        The design matrix with one row per run (index "run", from 1) and one
+        column per array column (from 1). The levels are 1, 2, (3).
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> design = dd.orthogonal_array(name="L9")
+    >>> design
+         1  2  3  4
+    run
+    1    1  1  1  1
+    2    1  2  2  2
+    3    1  3  3  3
+    4    2  1  2  3
+    5    2  2  3  1
+    6    2  3  1  2
+    7    3  1  3  2
+    8    3  2  1  3
+    9    3  3  2  1
+    """
+    match name:
+        case "L4":
+            array = _two_level_array(number_factors=2)
+        case "L8":
+            array = _two_level_array(number_factors=3)
+        case "L16":
+            array = _two_level_array(number_factors=4)
+        case "L9":
+            array = _three_level_array(coefficients=_L9_COEFFICIENTS)
+        case "L27":
+            array = _three_level_array(coefficients=_L27_COEFFICIENTS)
+        case "L12":
+            array = _L12.copy()
+        case "L18":
+            array = _L18.copy()
+        case _:
+            raise ValueError(f"Orthogonal array {name} is not implemented.")
+    return pd.DataFrame(
+        data=array,
+        index=pd.RangeIndex(start=1, stop=array.shape[0] + 1, name="run"),
+        columns=range(1, array.shape[1] + 1)
+    )
+
+
+def signal_to_noise(
+    *,
+    y: pd.DataFrame | np.ndarray,
+    goal: str = "nominal",
+) -> pd.Series | np.ndarray:
+    """
+    Taguchi signal-to-noise ratio of the replicates of each run.
+
+    Parameters
+    ----------
+    y : pd.DataFrame | np.ndarray
+        The responses, one row per run and one column per replicate.
+        Missing values are ignored.
+    goal : str = "nominal"
+        "nominal" for nominal-the-best, 10 log10(average ** 2 / s ** 2),
+        "smaller" for smaller-the-better, -10 log10(mean(y ** 2)),
+        "larger" for larger-the-better, -10 log10(mean(1 / y ** 2)).
+
+    Returns
+    -------
+    pd.Series | np.ndarray
+        The S/N ratio in dB of each run.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> y = pd.DataFrame({"r1": [10.1, 9.6, 10.4], "r2": [9.9, 10.5, 10.2]})
+    >>> sn = dd.signal_to_noise(y=y, goal="nominal")
+    """
+    values = np.asarray(y, dtype=np.float64)
+    match goal:
+        case "nominal":
+            ratio = 10 * np.log10(
+                np.nanmean(values, axis=1) ** 2
+                / np.nanvar(values, axis=1, ddof=1)
+            )
+        case "smaller":
+            ratio = -10 * np.log10(np.nanmean(values ** 2, axis=1))
+        case "larger":
+            ratio = -10 * np.log10(np.nanmean(1 / values ** 2, axis=1))
+        case _:
+            raise ValueError(f"S/N ratio goal {goal} is not implemented.")
+    if isinstance(y, pd.DataFrame):
+        return pd.Series(data=ratio, index=y.index, name=f"sn_{goal}")
+    return ratio
+
+
+def response_table(
+    *,
+    design: pd.DataFrame,
+    responses: pd.DataFrame | pd.Series,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Main effects (level averages) of every factor for every response.
+
+    The design is one-hot encoded with array indexing and the level averages
+    of all factors and all responses come from one matrix product, so many
+    responses from one experiment are screened at once.
+
+    Parameters
+    ----------
+    design : pd.DataFrame
+        The design matrix, one row per run and one column per factor,
+        e.g. the output of orthogonal_array() with the factor columns
+        renamed.
+    responses : pd.DataFrame | pd.Series
+        The responses, one row per run in the same order as design and one
+        column per response, e.g. S/N ratios or averages.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, pd.DataFrame]
+        A tuple of the response table and the delta table.
+
+        - table : pd.DataFrame
+            The average of each response (columns) at each (factor, level)
+            (rows).
+        - delta : pd.DataFrame
+            The largest minus the smallest level average of each factor
+            (rows) for each response (columns), and its rank ("rank",
+            response), 1 for the largest effect.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> design = dd.orthogonal_array(name="L8").iloc[:, [0, 1, 3]]
+    >>> design.columns = ["A", "B", "C"]
+    >>> responses = pd.DataFrame({
+    ...     "y1": [10, 12, 11, 15, 13, 14, 12, 16],
+    ...     "y2": [1.1, 1.3, 1.2, 1.0, 1.4, 1.2, 1.1, 1.5],
+    ... })
+    >>> table, delta = dd.response_table(design=design, responses=responses)
+    """
+    if isinstance(responses, pd.Series):
+        responses = responses.to_frame()
+    factors = list(design.columns)
+    codes = np.asarray(design, dtype=np.int64)
+    levels = codes.max(initial=1)
+    runs, number_factors = codes.shape
+    columns = (codes - 1) + np.arange(number_factors) * levels
+    indicator = np.zeros((runs, number_factors * levels))
+    indicator[np.arange(runs)[:, np.newaxis], columns] = 1
+    counts = indicator.sum(axis=0)
+    sums = indicator.T @ np.asarray(responses, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts[:, np.newaxis]
+    present = counts > 0
+    index = pd.MultiIndex.from_product(
+        [factors, range(1, levels + 1)], names=["factor", "level"]
+    )
+    table = pd.DataFrame(
+        data=means, index=index, columns=responses.columns
+    )[present]
+    cube = means.reshape(number_factors, levels, -1)
+    delta = pd.DataFrame(
+        data=np.nanmax(cube, axis=1) - np.nanmin(cube, axis=1),
+        index=pd.Index(factors, name="factor"),
+        columns=responses.columns
+    )
+    ranks = delta.rank(ascending=False, method="min").astype("int64")
+    delta = pd.concat([delta, ranks], axis=1, keys=["delta", "rank"])
+    return (table, delta)
+
+
+def _merge_group_moments(
+    *,
+    left: pd.DataFrame,
+    right: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Combine per-group count, mean, and sum of squared deviations (Chan et al.)
+    """
+    left, right = left.align(right, join="outer", fill_value=0)
+    n = left["n"] + right["n"]
+    delta = right["mean"] - left["mean"]
+    safe_n = n.where(n > 0, 1)
+    mean = left["mean"] + delta * right["n"] / safe_n
+    m2 = (
+        left["m2"] + right["m2"]
+        + delta ** 2 * left["n"] * right["n"] / safe_n
+    )
+    return pd.DataFrame({"n": n, "mean": mean, "m2": m2})
+
+
+def _group_moments(
+    *,
+    df: pd.DataFrame,
+    value: str,
+    by: list[str]
+) -> pd.DataFrame:
+    """
+    Per-group count, mean, and sum of squared deviations of one chunk.
+
+    Missing values are dropped first, so that a group with no values in this
+    chunk is absent rather than a NaN mean that spoils the merge.
+    """
+    df = df.dropna(subset=[value])
+    moments = df.groupby(by=by, observed=True, sort=False)[value].agg(
+        ["count", "mean", "var"]
+    )
+    n = moments["count"].astype("float64")
+    return pd.DataFrame({
+        "n": n,
+        "mean": moments["mean"],
+        "m2": moments["var"].fillna(0) * (n - 1),
+    })
+
+
+def taguchi_loss_grouped(
+    *,
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    value: str,
+    by: str | list[str],
+    parameters: pd.DataFrame | dict[str, float | int],
+    ddof: int = 0,
+) -> tuple[pd.DataFrame, float]:
+    """
+    Calculate the average cost of use (ACU) and the loss for groups of raw
+    measurements.
+
+    The count, mean, and variance of each group are accumulated in one pass
+    over the data. data may be an iterable of chunks, for example the output
+    of pd.read_csv(..., chunksize=...), so that data larger than memory can
+    be scored as a stream.
+
+    Parameters
+    ----------
+    data : pd.DataFrame | Iterable[pd.DataFrame]
+        The measurements, one DataFrame or an iterable of DataFrame chunks.
+    value : str
+        The name of the measurement column.
+    by : str | list[str]
+        The name(s) of the group key column(s), e.g. ["line", "lot", "day"].
+    parameters : pd.DataFrame | dict[str, float | int]
+        The target, cost, and x of the loss function. Either a dict of
+        values for all groups, or a DataFrame with columns target, cost, and
+        x whose index levels are a subset of by, e.g. one row per line. An
+        unnamed index is matched to the first columns of by.
+    ddof : int = 0
+        The delta degrees of freedom of the variance. With ddof=0 the loss of
+        a group equals the sum of k * (y - target) ** 2 over its values.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, float]
+        A tuple of the per-group results and the total loss.
+
+        - per_group : pd.DataFrame
+            One row per group with n, average, std_dev, target, cost, x, k,
+            acu (the average cost of use), and loss (acu * n).
+        - total : float
+            The sum of the loss over all groups.
+
+    Example
+    -------
+    >>> import dawgdad as dd
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({
+    ...     "line": ["A", "A", "A", "B", "B", "B"],
+    ...     "lot": [1, 1, 2, 1, 2, 2],
+    ...     "y": [7.1, 7.9, 6.8, 7.4, 7.6, 8.1],
+    ... })
+    >>> parameters = pd.DataFrame(
+    ...     {"target": [7.5, 7.6], "cost": [0.25, 0.30], "x": [15, 14]},
+    ...     index=pd.Index(["A", "B"], name="line")
+    ... )
+    >>> per_group, total = dd.taguchi_loss_grouped(
+    ...     data=df,
+    ...     value="y",
+    ...     by=["line", "lot"],
+    ...     parameters=parameters
+    ... )
+
+    Score a large CSV file in chunks.
+
+    >>> chunks = pd.read_csv("measurements.csv", chunksize=1_000_000)
+    >>> per_group, total = dd.taguchi_loss_grouped(
+    ...     data=chunks,
+    ...     value="y",
+    ...     by=["line", "lot"],
+    ...     parameters=parameters
+    ... ) # doctest: +SKIP
+    """
+    if isinstance(by, str):
+        by = [by]
+    if isinstance(data, pd.DataFrame):
+        data = [data]
+    moments = None
+    for chunk in data:
+        chunk_moments = _group_moments(df=chunk, value=value, by=by)
+        moments = chunk_moments if moments is None else _merge_group_moments(
+            left=moments, right=chunk_moments
+        )
+    if moments is None:
+        raise ValueError("data must contain at least one DataFrame.")
+    moments = moments.sort_index()
+    per_group = pd.DataFrame(
+        data={
+            "n": moments["n"].astype("int64"),
+            "average": moments["mean"],
+            "std_dev": np.sqrt(moments["m2"] / (moments["n"] - ddof)),
+        }
+    )
+    if isinstance(parameters, dict):
+        for column in ["target", "cost", "x"]:
+            per_group[column] = parameters[column]
+    else:
+        keys = list(parameters.index.names)
+        if None in keys:
+            # an unnamed index is keyed by the first columns of by
+            if parameters.index.nlevels > len(by):
+                raise ValueError(
+                    "parameters has more index levels than by has columns."
+                )
+            keys = by[:parameters.index.nlevels]
+            parameters = parameters.rename_axis(index=keys)
+        per_group = per_group.reset_index().merge(
+            right=parameters[["target", "cost", "x"]].reset_index(),
+            on=keys,
+            how="left"
+        ).set_index(by)
+    per_group["k"] = per_group["cost"] / (
+        per_group["x"] - per_group["target"]
+    ) ** 2
+    per_group["acu"] = per_group["k"] * (
+        per_group["std_dev"] ** 2
+        + (per_group["average"] - per_group["target"]) ** 2
+    )
+    per_group["loss"] = per_group["acu"] * per_group["n"]
+    total = float(per_group["loss"].sum())
+    return (per_group, total)
+
+
 __all__ = (
     "taguchi_loss_function",
+    "taguchi_loss_grouped",
+    "orthogonal_array",
+    "signal_to_noise",
+    "response_table",
 )
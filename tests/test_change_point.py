@@ -0,0 +1,82 @@
+from pytest import approx, mark, raises, warns
+import dawgdad as dd
+import pandas as pd
+import numpy as np
+
+
+@mark.parametrize('method', ['binseg', 'pelt'])
+def test_change_points_mean(method):
+    rng = np.random.default_rng(42)
+    values = np.concatenate([
+        rng.normal(loc=10, scale=1, size=300),
+        rng.normal(loc=13, scale=1, size=200),
+        rng.normal(loc=10, scale=1, size=300),
+    ])
+    points = np.array(dd.change_points(series=values, method=method))
+    # binary segmentation may split a shift into close change points
+    distances = np.abs(points[:, np.newaxis] - np.array([300, 500]))
+    assert (distances.min(axis=0) <= 5).all()
+    assert (distances.min(axis=1) <= 5).all()
+    assert dd.change_points(
+        series=rng.normal(loc=10, scale=1, size=500), method=method
+    ) == []
+
+
+@mark.parametrize('method', ['binseg', 'pelt'])
+def test_change_points_meanvar(method):
+    rng = np.random.default_rng(42)
+    values = np.concatenate([
+        rng.normal(loc=0, scale=1, size=400),
+        rng.normal(loc=0, scale=3, size=400),
+    ])
+    assert dd.change_points(
+        series=values, model='meanvar', method=method
+    ) == approx([400], abs=10)
+
+
+def test_change_points_options():
+    rng = np.random.default_rng(42)
+    values = np.concatenate([
+        rng.normal(loc=level, scale=1, size=100) for level in [0, 4, 0, 4]
+    ])
+    assert dd.change_points(series=values) == [100, 200, 300]
+    assert len(dd.change_points(series=values, max_change_points=1)) == 1
+    with raises(ValueError):
+        dd.change_points(series=values, method='segment')
+    with raises(ValueError):
+        dd.change_points(series=values, model='variance')
+
+
+def test_change_points_pelt_warning(monkeypatch):
+    rng = np.random.default_rng(42)
+    values = rng.normal(loc=0, scale=1, size=200)
+    monkeypatch.setattr(dd.change_point, '_PELT_WARNING_SIZE', 100)
+    with warns(RuntimeWarning, match='binseg'):
+        dd.change_points(series=values, method='pelt')
+
+
+def test_change_points_many():
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        'a': np.r_[rng.normal(0, 1, 300), rng.normal(3, 1, 300)],
+        'b': rng.normal(0, 1, 600),
+    })
+    assert dd.change_points_many(df=df) == {'a': [300], 'b': []}
+    assert dd.change_points_many(df=df, max_workers=2) == {
+        'a': [300], 'b': []
+    }
+
+
+def test_stage_limits():
+    series = pd.Series(
+        [10.0, 10.4, 9.8, 10.2, 13.0, 13.6, 12.8, 13.2],
+        index=range(10, 18)
+    )
+    limits = dd.stage_limits(series=series, change_points=[4])
+    assert limits.index.tolist() == series.index.tolist()
+    assert limits['stage'].tolist() == [0] * 4 + [1] * 4
+    assert limits['mean'].tolist() == approx([10.1] * 4 + [13.15] * 4)
+    assert limits['sigma'].iloc[0] == approx((0.4 + 0.6 + 0.4) / 3 / 1.128)
+    assert limits['ucl'].iloc[-1] == approx(
+        13.15 + 3 * (0.6 + 0.8 + 0.4) / 3 / 1.128
+    )
@@ -3,6 +3,7 @@ from io import BytesIO
 
 import matplotlib.pyplot as plt
 import pandas as pd
+import numpy as np
 
 import dawgdad.control_charts as cc
 from pytest import approx, mark
@@ -452,3 +453,130 @@ def test_draw_rules():
     finally:
         plt.clf()
         plt.close('all')
+
+
+df_short_run = pd.DataFrame({
+    'Part': ['A', 'A', 'A', 'B', 'B', 'B', 'A', 'A'],
+    'X': [10.1, 9.8, 10.2, 20.6, 19.8, 20.2, 10.0, 9.9],
+})
+
+
+def test_DNOM():
+    dnom = cc.DNOM(
+        data=df_short_run,
+        target=pd.Series({'A': 10, 'B': 20})
+    )
+    assert dnom.y.tolist() == approx(
+        [0.1, -0.2, 0.2, 0.6, -0.2, 0.2, 0.0, -0.1]
+    )
+    assert dnom.mean == approx(0.075)
+    assert dnom.sigma == approx(
+        (0.3 + 0.4 + 0.4 + 0.8 + 0.4 + 0.2 + 0.1) / 7 / 1.128
+    )
+
+
+def test_Z():
+    z = cc.Z(data=df_short_run)
+    # part averages 10.0 and 20.2, part sigmas from moving ranges within part
+    sigma_a = (0.3 + 0.4 + 0.2 + 0.1) / 4 / 1.128
+    sigma_b = (0.8 + 0.4) / 2 / 1.128
+    assert z.y.iloc[0] == approx(0.1 / sigma_a)
+    assert z.y.iloc[3] == approx(0.4 / sigma_b)
+    assert (z.mean, z.sigma, z.ucl, z.lcl) == (0, 1, 3, -3)
+    z = cc.Z(
+        data=df_short_run,
+        target=pd.Series({'A': 10, 'B': 20}),
+        sigma=pd.Series({'A': 0.1, 'B': 0.2})
+    )
+    above, below = cc.points_one(z)
+    assert above.to_dict() == approx({3: 3.0})
+    assert below.empty
+
+
+def test_ZmR():
+    zmr = cc.ZmR(
+        data=df_short_run,
+        target=pd.Series({'A': 10, 'B': 20}),
+        sigma=pd.Series({'A': 0.1, 'B': 0.2})
+    )
+    assert zmr.mean == approx(1.128)
+    assert zmr.ucl == approx(1.128 + 3 * 0.8525)
+    assert zmr.lcl == 0
+    assert zmr.y.iloc[1:4].tolist() == approx([3.0, 4.0, 1.0])
+
+
+def test_HotellingT2():
+    rng = np.random.default_rng(42)
+    data = pd.DataFrame(
+        data=rng.multivariate_normal(
+            mean=[25, 1, 40],
+            cov=[[1, 0.5, 0], [0.5, 1, 0.2], [0, 0.2, 1]],
+            size=200
+        ),
+        columns=['diameter', 'roundness', 'depth']
+    )
+    baseline = data.iloc[:100]
+    centred = (baseline - baseline.mean()).to_numpy()
+    expected = np.einsum(
+        'ij,jk,ik->i', centred, np.linalg.inv(np.cov(centred.T)), centred
+    )
+    t2 = cc.HotellingT2(data=baseline, chunk_size=30)
+    assert t2.y.to_numpy() == approx(expected)
+    assert t2.mean == approx(3 * 99 / 100)
+    assert t2.lcl == 0
+    ucl_phase_one = t2.ucl
+    # new observations do not change the baseline or the earlier T²
+    t2.append(data.iloc[100:])
+    assert len(t2.y) == 200
+    assert t2.y.iloc[:100].to_numpy() == approx(expected)
+    # the baseline keeps the Phase I limit, the new observations get the
+    # Phase II limit
+    assert t2.ucl.index.equals(t2.y.index)
+    assert (t2.ucl.iloc[:100] == ucl_phase_one).all()
+    assert (t2.ucl.iloc[100:] > ucl_phase_one).all()
+    above, _ = cc.points_one(t2)
+    assert above.index.equals(t2.y.index[t2.y > t2.ucl])
+    # updating the baseline is the same as starting with all the data
+    updated = cc.HotellingT2(data=baseline).append(
+        data.iloc[100:], update_baseline=True
+    )
+    assert updated.y.to_numpy() == approx(
+        cc.HotellingT2(data=data).y.to_numpy()
+    )
+
+
+def test_average_run_length():
+    arl = cc.average_run_length(
+        rule_sets=((1,), (1, 2, 3, 4)),
+        shifts=(0, 2),
+        n_series=4_000,
+        chunk_series=1_000,
+        random_state=42
+    )
+    assert arl.index.tolist() == [
+        ('1', 0), ('1', 2), ('1+2+3+4', 0), ('1+2+3+4', 2)
+    ]
+    # theoretical ARL0 of rule one is 370.4, of rules one to four 91.75
+    assert arl.loc[('1', 0), 'arl'] == approx(370.4, rel=0.05)
+    assert arl.loc[('1+2+3+4', 0), 'arl'] == approx(91.75, rel=0.05)
+    assert arl.loc[('1', 2), 'arl'] == approx(6.3, rel=0.05)
+    assert (arl['censored'] == 0).all()
+    assert arl.equals(
+        cc.average_run_length(
+            rule_sets=((1,), (1, 2, 3, 4)),
+            shifts=(0, 2),
+            n_series=4_000,
+            chunk_series=1_000,
+            random_state=42,
+            max_workers=2
+        )
+    )
+
+
+def test_rule_signals():
+    z = np.array([[0.5, 2.5, 0.1, 2.1, -1, 3.5, -3.2, 0.2]])
+    assert np.flatnonzero(cc._rule_signals(z, 1)).tolist() == [5, 6]
+    assert np.flatnonzero(cc._rule_signals(z, 2)).tolist() == [3, 5]
+    z = np.array([[1.5, 1.2, 0.3, 1.1, 1.4, 1.2, 0.5, 0.4, 0.1, -0.1]])
+    assert np.flatnonzero(cc._rule_signals(z, 3)).tolist() == [4, 5]
+    assert np.flatnonzero(cc._rule_signals(z, 4)).tolist() == [7, 8]
@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+import asyncio
+import json
+
+from pytest import approx, raises
+import dawgdad as dd
+import pandas as pd
+
+
+def test_individuals_monitor():
+    chart = dd.IndividualsMonitor(baseline_size=5)
+    for value in [10.0, 10.2, 9.8, 10.1, 9.9]:
+        assert chart.update(value=value) == []
+    assert chart.mean == approx(10.0)
+    assert chart.sigma == approx((0.2 + 0.4 + 0.3 + 0.2) / 4 / 1.128)
+    assert chart.update(value=9.0) == [
+        {'rule': '1', 'side': 'below', 'value': 9.0, 'count': 6}
+    ]
+    chart = dd.IndividualsMonitor(mean=0, sigma=1, rules=(4,))
+    events = [chart.update(value=0.5) for _ in range(9)]
+    assert [len(event) for event in events] == [0] * 7 + [1, 1]
+    with raises(ValueError):
+        dd.IndividualsMonitor(sigma=1)
+
+
+def test_individuals_monitor_runs():
+    """
+    Rules 2 and 3 signal once per run, at the points of the batch rules.
+    """
+    cases = [
+        (2, dd.points_two, [0, 0, 0, 2.5, 2.5, 0.1, -0.3]),
+        (3, dd.points_three, [0, 0, 0, 1.5, 1.5, 1.5, 1.5, 0.2, 0.3]),
+    ]
+    for rule, points, values in cases:
+        chart = dd.IndividualsMonitor(mean=0, sigma=1, rules=(rule,))
+        counts = [
+            event["count"]
+            for value in values
+            for event in chart.update(value=value)
+        ]
+        cc = SimpleNamespace(
+            y=pd.Series(values, index=range(1, len(values) + 1)),
+            sigmas={+1: 1, +2: 2, -1: -1, -2: -2}
+        )
+        above, below = points(cc)
+        assert counts == sorted(above.index.tolist() + below.index.tolist())
+        assert len(counts) == 1
+
+
+def test_monitor(tmp_path):
+    path = tmp_path / 'line_1.csv'
+    sink = dd.JSONLSink(path=tmp_path / 'events.jsonl')
+    monitor = dd.Monitor(
+        directory=tmp_path,
+        sink=sink,
+        columns=['diameter'],
+        baseline_size=5
+    )
+    path.write_text(
+        'id,diameter\n1,10.0\n2,10.2\n3,9.8\n4,10.1\n5,9'
+    )
+    assert asyncio.run(monitor.poll()) == 0
+    assert monitor.charts['diameter'].count == 4
+    # the unfinished line is completed by the next write
+    with path.open(mode='a') as file:
+        file.write('.9\n6,15.0\n7,')
+    assert asyncio.run(monitor.poll()) == 1
+    with path.open(mode='a') as file:
+        file.write('10.0\n')
+    assert asyncio.run(monitor.poll()) == 0
+    assert monitor.charts['diameter'].count == 7
+    events = [
+        json.loads(line)
+        for line in (tmp_path / 'events.jsonl').read_text().splitlines()
+    ]
+    assert len(events) == 1
+    assert events[0]['characteristic'] == 'diameter'
+    assert events[0]['value'] == 15.0
+    assert events[0]['rule'] == '1'
+    assert events[0]['side'] == 'above'
+
+
+def test_monitor_sink_failure(tmp_path, caplog):
+    path = tmp_path / 'line_1.csv'
+    received = []
+    failures = [ConnectionRefusedError('refused')] * 2
+
+    def callback(event):
+        if failures:
+            raise failures.pop()
+        received.append(event)
+
+    monitor = dd.Monitor(
+        directory=tmp_path,
+        sink=callback,
+        columns=['diameter'],
+        baseline_size=5
+    )
+    path.write_text(
+        'id,diameter\n1,10.0\n2,10.2\n3,9.8\n4,10.1\n5,9.9\n6,15.0\n'
+    )
+    # the event is kept until the sink accepts it
+    with raises(ConnectionRefusedError):
+        asyncio.run(monitor.poll())
+    assert received == []
+    with path.open(mode='a') as file:
+        file.write('7,16.0\n')
+
+    async def run_until_delivered():
+        stop = asyncio.Event()
+        task = asyncio.create_task(monitor.run(stop=stop))
+        while len(received) < 3:
+            await asyncio.sleep(0.01)
+        stop.set()
+        await task
+
+    monitor.poll_interval = 0.01
+    asyncio.run(asyncio.wait_for(run_until_delivered(), timeout=10))
+    # each event is delivered once, 16.0 breaks rules 1 and 2
+    assert [(event['value'], event['rule']) for event in received] == [
+        (15.0, '1'), (16.0, '1'), (16.0, '2')
+    ]
+    assert monitor.charts['diameter'].count == 7
+    assert 'Monitor poll failed' in caplog.text
@@ -0,0 +1,46 @@
+from pytest import approx
+
+import dawgdad as dd
+
+
+def test_simulate_capability():
+    result = dd.simulate_capability(
+        average=10,
+        std_devn=1,
+        sample_size=30,
+        lower_spec=6,
+        upper_spec=14,
+        n_sims=20_000,
+        random_state=42
+    )
+    assert result.shape == (20_000, 7)
+    assert result["average"].mean() == approx(10, abs=0.01)
+    assert result["sigma_mr"].mean() == approx(1, abs=0.01)
+    # chunking does not change the simulated values
+    chunked = dd.simulate_capability(
+        average=10,
+        std_devn=1,
+        sample_size=30,
+        lower_spec=6,
+        upper_spec=14,
+        n_sims=20_000,
+        random_state=42,
+        max_elements=1_000
+    )
+    assert result.equals(other=chunked)
+
+
+def test_capability_sample_size_table():
+    result = dd.capability_sample_size_table(
+        average=10,
+        std_devn=1,
+        sample_sizes=[10, 100],
+        lower_spec=6,
+        upper_spec=14,
+        n_sims=5_000,
+        random_state=42
+    )
+    assert result.index.tolist() == [10, 100]
+    assert result["true_cpk"].iloc[0] == approx(4 / 3)
+    spread = result[("cpk", 0.95)] - result[("cpk", 0.05)]
+    assert spread[10] > spread[100]
@@ -1,4 +1,21 @@
+from pytest import approx
+
 import dawgdad.msa as msa
+import pandas as pd
+import numpy as np
+
+DF_GAUGE = pd.DataFrame({
+    "Operator": [1] * 5 + [2] * 5 + [3] * 5,
+    "Part": [1, 2, 3, 4, 5] * 3,
+    "Y1": [
+        10.2, 12.1, 9.4, 11.0, 10.7, 10.5, 12.4, 9.9, 11.2, 10.9, 10.1, 12.0,
+        9.5, 11.1, 10.4
+    ],
+    "Y2": [
+        10.3, 12.3, 9.6, 10.8, 10.6, 10.4, 12.6, 9.7, 11.5, 11.0, 10.0, 12.2,
+        9.3, 10.9, 10.6
+    ],
+})
 
 
 def test_range_chart():
@@ -42,8 +59,57 @@ def test_effective_resolution():
 
 
 def test_variance_components():
-    pass
-    # raise NotImplementedError()
+    result = msa.MSA(df=DF_GAUGE).variance_components()
+    expected = msa.MSAAccumulator().update(DF_GAUGE).variance_components()
+    pd.testing.assert_frame_equal(result, expected)
+    assert result.loc["Total Variation", "% contribution"] == approx(100)
+    assert result.loc["Total Gauge R&R", "variance"] == approx(
+        result.loc["Repeatability", "variance"]
+        + result.loc["Reproducibility", "variance"]
+    )
+
+
+def test_msa_accumulator():
+    accumulator = msa.MSAAccumulator().update(DF_GAUGE)
+    assert accumulator.n == 30
+    table = accumulator.anova_table()
+    assert table["DF"].tolist() == [4, 2, 8, 15, 29]
+    assert table["SS"].tolist()[:4] == approx(
+        [24.368667, 0.880667, 0.059333, 0.25], rel=1e-4
+    )
+    assert table.loc["Total", "SS"] == approx(table["SS"].iloc[:4].sum())
+    # updating in chunks and merging give the same result as one update
+    chunked = msa.MSAAccumulator()
+    for _, chunk in DF_GAUGE.groupby("Operator"):
+        chunked.update(chunk)
+    merged = msa.MSAAccumulator().update(DF_GAUGE.iloc[:7]).merge(
+        msa.MSAAccumulator().update(DF_GAUGE.iloc[7:])
+    )
+    for other in (chunked, merged):
+        pd.testing.assert_frame_equal(
+            other.anova_table(), table, check_exact=False
+        )
+    # only the named trial columns are measurements
+    labelled = DF_GAUGE.assign(Station=7)
+    explicit = msa.MSAAccumulator(trial_cols=["Y1", "Y2"]).update(labelled)
+    pd.testing.assert_frame_equal(explicit.anova_table(), table)
+    assert msa.MSAAccumulator().update(labelled).n == 45
+
+
+def test_msa_accumulator_large_offset():
+    """
+    A small spread about a large mean gives the scaled ANOVA table.
+    """
+    scale = 1e-5
+    expected = msa.MSAAccumulator().update(DF_GAUGE).anova_table()
+    offset = DF_GAUGE.copy()
+    offset[["Y1", "Y2"]] = 5000 + scale * offset[["Y1", "Y2"]]
+    result = msa.MSAAccumulator().update(offset).anova_table()
+    assert result["DF"].tolist() == expected["DF"].tolist()
+    assert result["SS"].tolist() == approx(
+        (scale ** 2 * expected["SS"]).tolist(), rel=1e-6
+    )
+    assert (result["SS"] > 0).all()
 
 
 def test_grr_gauge_rr_results():
@@ -99,3 +165,123 @@ def test_mean_ranges_in_control():
 def test_mean_ranges_out_of_control_reason():
     pass
     # raise NotImplementedError()
+
+
+df_attribute = pd.DataFrame(
+    data={
+        "Part": [1, 1, 2, 2, 3, 3, 1, 1, 2, 2, 3, 3],
+        "Operator": ["A"] * 6 + ["B"] * 6,
+        "Rating": [
+            "pass", "pass", "fail", "fail", "pass", "pass",
+            "pass", "fail", "fail", "fail", "pass", "pass",
+        ],
+        "Standard": [
+            "pass", "pass", "fail", "fail", "fail", "fail",
+            "pass", "pass", "fail", "fail", "fail", "fail",
+        ],
+    }
+)
+
+
+def test_fleiss_kappa():
+    counts = np.array([[3, 0], [0, 3], [2, 1], [3, 0], [1, 2]])
+    assert msa.fleiss_kappa(counts=counts) == approx(4 / 9)
+
+
+def test_cohen_kappa():
+    result = msa.cohen_kappa(
+        rater1=["pass", "fail", "pass", "pass", "fail"],
+        rater2=["pass", "fail", "fail", "pass", "pass"]
+    )
+    assert result == approx(1 / 6)
+    result = msa.cohen_kappa(
+        rater1=["pass", "fail", "pass", "pass", "fail", np.nan, "pass"],
+        rater2=["pass", "fail", "fail", "pass", "pass", "fail", None]
+    )
+    assert result == approx(1 / 6)
+
+
+def test_attribute_agreement():
+    (
+        within, versus_standard, between, all_versus_standard
+    ) = msa.attribute_agreement(df=df_attribute, standard="Standard")
+    assert within["matched"].tolist() == [3, 2]
+    assert within["kappa"].tolist() == approx([1, 1 / 3])
+    assert versus_standard["matched"].tolist() == [2, 1]
+    assert versus_standard["kappa"].tolist() == approx([0.4, 0])
+    assert between["matched"].tolist() == [2]
+    assert all_versus_standard["matched"].tolist() == [1]
+    assert all_versus_standard["ci_lower"].iloc[0] == approx(
+        100 * (1 - 0.975 ** (1 / 3))
+    )
+    within, versus_standard, between, all_versus_standard = (
+        msa.attribute_agreement(df=df_attribute)
+    )
+    assert versus_standard is None
+    assert all_versus_standard is None
+    # a missing rating is dropped, not counted in another cell
+    missing = df_attribute.iloc[:1].assign(Rating=np.nan)
+    result = msa.attribute_agreement(
+        df=pd.concat([df_attribute, missing], ignore_index=True),
+        standard="Standard"
+    )
+    expected = msa.attribute_agreement(df=df_attribute, standard="Standard")
+    for table, expected_table in zip(result, expected):
+        assert table.equals(expected_table)
+
+
+def test_gauge_study():
+    df = pd.DataFrame({
+        "Gauge": ["G1"] * 6 + ["G2"] * 3,
+        "Reference": [2, 2, 4, 4, 6, 6, 5, 5, 5],
+        "Measurement": [
+            2.01, 2.03, 4.02, 4.04, 6.05, 6.07, 5.01, 4.99, 5.03
+        ],
+    })
+    result = msa.gauge_study(df=df, tolerance=1)
+    assert result.index.tolist() == ["G1", "G2"]
+    assert result["n"].tolist() == [6, 3]
+    assert result["n_references"].tolist() == [3, 1]
+    # pooled within reference standard deviation
+    std_devn = np.sqrt(0.0002)
+    assert result.loc["G1", "std_devn"] == approx(std_devn)
+    assert result.loc["G1", "bias"] == approx(0.22 / 6)
+    assert result.loc["G1", "slope"] == approx(0.01)
+    assert result.loc["G1", "cg"] == approx(0.2 / (6 * std_devn))
+    assert result.loc["G1", "cgk"] == approx(
+        (0.1 - 0.22 / 6) / (3 * std_devn)
+    )
+    # a single reference part is a type-1 study, without linearity
+    assert result.loc["G2", "bias"] == approx(0.01)
+    assert result.loc["G2", "std_devn"] == approx(0.02)
+    assert np.isnan(result.loc["G2", "slope"])
+
+
+def test_gauge_study_large_reference():
+    # a large reference value and a tiny spread
+    rng = np.random.default_rng(42)
+    measurements = 5000 + rng.normal(0, 1e-4, 50)
+    df = pd.DataFrame({
+        "Gauge": "G1",
+        "Reference": 5000.0,
+        "Measurement": measurements,
+    })
+    result = msa.gauge_study(df=df, tolerance=0.01)
+    std_devn = np.std(measurements, ddof=1)
+    assert result.loc["G1", "std_devn"] == approx(std_devn, rel=1e-6)
+    assert result.loc["G1", "cg"] == approx(
+        0.2 * 0.01 / (6 * std_devn), rel=1e-6
+    )
+    df = pd.DataFrame({
+        "Gauge": "G1",
+        "Reference": np.repeat([1000.0, 1001.0], 25),
+        "Measurement": np.repeat([1000.0, 1001.0], 25)
+        + rng.normal(0, 1e-5, 50),
+    })
+    result = msa.gauge_study(df=df, tolerance=0.01)
+    within = df.groupby("Reference")["Measurement"].transform(
+        lambda values: values - values.mean()
+    )
+    assert result.loc["G1", "std_devn"] == approx(
+        np.sqrt((within ** 2).sum() / 48), rel=1e-6
+    )
@@ -514,6 +514,51 @@ def test_create_dataframe():
     pass
 
 
+def test_create_dataframe_chunks():
+    chunks = list(dd.create_dataframe_chunks(
+        size=2_500, chunk_size=1_000, random_state=42
+    ))
+    assert [len(chunk) for chunk in chunks] == [1_000, 1_000, 500]
+    result = pd.concat(chunks)
+    assert result.index.equals(pd.RangeIndex(2_500))
+    assert list(result.columns) == list(dd.create_dataframe().columns)
+    assert (result["t"].diff().dropna() == pd.Timedelta(seconds=1)).all()
+    assert result["s"].isna().any() and result["yn"].isna().any()
+    # the chunks do not depend on the number of workers
+    assert result.equals(
+        pd.concat(dd.create_dataframe_chunks(
+            size=2_500, chunk_size=1_000, random_state=42, max_workers=2
+        ))
+    )
+
+
+def test_save_dataframe_chunks(tmp_path):
+    expected = pd.concat(dd.create_dataframe_chunks(
+        size=2_500, chunk_size=1_000, random_state=42
+    )).reset_index(drop=True)
+    for suffix in (".parquet", ".feather", ".csv"):
+        file_name = tmp_path / f"synthetic{suffix}"
+        rows = dd.save_dataframe_chunks(
+            chunks=dd.create_dataframe_chunks(
+                size=2_500, chunk_size=1_000, random_state=42
+            ),
+            file_name=file_name
+        )
+        assert rows == 2_500
+        match suffix:
+            case ".parquet":
+                result = pd.read_parquet(file_name)
+                # parquet has no timestamps in seconds
+                result["t"] = result["t"].astype("datetime64[s]")
+                assert result.equals(expected)
+            case ".feather":
+                result = pd.read_feather(file_name)
+                assert result.equals(expected)
+            case ".csv":
+                result = pd.read_csv(file_name)
+                assert result.shape == expected.shape
+
+
 def test_create_directory():
     pass
 
@@ -0,0 +1,84 @@
+from statsmodels.stats.power import TTestIndPower, TTestPower
+from pytest import approx, mark, raises
+import numpy as np
+
+import dawgdad as dd
+
+
+@mark.parametrize(
+    "alternative, statsmodels_alternative",
+    [("two-sided", "two-sided"), ("less", "smaller"), ("greater", "larger")]
+)
+def test_t_test_power(alternative, statsmodels_alternative):
+    effect_sizes = np.array([-0.8, -0.2, 0.0, 0.3, 0.5, 1.2])
+    sample_sizes = np.array([[5], [20], [60]])
+    power = dd.t_test_power(
+        effect_size=effect_sizes, n=sample_sizes, alternative=alternative
+    )
+    assert power.shape == (3, 6)
+    for i, n in enumerate(sample_sizes[:, 0]):
+        for j, effect_size in enumerate(effect_sizes):
+            assert power[i, j] == approx(TTestPower().power(
+                effect_size=effect_size,
+                nobs=n,
+                alpha=0.05,
+                alternative=statsmodels_alternative
+            ))
+            assert dd.t_test_power(
+                effect_size=effect_size,
+                n=n,
+                alpha=0.1,
+                alternative=alternative,
+                ratio=1.5
+            ) == approx(TTestIndPower().power(
+                effect_size=effect_size,
+                nobs1=n,
+                alpha=0.1,
+                ratio=1.5,
+                alternative=statsmodels_alternative
+            ))
+    # memoized results are the same
+    assert np.array_equal(
+        power,
+        dd.t_test_power(
+            effect_size=effect_sizes, n=sample_sizes, alternative=alternative
+        )
+    )
+    # large noncentrality does not give NaN
+    assert dd.t_test_power(
+        effect_size=2, n=10_000, alternative=alternative
+    ) == approx(0 if alternative == "less" else 1)
+    with raises(ValueError):
+        dd.t_test_power(effect_size=0.5, n=10, alternative="smaller")
+
+
+def test_t_test_sample_size():
+    assert dd.t_test_sample_size(effect_size=0.5) == 34
+    n = dd.t_test_sample_size(
+        effect_size=np.array([0.2, 0.5, 0.8]), power=0.9, ratio=1
+    )
+    expected = [
+        TTestIndPower().solve_power(
+            effect_size=effect_size, power=0.9, alpha=0.05, ratio=1
+        )
+        for effect_size in (0.2, 0.5, 0.8)
+    ]
+    assert n.tolist() == np.ceil(expected).tolist()
+    assert dd.t_test_sample_size(
+        effect_size=-0.5, alternative="less"
+    ) == dd.t_test_sample_size(effect_size=0.5, alternative="greater")
+    assert np.isnan(dd.t_test_sample_size(effect_size=0.01, n_max=1_000))
+
+
+def test_power_curve_table():
+    table = dd.power_curve_table(
+        effect_sizes=[0.2, 0.5, 0.8], sample_sizes=[10, 20, 50]
+    )
+    assert table.shape == (3, 3)
+    assert table.index.tolist() == [10, 20, 50]
+    assert table.loc[20, 0.5] == approx(
+        TTestPower().power(effect_size=0.5, nobs=20, alpha=0.05)
+    )
+    # power increases with sample size and effect size
+    assert (table.diff().iloc[1:] > 0).all().all()
+    assert (table.diff(axis=1).iloc[:, 1:] > 0).all().all()
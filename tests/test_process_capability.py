@@ -1,4 +1,8 @@
+from pytest import approx, raises
+from scipy import stats
 import dawgdad as dd
+import pandas as pd
+import numpy as np
 
 
 def test_pp():
@@ -166,3 +170,133 @@ def test_cpm():
     )
     expected = (0.7995217351828376, 0.7058035394758811)
     assert result == expected
+
+
+def test_nonnormal_capability():
+    df = pd.DataFrame(
+        data={
+            "x1": stats.lognorm.rvs(s=0.5, size=500, random_state=42),
+            "x2": stats.lognorm.rvs(s=0.3, size=500, random_state=13),
+        }
+    )
+    cache = dd.TransformCache()
+    result = dd.nonnormal_capability(
+        df=df,
+        lower_spec=0.1,
+        upper_spec=6,
+        method="boxcox",
+        cache=cache
+    )
+    assert len(cache) == 2
+    assert not result["cached"].any()
+    assert (result["ppk"] <= result["pp"]).all()
+    # appended data reuse the fitted transform
+    df_appended = pd.concat([df, df.iloc[:10]], ignore_index=True)
+    result_appended = dd.nonnormal_capability(
+        df=df_appended,
+        lower_spec=0.1,
+        upper_spec=6,
+        method="boxcox",
+        cache=cache
+    )
+    assert result_appended["cached"].all()
+    # changed data are refitted
+    df_changed = df.copy()
+    df_changed.loc[0, "x1"] = 5.0
+    result_changed = dd.nonnormal_capability(
+        df=df_changed,
+        lower_spec=0.1,
+        upper_spec=6,
+        method="boxcox",
+        cache=cache
+    )
+    assert result_changed["cached"].tolist() == [False, True]
+    # NumPy scalar limits apply to every column
+    result_numpy = dd.nonnormal_capability(
+        df=df,
+        lower_spec=np.float64(0.1),
+        upper_spec=np.int64(6),
+        method="boxcox",
+        cache=cache
+    )
+    assert result_numpy["pp"].tolist() == approx(result["pp"].tolist())
+
+
+def test_nonnormal_capability_percentile():
+    average = 10
+    std_devn = 1
+    df = pd.DataFrame(
+        data={
+            "x": stats.norm.rvs(
+                loc=average, scale=std_devn, size=100_000, random_state=42
+            )
+        }
+    )
+    result = dd.nonnormal_capability(
+        df=df,
+        lower_spec=7,
+        upper_spec=14,
+        method="percentile"
+    )
+    assert result.loc["x", "pp"] == approx(7 / 6, rel=0.02)
+    assert result.loc["x", "ppk"] == approx(1, rel=0.02)
+
+
+def test_rolling_capability():
+    series = pd.Series(
+        data=stats.norm.rvs(loc=10, scale=1, size=500, random_state=42),
+        index=pd.date_range(start="2025-01-01", periods=500, freq="min")
+    )
+    window = 100
+    result = dd.rolling_capability(
+        series=series,
+        lower_spec=6,
+        upper_spec=14,
+        window=window
+    )
+    last = series.iloc[-window:]
+    sigma_within = last.diff().abs().mean() / 1.128
+    expected_cpk = dd.cpk(
+        average=last.mean(),
+        std_devn=sigma_within,
+        subgroup_size=2,
+        number_subgroups=window - 1,
+        lower_spec=6,
+        upper_spec=14
+    )[0]
+    expected_ppk = dd.ppk(
+        average=last.mean(),
+        std_devn=last.std(),
+        sample_size=window,
+        lower_spec=6,
+        upper_spec=14
+    )[0]
+    assert result["cpk"].iloc[-1] == approx(expected_cpk)
+    assert result["ppk"].iloc[-1] == approx(expected_ppk)
+    result_numpy = dd.rolling_capability(
+        series=series,
+        lower_spec=6,
+        upper_spec=14,
+        window=np.int64(window)
+    )
+    assert result_numpy["cpk"].iloc[-1] == approx(expected_cpk)
+    with raises(ValueError):
+        dd.rolling_capability(
+            series=series, lower_spec=6, upper_spec=14, window=1
+        )
+    # time span window of 100 minutes equals the count window
+    result_time = dd.rolling_capability(
+        series=series,
+        lower_spec=6,
+        upper_spec=14,
+        window="100min"
+    )
+    assert result_time["ppk"].iloc[-1] == approx(expected_ppk)
+    # expanding window over the whole series
+    result_expanding = dd.rolling_capability(
+        series=series,
+        lower_spec=6,
+        upper_spec=14
+    )
+    assert result_expanding["n"].iloc[-1] == 500
+    assert result_expanding["sigma_overall"].iloc[-1] == approx(series.std())
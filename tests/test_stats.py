@@ -1,4 +1,9 @@
-from pytest import approx, mark
+from statsmodels.stats.multitest import multipletests
+from pytest import approx, mark, raises
+import statsmodels.stats.diagnostic as smd
+import statsmodels.api as sm
+import scipy.stats as stats
+import pyarrow as pa
 import warnings
 
 import dawgdad as dd
@@ -182,6 +187,27 @@ def test_nonparametric_summary():
     assert result.equals(other=expected)
 
 
+@mark.parametrize("alphap, betap", [(1/3, 1/3), (0, 0), (1, 1), (0, 1)])
+def test_nonparametric_summaries(alphap, betap):
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        data=rng.standard_t(df=3, size=(101, 5)),
+        columns=["a", "b", "c", "d", "e"]
+    )
+    df.loc[::7, "b"] = np.nan
+    df["c"] = X
+    result = dd.nonparametric_summaries(
+        df=df, alphap=alphap, betap=betap, columns_per_block=2, max_workers=2
+    )
+    assert result.index.tolist() == df.columns.tolist()
+    for column in df.columns:
+        expected = dd.nonparametric_summary(
+            series=df[column], alphap=alphap, betap=betap
+        )
+        for key, value in expected.items():
+            assert result.loc[column, key] == value, (column, key)
+
+
 def test_parametric_summary():
     result = dd.parametric_summary(series=X, decimals=3)
     expected = pd.Series(
@@ -198,6 +224,55 @@ def test_parametric_summary():
     assert result.equals(other=expected)
 
 
+def test_parametric_summary_grouped():
+    df = pd.DataFrame({
+        "machine": ["M1"] * 13 + ["M2"] * 3,
+        "y": [*X, 11.0, 12.0, np.nan],
+    })
+    result = dd.parametric_summary_grouped(df=df, value="y", by="machine")
+    expected = dd.parametric_summary(series=X, decimals=3)
+    assert result.loc["M1", "n"] == expected["n"]
+    assert result.loc["M1", "ave"] == expected["ave"]
+    assert result.loc["M1", "s"] == expected["s"]
+    assert (
+        result.loc["M1", "ci lower"], result.loc["M1", "ci upper"]
+    ) == expected["confidence interval"]
+    assert result.loc["M2"].tolist()[:4] == [2, 11.0, 12.0, 11.5]
+    assert result.loc["M2", "ci upper"] == approx(
+        11.5 + 12.706205 * 0.5, abs=1e-3
+    )
+
+
+def test_nonparametric_summary_grouped():
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        "machine": rng.choice(["M1", "M2"], size=500),
+        "shift": rng.integers(low=1, high=4, size=500),
+        "y": rng.standard_t(df=3, size=500),
+    })
+    result = dd.nonparametric_summary_grouped(
+        df=df, value="y", by=["machine", "shift"]
+    )
+    assert len(result) == 6
+    for key, group in df.groupby(["machine", "shift"]):
+        expected = dd.nonparametric_summary(series=group["y"])
+        for column in [
+            "lower outer fence", "lower quartile", "median",
+            "upper quartile", "upper inner fence", "minimum value",
+            "maximum value", "count"
+        ]:
+            assert result.loc[key, column] == expected[column]
+        assert (
+            result.loc[key, "ci lower"], result.loc[key, "ci upper"]
+        ) == expected["confidence interval"]
+        assert result.loc[key, "inner outliers"] == len(
+            expected["inner outliers"]
+        )
+        assert result.loc[key, "outer outliers"] == len(
+            expected["outer outliers"]
+        )
+
+
 @mark.parametrize(
     "df, expected",
     [
@@ -243,6 +318,73 @@ def test_cubic_spline(df, expected):
     assert result == expected
 
 
+def test_cubic_spline_smoothing():
+    rng = np.random.default_rng(42)
+    x = rng.uniform(low=0, high=10, size=200_000)
+    df = pd.DataFrame({
+        "abscissa": x,
+        "ordinate": np.sin(x) + rng.normal(scale=0.5, size=x.size)
+    })
+    df.loc[::100, "ordinate"] = np.nan
+    grid = np.linspace(start=0.5, stop=9.5, num=19)
+    spline = dd.cubic_spline(
+        df=df,
+        abscissa="abscissa",
+        ordinate="ordinate",
+        smoothing="gcv",
+        bins=500,
+        verbose=False
+    )
+    assert np.abs(spline(grid) - np.sin(grid)).max() < 0.02
+    # without printing, the interpolating spline is unchanged
+    small = df.iloc[:50]
+    spline = dd.cubic_spline(
+        df=small, abscissa="abscissa", ordinate="ordinate", verbose=False
+    )
+    expected = dd.cubic_spline(
+        df=small, abscissa="abscissa", ordinate="ordinate"
+    )
+    assert np.allclose(spline(grid), expected(grid))
+
+
+def test_cubic_spline_grouped():
+    rng = np.random.default_rng(42)
+    x = rng.uniform(low=0, high=10, size=60_000)
+    df = pd.DataFrame({
+        "line": rng.choice(["a", "b"], size=x.size),
+        "abscissa": x,
+        "ordinate": np.sin(x) + rng.normal(scale=0.3, size=x.size)
+    })
+    df.loc[df["line"] == "b", "ordinate"] += 1
+    few = pd.DataFrame({"line": "c", "abscissa": [2.0, 3.0], "ordinate": 0.0})
+    df = pd.concat([df, few], ignore_index=True)
+    grid = np.linspace(start=1, stop=9, num=9)
+    result = dd.cubic_spline_grouped(
+        df=df,
+        abscissa="abscissa",
+        ordinate="ordinate",
+        by="line",
+        grid=grid,
+        bins=200
+    )
+    assert result.columns.tolist() == ["a", "b", "c"]
+    assert np.abs(result["a"] - np.sin(grid)).max() < 0.05
+    assert np.abs(result["b"] - np.sin(grid) - 1).max() < 0.05
+    # too few values for a smoothing spline
+    assert result["c"].isna().all()
+    assert result.equals(
+        dd.cubic_spline_grouped(
+            df=df,
+            abscissa="abscissa",
+            ordinate="ordinate",
+            by="line",
+            grid=grid,
+            bins=200,
+            max_workers=2
+        )
+    )
+
+
 @mark.parametrize(
     "df, n_knots, random_seed, expected_predictions",
     [
@@ -285,13 +427,83 @@ def test_natural_cubic_spline(df, n_knots, random_seed, expected_predictions):
         y=df["y"],
         number_knots=n_knots
     )
-    X = dd.random_data(size=len(expected_predictions), random_state=random_seed).values
+    # the expected predictions are for the scipy.stats normal draws
+    X = stats.norm.rvs(
+        size=len(expected_predictions), random_state=random_seed
+    )
     predictions = pipeline_fit.predict(X=X)
     result = pd.Series(data=predictions)
     expected = pd.Series(data=expected_predictions)
     assert np.allclose(result, expected, atol=1e-5)
 
 
+def test_natural_spline():
+    # the same basis and fit as test_natural_cubic_spline
+    spline = dd.natural_spline(
+        X=df_linear_regression["X"],
+        y=df_linear_regression["y"],
+        number_knots=10
+    )
+    X = stats.norm.rvs(size=13, random_state=41)
+    expected = np.array([
+        -8.449636, -7.369397, -6.950373, -10.332163, -6.039679, -10.662885,
+        -8.113000, -5.399096, -11.197986, -10.397764, -9.309493, -10.481590,
+        -9.887573,
+    ])
+    assert np.allclose(spline.predict(X=X), expected, atol=1e-5)
+    rng = np.random.default_rng(42)
+    X = rng.uniform(0, 10, 100_000)
+    y = np.sin(X) + rng.normal(0, 0.1, 100_000)
+    y[::1000] = np.nan
+    knots = [0.0, 1.5, 3.0, 4.5, 6.0, 7.5, 9.0, 10.0]
+    spline = dd.natural_spline(X=X, y=y, list_knots=knots)
+    finite = np.isfinite(y)
+    basis = dd.stats._natural_spline_basis(X[finite], spline.knots)
+    expected = np.linalg.lstsq(basis, y[finite], rcond=None)[0]
+    assert np.allclose(spline.coefficients, expected)
+    grid = np.linspace(1, 9, 101)
+    assert np.allclose(spline.predict(X=grid), np.sin(grid), atol=0.05)
+    assert np.allclose(
+        spline.predict(X=grid, block_size=7), spline.predict(X=grid)
+    )
+    with raises(ValueError):
+        dd.natural_spline(X=X, y=y, list_knots=[5.0])
+    with raises(ValueError):
+        dd.natural_spline(X=X, y=y, list_knots=[1.0, 5.0, 5.0, 9.0])
+    with raises(ValueError):
+        dd.natural_spline(X=np.full(10, 3.0), y=np.arange(10.0))
+
+
+def test_natural_spline_cv():
+    rng = np.random.default_rng(42)
+    X = rng.uniform(0, 10, 20_000)
+    y = np.sin(X) + rng.normal(0, 0.2, 20_000)
+    spline, table = dd.natural_spline_cv(
+        X=X, y=y, knot_counts=[2, 3, 4, 8], folds=4, random_state=1
+    )
+    assert list(table.index) == [2, 3, 4, 8]
+    assert list(table.columns) == ["mse", "standard error"]
+    assert table["mse"].idxmin() == 8
+    assert spline.knots.size == 8
+    # the errors from the R factors equal those of refitting each fold
+    order = np.random.default_rng(1).permutation(X.size)
+    folds = np.array_split(order, 4)
+    errors = []
+    for fold in folds:
+        train = np.setdiff1d(order, fold)
+        fit = dd.natural_spline(
+            X=X[train], y=y[train], list_knots=spline.knots
+        )
+        residuals = y[fold] - fit.predict(X=X[fold])
+        errors.append(np.mean(residuals * residuals))
+    assert np.isclose(table.loc[8, "mse"], np.mean(errors))
+    full = dd.natural_spline(X=X, y=y, number_knots=8)
+    assert np.allclose(spline.coefficients, full.coefficients)
+    assert 0.04 < table.loc[8, "mse"] < 0.05
+    with raises(ValueError):
+        dd.natural_spline_cv(X=X, y=y, folds=1)
+
+
 @mark.parametrize(
     "size, random_state, expected_data",
     [
@@ -299,30 +511,30 @@ def test_natural_cubic_spline(df, n_knots, random_seed, expected_predictions):
             13,
             41,
             [
-                -0.2707123230673205,
-                0.10484805260974006,
-                0.25052781572357197,
-                -0.9251999652780767,
-                0.567143660285906,
-                -1.040180216082938,
-                -0.15367595145793744,
-                0.7898518103468191,
-                -1.2262158464418542,
-                -0.9480069877134585,
-                -0.5696539419300647,
-                -0.9771502146977724,
-                -0.7706317111835508,
+                -1.2316649689147774,
+                0.2671189477208684,
+                -0.006926123563646536,
+                0.5015352951547885,
+                -1.3267282928093849,
+                1.107768166657506,
+                0.0937548811679036,
+                -1.1708180763562224,
+                -1.3582403949601034,
+                -1.3065640246645707,
+                -0.7176152818724516,
+                1.1856213579293313,
+                0.8945337459684365,
             ],
         ),
         (
             5,
             100,
             [
-                -1.7497654730546974,
-                0.34268040332750216,
-                1.153035802563644,
-                -0.25243603652138985,
-                0.9813207869512316
+                -1.1575496471201177,
+                0.2897558023277514,
+                0.7808540692250985,
+                0.5439736447085796,
+                -0.9613826412454365
             ]
         ),
         # Add more test cases here by varying size and random_state
@@ -343,6 +555,62 @@ def test_random_data(size, random_state, expected_data):
     assert result.equals(other=expected)
 
 
+@mark.parametrize(
+    "distribution, dtype",
+    [
+        ("norm", "float64"),
+        ("uniform", "float64"),
+        ("randint", "int64"),
+        ("randInt", "Int64"),
+        ("bool", "bool"),
+        ("boolean", "boolean"),
+        ("category", "category"),
+        ("categories", "category"),
+    ]
+)
+def test_random_data_distributions(distribution, dtype):
+    result = dd.random_data(
+        distribution=distribution, size=10_000, random_state=42, name="x"
+    )
+    assert result.dtype == dtype
+    assert result.name == "x"
+    assert result.equals(
+        dd.random_data(
+            distribution=distribution, size=10_000, random_state=42, name="x"
+        )
+    )
+    if distribution in ("randInt", "boolean"):
+        assert result.isna().mean() == approx(0.13, abs=0.02)
+    else:
+        assert result.notna().all()
+    if distribution == "categories":
+        assert result.cat.ordered
+        assert result.cat.categories.tolist() == ["small", "medium", "large"]
+    strings = dd.random_data(
+        distribution="strings", strings=["a", "b", "c"], random_state=42
+    )
+    assert set(strings) <= {"a", "b", "c"}
+
+
+def test_random_data_chunks():
+    chunks = list(dd.random_data_chunks(
+        size=1_050, chunk_size=100, random_state=42, distribution="category"
+    ))
+    assert [len(chunk) for chunk in chunks] == [100] * 10 + [50]
+    result = pd.concat(chunks)
+    assert result.index.equals(pd.RangeIndex(1_050))
+    # the chunks do not depend on the number of workers
+    assert result.equals(
+        pd.concat(dd.random_data_chunks(
+            size=1_050,
+            chunk_size=100,
+            random_state=42,
+            distribution="category",
+            max_workers=3
+        ))
+    )
+
+
 # def test_datetime_data():
 #     result = dd.datetime_data(
 #         start_year="2020",
@@ -735,6 +1003,146 @@ def test_paired_t():
     assert result == expected
 
 
+@mark.parametrize("alternative_hypothesis", ["two-sided", "less", "greater"])
+def test_t_many(alternative_hypothesis):
+    rng = np.random.default_rng(42)
+    df1 = pd.DataFrame(rng.normal(loc=0.2, size=(30, 4)), columns=list("abcd"))
+    df2 = pd.DataFrame(rng.normal(scale=2, size=(30, 4)), columns=list("abcd"))
+    df1.loc[::4, "b"] = np.nan
+    one = dd.one_sample_t_many(
+        df=df1,
+        hypothesized_value=0.1,
+        alternative_hypothesis=alternative_hypothesis,
+        check_assumptions=True
+    )
+    two = dd.two_sample_t_many(
+        df1=df1, df2=df2, alternative_hypothesis=alternative_hypothesis
+    )
+    paired = dd.paired_t_many(
+        df1=df1, df2=df2, alternative_hypothesis=alternative_hypothesis
+    )
+    for column in df1.columns:
+        x, y = df1[column], df2[column]
+        expected = stats.ttest_1samp(
+            x.dropna(), 0.1, alternative=alternative_hypothesis
+        )
+        interval = expected.confidence_interval(confidence_level=0.95)
+        assert one.loc[column, "t"] == approx(expected.statistic)
+        assert one.loc[column, "p value"] == approx(expected.pvalue)
+        assert one.loc[column, "ci lower"] == approx(interval.low)
+        assert one.loc[column, "ci upper"] == approx(interval.high)
+        assert one.loc[column, "normality p value"] == approx(
+            stats.shapiro(x.dropna()).pvalue
+        )
+        expected = stats.ttest_ind(
+            x.dropna(), y, equal_var=False,
+            alternative=alternative_hypothesis
+        )
+        assert two.loc[column, "p value"] == approx(expected.pvalue)
+        assert two.loc[column, "dof"] == approx(expected.df)
+        pairs = pd.concat([x, y], axis=1).dropna()
+        expected = stats.ttest_rel(
+            pairs.iloc[:, 0], pairs.iloc[:, 1],
+            alternative=alternative_hypothesis
+        )
+        assert paired.loc[column, "p value"] == approx(expected.pvalue)
+    assert one["p adjusted"].tolist() == approx(
+        multipletests(one["p value"], method="fdr_bh")[1]
+    )
+    assert "p adjusted" not in dd.one_sample_t_many(
+        df=df1, p_adjust=None
+    ).columns
+
+
+def test_datetime_sequence():
+    result = dd.datetime_sequence(
+        periods=1_000, start="2020-01-01 06:00", freq="7min", name="t"
+    )
+    expected = pd.date_range(
+        start="2020-01-01 06:00", periods=1_000, freq="7min"
+    )
+    assert result.tolist() == expected.tolist()
+    assert result.name == "t"
+    result = dd.datetime_sequence(
+        periods=10_000,
+        freq="1s",
+        jitter="100ms",
+        fraction_gaps=0.2,
+        unit="ms",
+        random_state=42
+    )
+    assert result.dtype == "datetime64[ms]"
+    offsets = (result - pd.Timestamp("2020-01-01")).dt.total_seconds()
+    # gaps skip whole periods and jitter stays within its bounds
+    assert (np.abs(offsets - offsets.round()) <= 0.1 + 1e-9).all()
+    assert offsets.round().diff().min() >= 1
+    assert offsets.round().diff().mean() == approx(1.25, rel=0.05)
+    arrow = dd.datetime_sequence(periods=3, freq="1D", output="arrow")
+    assert arrow.type == pa.timestamp("ns")
+    assert arrow.to_pylist()[2] == pd.Timestamp("2020-01-03")
+
+
+def test_timedelta_sequence():
+    result = dd.timedelta_sequence(periods=5, freq="250ms")
+    assert result.tolist() == pd.timedelta_range(
+        start="0s", periods=5, freq="250ms"
+    ).tolist()
+    arrow = dd.timedelta_sequence(
+        periods=4, start="1h", freq="15min", unit="s", output="arrow"
+    )
+    assert arrow.type == pa.duration("s")
+    assert arrow.cast(pa.int64()).to_pylist() == [3600, 4500, 5400, 6300]
+    # a freq that is not a whole number of units is not truncated
+    with raises(ValueError):
+        dd.timedelta_sequence(periods=4, freq="1500ms", unit="s")
+    with raises(ValueError):
+        dd.datetime_sequence(periods=4, freq="1s", jitter="1us", unit="ms")
+    with raises(ValueError):
+        dd.datetime_sequence(
+            periods=4, start="2020-01-01 00:00:00.5", freq="1s", unit="s"
+        )
+    start = dd.datetime_sequence(
+        periods=2, start="2020-01-01 00:00:01", freq="1s", unit="s"
+    )
+    assert start.iloc[0] == pd.Timestamp("2020-01-01 00:00:01")
+
+
+def test_normality_tests():
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        "normal": rng.normal(size=200),
+        "exponential": rng.exponential(size=200),
+        "short": [1.0, 2.0] + [np.nan] * 198,
+    })
+    df.loc[::5, "normal"] = np.nan
+    result = dd.normality_tests(df=df)
+    for column in ("normal", "exponential"):
+        x = df[column].dropna()
+        assert result.loc[column, "n"] == len(x)
+        assert result.loc[column, "shapiro p value"] == approx(
+            stats.shapiro(x).pvalue
+        )
+        statistic, p_value = smd.normal_ad(x.to_numpy())
+        assert result.loc[column, "anderson statistic"] == approx(statistic)
+        assert result.loc[column, "anderson p value"] == approx(p_value)
+        assert result.loc[column, "kolmogorov-smirnov p value"] == approx(
+            smd.kstest_normal(x, pvalmethod="approx")[1]
+        )
+    assert result["normal"].tolist() == [True, False, False]
+    assert np.isnan(result.loc["short", "shapiro p value"])
+    # the Shapiro-Wilk test uses a repeatable subsample of large columns
+    large = pd.DataFrame(rng.normal(size=(6000, 2)), columns=["a", "b"])
+    result = dd.normality_tests(
+        df=large, tests=("shapiro",), random_state=1
+    )
+    assert result["shapiro n"].tolist() == [5000, 5000]
+    assert result.equals(
+        dd.normality_tests(
+            df=large, tests=("shapiro",), random_state=1, max_workers=2
+        )
+    )
+
+
 def test_linear_regression():
     (
         fitted_model,
@@ -764,3 +1172,116 @@ def test_linear_regression():
         ]
     ).round(decimals=6)
     assert predictions.equals(other=expected_predictions)
+    frame = fitted_model.get_prediction(
+        exog=sm.add_constant(df_linear_regression["X"])
+    ).summary_frame(alpha=0.05)
+    assert np.allclose(confidence_interval_lower, frame["mean_ci_lower"])
+    assert np.allclose(confidence_interval_upper, frame["mean_ci_upper"])
+    assert np.allclose(prediction_interval_lower, frame["obs_ci_lower"])
+    assert np.allclose(prediction_interval_upper, frame["obs_ci_upper"])
+    # a missing X is dropped from the fit and gives missing intervals
+    X_missing = df_linear_regression["X"].copy()
+    X_missing.iloc[3] = np.nan
+    (
+        fitted_model, _, confidence_interval_lower, _, _,
+        prediction_interval_upper
+    ) = dd.linear_regression(X=X_missing, y=df_linear_regression["y"])
+    assert fitted_model.nobs == len(X_missing) - 1
+    assert np.isnan(confidence_interval_lower.iloc[3])
+    frame = fitted_model.get_prediction(
+        exog=sm.add_constant(X_missing.dropna())
+    ).summary_frame(alpha=0.05)
+    assert np.allclose(
+        confidence_interval_lower.drop(index=3), frame["mean_ci_lower"]
+    )
+    assert np.allclose(
+        prediction_interval_upper.drop(index=3), frame["obs_ci_upper"]
+    )
+
+
+def test_streaming_ols():
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        "a": rng.uniform(0, 10, 50_000),
+        "b": rng.normal(100, 5, 50_000),
+    })
+    df["y"] = 3 + 2 * df["a"] - 0.5 * df["b"] + rng.normal(0, 1, 50_000)
+    df.loc[[5, 17], "a"] = np.nan
+    df.loc[23, "y"] = np.nan
+    expected = sm.OLS(
+        endog=df["y"], exog=sm.add_constant(df[["a", "b"]]), missing="drop"
+    ).fit()
+    chunks = [
+        df.iloc[start:start + 7_000] for start in range(0, 50_000, 7_000)
+    ]
+    for max_workers in (None, 3):
+        model = dd.linear_regression_chunks(
+            chunks=iter(chunks), X=["a", "b"], y="y", max_workers=max_workers
+        )
+        assert model.nobs == expected.nobs
+        assert model.names == ["const", "a", "b"]
+        assert np.allclose(model.params, expected.params)
+        assert np.allclose(model.bse, expected.bse)
+        assert model.rsquared == approx(expected.rsquared)
+        assert model.rsquared_adj == approx(expected.rsquared_adj)
+        assert model.scale == approx(expected.scale)
+    summary = model.summary()
+    assert np.allclose(summary[["lower", "upper"]], expected.conf_int())
+    assert np.allclose(summary["p"], expected.pvalues)
+    # accumulators of parts merge into the accumulator of the whole
+    first = dd.StreamingOLS().update(X=df[["a", "b"]][:100], y=df["y"][:100])
+    second = dd.StreamingOLS().update(X=df[["a", "b"]][100:], y=df["y"][100:])
+    merged = first.merge(second)
+    assert np.allclose(merged.params, expected.params)
+    assert merged.nobs == expected.nobs
+    exog = sm.add_constant(df[["a", "b"]].iloc[:200])
+    result = merged.predict(X=df[["a", "b"]].iloc[:200])
+    frame = expected.get_prediction(exog=exog).summary_frame(alpha=0.05)
+    assert result.index.equals(frame.index)
+    assert np.allclose(result, frame[result.columns], equal_nan=True)
+    assert result.loc[5].isna().all()
+    # without an intercept, R squared is not centred
+    model = dd.StreamingOLS(add_constant=False).update(
+        X=df["b"].to_numpy(), y=df["y"].to_numpy()
+    )
+    expected = sm.OLS(
+        endog=df["y"], exog=df["b"], missing="drop"
+    ).fit()
+    assert model.names == ["x1"]
+    assert np.allclose(model.params, expected.params)
+    assert model.rsquared == approx(expected.rsquared)
+    with raises(ValueError):
+        model.update(X=df[["a", "b"]].to_numpy(), y=df["y"].to_numpy())
+    empty = dd.StreamingOLS()
+    for attribute in ("params", "df_resid", "ssr", "scale", "rsquared"):
+        with raises(ValueError):
+            getattr(empty, attribute)
+    # the columns of a chunk are matched by name
+    shuffled = dd.StreamingOLS().update(
+        X=df[["a", "b"]][:100], y=df["y"][:100]
+    ).update(X=df[["b", "a"]][100:], y=df["y"][100:])
+    assert np.allclose(shuffled.params, merged.params)
+    with raises(ValueError):
+        shuffled.update(X=df[["a"]].rename(columns={"a": "c"}), y=df["y"])
+    # predict on an empty accumulator leaves the columns unset
+    with raises(ValueError):
+        empty.predict(X=df[["a", "b"]])
+    assert empty.names is None
+    # exactly as many rows as coefficients fit, with no residual variance
+    exact = dd.StreamingOLS().update(X=df[["a", "b"]][:3], y=df["y"][:3])
+    assert exact.df_resid == 0
+    assert exact.params.notna().all()
+    for attribute in ("scale", "bse", "rsquared_adj"):
+        with raises(ValueError):
+            getattr(exact, attribute)
+    with raises(ValueError):
+        exact.summary()
+    # merged accumulators must agree on the intercept and the columns
+    with raises(ValueError):
+        dd.StreamingOLS(add_constant=False).merge(first)
+    named = dd.StreamingOLS().update(
+        X=pd.DataFrame({"c": [np.nan]}), y=[1.0]
+    )
+    assert named.names == ["const", "c"]
+    with raises(ValueError):
+        named.merge(first)
@@ -1,4 +1,10 @@
+from itertools import combinations
+from math import log10
+
+from pytest import approx, mark, raises
 import dawgdad as dd
+import numpy as np
+import pandas as pd
 
 
 def test_taguchi_loss_function():
@@ -35,3 +41,151 @@ def test_taguchi_loss_function():
     )
     expected = 0.014400000000000001
     assert result == expected
+
+
+def test_taguchi_loss_grouped():
+    """
+    Calculate the ACU and loss per group, in one DataFrame and in chunks.
+    """
+    df = pd.DataFrame(
+        data={
+            "line": ["A", "A", "A", "A", "B", "B", "B", "B"],
+            "y": [4.0, 5.5, 3.9, 5.24, 7.1, 7.9, 8.3, 6.7],
+        }
+    )
+    parameters = pd.DataFrame(
+        data={"target": [7.5, 7.5], "cost": [0.25, 0.25], "x": [15, 15]},
+        index=pd.Index(["A", "B"], name="line")
+    )
+    per_group, total = dd.taguchi_loss_grouped(
+        data=df,
+        value="y",
+        by="line",
+        parameters=parameters
+    )
+    for line in ["A", "B"]:
+        y = df.loc[df["line"] == line, "y"]
+        expected = dd.taguchi_loss_function(
+            average=y.mean(),
+            std_dev=y.std(ddof=0),
+            target=7.5,
+            cost=0.25,
+            x=15,
+        )
+        assert per_group.loc[line, "acu"] == approx(expected)
+    expected_total = (0.25 / (15 - 7.5) ** 2 * (df["y"] - 7.5) ** 2).sum()
+    assert total == approx(expected_total)
+    chunks = [df.iloc[:3], df.iloc[3:5], df.iloc[5:]]
+    per_group_chunks, total_chunks = dd.taguchi_loss_grouped(
+        data=iter(chunks),
+        value="y",
+        by="line",
+        parameters={"target": 7.5, "cost": 0.25, "x": 15}
+    )
+    assert per_group_chunks["acu"].tolist() == approx(
+        per_group["acu"].tolist()
+    )
+    assert total_chunks == approx(total)
+    chunks_missing = [
+        df.iloc[:4],
+        pd.DataFrame(data={"line": ["A", "B"], "y": [np.nan, 7.1]}),
+        df.iloc[5:],
+    ]
+    per_group_missing, total_missing = dd.taguchi_loss_grouped(
+        data=iter(chunks_missing),
+        value="y",
+        by="line",
+        parameters={"target": 7.5, "cost": 0.25, "x": 15}
+    )
+    assert per_group_missing["n"].tolist() == [4, 4]
+    assert per_group_missing["acu"].tolist() == approx(
+        per_group["acu"].tolist()
+    )
+    assert total_missing == approx(total)
+    per_group_unnamed, _ = dd.taguchi_loss_grouped(
+        data=df,
+        value="y",
+        by="line",
+        parameters=parameters.rename_axis(index=None)
+    )
+    assert per_group_unnamed["acu"].tolist() == approx(
+        per_group["acu"].tolist()
+    )
+    with raises(ValueError):
+        dd.taguchi_loss_grouped(
+            data=iter([]),
+            value="y",
+            by="line",
+            parameters=parameters
+        )
+
+
+@mark.parametrize(
+    "name, shape",
+    [
+        ("L4", (4, 3)),
+        ("L8", (8, 7)),
+        ("L9", (9, 4)),
+        ("L12", (12, 11)),
+        ("L16", (16, 15)),
+        ("L18", (18, 8)),
+        ("L27", (27, 13)),
+    ],
+)
+def test_orthogonal_array(name, shape):
+    """
+    Every pair of columns contains every pair of levels equally often.
+    """
+    design = dd.orthogonal_array(name=name)
+    assert design.shape == shape
+    for first, second in combinations(design.columns, 2):
+        counts = pd.crosstab(design[first], design[second]).to_numpy()
+        assert counts.min() == counts.max()
+
+
+def test_orthogonal_array_l8():
+    result = dd.orthogonal_array(name="L8").to_numpy().tolist()
+    expected = [
+        [1, 1, 1, 1, 1, 1, 1],
+        [1, 1, 1, 2, 2, 2, 2],
+        [1, 2, 2, 1, 1, 2, 2],
+        [1, 2, 2, 2, 2, 1, 1],
+        [2, 1, 2, 1, 2, 1, 2],
+        [2, 1, 2, 2, 1, 2, 1],
+        [2, 2, 1, 1, 2, 2, 1],
+        [2, 2, 1, 2, 1, 1, 2],
+    ]
+    assert result == expected
+
+
+def test_signal_to_noise():
+    y = pd.DataFrame(data={"r1": [10.0, 2.0], "r2": [12.0, 4.0]})
+    result = dd.signal_to_noise(y=y, goal="nominal")
+    expected = [10 * log10(11 ** 2 / 2), 10 * log10(3 ** 2 / 2)]
+    assert result.tolist() == approx(expected)
+    result = dd.signal_to_noise(y=y, goal="smaller")
+    expected = [-10 * log10((100 + 144) / 2), -10 * log10((4 + 16) / 2)]
+    assert result.tolist() == approx(expected)
+    result = dd.signal_to_noise(y=y, goal="larger")
+    expected = [
+        -10 * log10((1 / 100 + 1 / 144) / 2),
+        -10 * log10((1 / 4 + 1 / 16) / 2)
+    ]
+    assert result.tolist() == approx(expected)
+
+
+def test_response_table():
+    design = dd.orthogonal_array(name="L8").iloc[:, [0, 1, 3]]
+    design.columns = ["A", "B", "C"]
+    responses = pd.DataFrame(
+        data={
+            "y1": [10, 12, 11, 15, 13, 14, 12, 16],
+            "y2": [1.1, 1.3, 1.2, 1.0, 1.4, 1.2, 1.1, 1.5],
+        }
+    )
+    table, delta = dd.response_table(design=design, responses=responses)
+    for factor in ["A", "B", "C"]:
+        expected = responses.groupby(design[factor].to_numpy()).mean()
+        assert table.loc[factor].to_numpy() == approx(expected.to_numpy())
+    assert delta[("delta", "y1")].tolist() == approx([1.75, 1.25, 2.75])
+    assert delta[("rank", "y1")].tolist() == [2, 3, 1]